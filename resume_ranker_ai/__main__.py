@@ -0,0 +1,197 @@
+"""
+Command-line entry point for bulk resume screening and the scoring service.
+
+    python -m resume_ranker_ai rank --job job.txt --resumes DIR --workers 4 --output results.jsonl
+    python -m resume_ranker_ai serve --port 8000
+
+rank discovers resumes, parses them in a process pool, analyzes them in
+batches and scores them against the job as a streaming pipeline; each result
+is written to JSONL or CSV as soon as it is ready, so memory stays flat
+however many files the directory holds. Progress and throughput go to stderr.
+With --shortlist N, every resume is first scored by spaCy-free keyword
+overlap and only the N best go through full analysis.
+
+serve runs the HTTP scoring service (see utils/service.py).
+"""
+
+import argparse
+import asyncio
+import csv
+import heapq
+import json
+import os
+import sys
+import time
+
+from .utils.nlp_analyzer import NLPAnalyzer
+from .utils.recommender import ResumeRecommender
+from .utils.pipeline import discover_files, parse_file, parse_files, prescreen, score_resumes
+
+CSV_FIELDS = ["file", "score", "missing_keywords", "missing_skills", "error"]
+
+
+class Progress:
+    """Files parsed, scored and failed, with throughput, redrawn on stderr."""
+
+    def __init__(self, stream=sys.stderr, interval=1.0):
+        self.stream = stream
+        self.interval = interval
+        self.scored = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self._last_report = 0.0
+
+    def update(self, result):
+        if "error" in result:
+            self.failed += 1
+        else:
+            self.scored += 1
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+
+    def report(self, final=False):
+        elapsed = time.perf_counter() - self.started
+        done = self.scored + self.failed
+        rate = done / elapsed if elapsed > 0 else 0.0
+        line = (f"{done} files ({self.scored} scored, {self.failed} failed) "
+                f"in {elapsed:.1f}s, {rate:.1f} files/s")
+        if self.stream.isatty():
+            # Redraw one status line in a terminal
+            line = "\r" + line
+        if final or not self.stream.isatty():
+            line += "\n"
+        self.stream.write(line)
+        self.stream.flush()
+
+
+class ResultWriter:
+    """Write result dicts as JSON lines or CSV rows, flushing each one."""
+
+    def __init__(self, stream, output_format):
+        self.stream = stream
+        self.output_format = output_format
+        if output_format == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, result):
+        if self.output_format == "csv":
+            row = dict(result)
+            for field in ("missing_keywords", "missing_skills"):
+                if field in row:
+                    row[field] = "; ".join(row[field])
+            self._csv.writerow(row)
+        else:
+            self.stream.write(json.dumps(result) + "\n")
+        self.stream.flush()
+
+
+def rank(args):
+    """Screen a directory of resumes against one job description."""
+    job_text = parse_file(args.job)
+    if not job_text:
+        print(f"Could not read job description: {args.job}", file=sys.stderr)
+        return 1
+
+    output_format = args.format
+    if output_format is None:
+        output_format = "csv" if args.output and args.output.lower().endswith(".csv") else "jsonl"
+    if args.output:
+        stream = open(args.output, "w", newline="", encoding="utf-8")
+    else:
+        # Results own stdout; anything else printed (here or in workers) goes to stderr
+        stream = os.fdopen(os.dup(sys.stdout.fileno()), "w", newline="", encoding="utf-8")
+        sys.stdout.flush()
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    nlp_analyzer = NLPAnalyzer()
+    recommender = ResumeRecommender(nlp_analyzer)
+
+    writer = ResultWriter(stream, output_format)
+    progress = Progress()
+    base = args.resumes if os.path.isdir(args.resumes) else None
+    best = []
+    try:
+        parsed = parse_files(discover_files(args.resumes), workers=args.workers)
+        if args.shortlist:
+            parsed = prescreen(parsed, job_text, args.shortlist)
+            shortlisted = sum(1 for _, text in parsed if text and text.strip())
+            print(f"Pre-screened resumes; analyzing the best {shortlisted}", file=sys.stderr)
+        for index, result in enumerate(score_resumes(nlp_analyzer, recommender, job_text, parsed,
+                                                     batch_size=args.batch_size)):
+            if base:
+                result["file"] = os.path.relpath(result["file"], base)
+            writer.write(result)
+            progress.update(result)
+            if args.top and "score" in result:
+                # Bounded heap of the best scores seen so far
+                entry = (result["score"], -index, result["file"])
+                if len(best) < args.top:
+                    heapq.heappush(best, entry)
+                else:
+                    heapq.heappushpop(best, entry)
+    finally:
+        stream.close()
+        progress.report(final=True)
+
+    if best:
+        print(f"Top {len(best)} matches:", file=sys.stderr)
+        for score, _, path in sorted(best, reverse=True):
+            print(f"{score:4d}%  {path}", file=sys.stderr)
+    return 0
+
+
+def serve(args):
+    """Serve match scores over HTTP, batching concurrent requests."""
+    from .utils.service import serve as run_service
+
+    nlp_analyzer = NLPAnalyzer()
+    recommender = ResumeRecommender(nlp_analyzer)
+    try:
+        asyncio.run(run_service(nlp_analyzer, recommender, args.host, args.port,
+                                max_batch_size=args.max_batch_size,
+                                max_wait=args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m resume_ranker_ai",
+                                     description="Resume ranking from the command line.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    rank_parser = subcommands.add_parser("rank", help=rank.__doc__, description=rank.__doc__)
+    rank_parser.add_argument("--job", required=True, help="job description (.txt, .pdf or .docx)")
+    rank_parser.add_argument("--resumes", required=True, help="directory of .pdf, .docx and .txt resumes")
+    rank_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                             help="processes parsing documents (default: CPU count)")
+    rank_parser.add_argument("--batch-size", type=int, default=64,
+                             help="resumes analyzed per spaCy batch (default: 64)")
+    rank_parser.add_argument("--output", help="file to write results to (default: stdout)")
+    rank_parser.add_argument("--format", choices=["jsonl", "csv"],
+                             help="output format (default: from the output extension, else jsonl)")
+    rank_parser.add_argument("--shortlist", type=int, default=0,
+                             help="pre-screen with lite keyword matching and fully analyze "
+                                  "only the N best (default: 0, analyze all)")
+    rank_parser.add_argument("--top", type=int, default=10,
+                             help="print the K best matches when done (default: 10, 0 for none)")
+    rank_parser.set_defaults(handler=rank)
+
+    serve_parser = subcommands.add_parser("serve", help=serve.__doc__, description=serve.__doc__)
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    serve_parser.add_argument("--max-batch-size", type=int, default=32,
+                              help="most requests analyzed in one batch (default: 32)")
+    serve_parser.add_argument("--max-wait-ms", type=float, default=5.0,
+                              help="how long a batch waits for more requests (default: 5)")
+    serve_parser.set_defaults(handler=serve)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
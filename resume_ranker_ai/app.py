@@ -1,9 +1,15 @@
 import streamlit as st
 import os
-import tempfile
+import hashlib
 from utils.document_parser import DocumentParser
 from utils.nlp_analyzer import NLPAnalyzer
 from utils.recommender import ResumeRecommender
+from utils.matcher import MatchIndex
+from utils.worker_pool import AnalysisPool
+from utils.sample_jobs import SAMPLE_JOBS
+from utils.job_library import load_job_library
+from utils.pipeline import parse_executor, parse_uploads, score_resumes
+from utils import metrics
 
 # Set page configuration
 st.set_page_config(
@@ -17,9 +23,19 @@ st.set_page_config(
 def load_nlp_components():
     with st.spinner("Loading AI models... This may take a moment on first run."):
         nlp_analyzer = NLPAnalyzer()
+        # Sample jobs come precompiled; the artifact is rebuilt if stale
+        load_job_library(nlp_analyzer, SAMPLE_JOBS)
         recommender = ResumeRecommender(nlp_analyzer)
         return nlp_analyzer, recommender
 
+# Cache extracted resume text across reruns; set RESUME_RANKER_TEXT_CACHE to a
+# SQLite path to share it between server processes
+@st.cache_resource
+def load_text_cache():
+    return DocumentParser.enable_cache(db_path=os.environ.get("RESUME_RANKER_TEXT_CACHE"))
+
+DocumentParser.cache = load_text_cache()
+
 # Load components with error handling
 try:
     nlp_analyzer, recommender = load_nlp_components()
@@ -30,56 +46,111 @@ except Exception as e:
     st.info("Please check that all dependencies are properly installed.")
     st.stop()
 
-# Sample job descriptions
-SAMPLE_JOBS = {
-    "Software Engineer": """We are seeking a skilled Software Engineer to join our development team. The ideal candidate will have experience with Python, JavaScript, React, Node.js, and SQL databases. You should be familiar with agile development methodologies, version control systems like Git, and cloud platforms such as AWS or Azure. Experience with Docker, Kubernetes, and CI/CD pipelines is a plus. Strong problem-solving skills and ability to work in a collaborative environment are essential.""",
-
-    "Data Scientist": """Looking for a Data Scientist with expertise in machine learning, statistical analysis, and data visualization. Required skills include Python, R, SQL, pandas, scikit-learn, TensorFlow, and Tableau. Experience with big data technologies like Spark, Hadoop, and cloud platforms (AWS, GCP, Azure) is preferred. Strong background in statistics, mathematics, and experience with A/B testing and predictive modeling.""",
-
-    "Product Manager": """Seeking an experienced Product Manager to drive product strategy and roadmap. Ideal candidate has experience with product lifecycle management, user research, market analysis, and cross-functional team leadership. Familiarity with agile methodologies, JIRA, analytics tools, and customer feedback systems. Strong communication skills and ability to translate business requirements into technical specifications.""",
-
-    "Digital Marketing Manager": """We need a Digital Marketing Manager with expertise in SEO, SEM, social media marketing, content marketing, and email campaigns. Experience with Google Analytics, Google Ads, Facebook Ads, HubSpot, and marketing automation tools. Strong analytical skills and experience with A/B testing, conversion optimization, and ROI analysis.""",
-
-    "UX/UI Designer": """Looking for a creative UX/UI Designer with experience in user-centered design, wireframing, prototyping, and visual design. Proficiency in Figma, Sketch, Adobe Creative Suite, and design systems. Experience with user research, usability testing, and responsive design. Strong portfolio demonstrating mobile and web design projects.""",
-
-    "DevOps Engineer": """Seeking a DevOps Engineer with experience in infrastructure automation, containerization, and cloud technologies. Required skills include Docker, Kubernetes, Jenkins, Terraform, AWS/Azure/GCP, Linux, and scripting languages (Python, Bash). Experience with monitoring tools, CI/CD pipelines, and infrastructure as code.""",
-
-    "Business Analyst": """We are hiring a Business Analyst to bridge the gap between business needs and technical solutions. Experience with requirements gathering, process mapping, data analysis, and stakeholder management. Proficiency in SQL, Excel, Tableau, and project management tools. Strong analytical and communication skills required.""",
-
-    "Cybersecurity Analyst": """Looking for a Cybersecurity Analyst to protect our organization's digital assets. Experience with security frameworks, threat analysis, incident response, and vulnerability assessment. Knowledge of firewalls, SIEM tools, penetration testing, and compliance standards (ISO 27001, NIST). Security certifications preferred.""",
-
-    "Sales Representative": """Seeking a motivated Sales Representative to drive revenue growth. Experience with CRM systems, lead generation, cold calling, and relationship building. Strong negotiation skills and track record of meeting sales targets. Knowledge of sales methodologies and customer acquisition strategies.""",
-
-    "Human Resources Manager": """We need an HR Manager to oversee recruitment, employee relations, and HR policies. Experience with HRIS systems, talent acquisition, performance management, and employment law. Strong interpersonal skills and experience with diversity and inclusion initiatives.""",
-
-    "Financial Analyst": """Looking for a Financial Analyst with expertise in financial modeling, budgeting, and forecasting. Proficiency in Excel, SQL, and financial software. Experience with variance analysis, financial reporting, and investment analysis. CFA or similar certification preferred.""",
-
-    "Project Manager": """Seeking an experienced Project Manager with PMP certification. Experience with project planning, resource management, risk assessment, and stakeholder communication. Proficiency in project management tools like Microsoft Project, JIRA, and Asana. Strong leadership and organizational skills.""",
-
-    "Content Writer": """We are hiring a Content Writer to create engaging content across multiple channels. Experience with SEO writing, blog posts, social media content, and email marketing. Strong research skills and ability to adapt writing style for different audiences. Knowledge of content management systems and analytics tools.""",
-
-    "Mobile App Developer": """Looking for a Mobile App Developer with experience in iOS and Android development. Proficiency in Swift, Kotlin, React Native, or Flutter. Experience with mobile UI/UX principles, API integration, and app store deployment. Knowledge of mobile testing frameworks and performance optimization.""",
-
-    "Cloud Architect": """Seeking a Cloud Architect to design and implement cloud infrastructure solutions. Expertise in AWS, Azure, or GCP services. Experience with microservices architecture, serverless computing, and cloud security. Strong background in system design and scalability planning.""",
-
-    "Quality Assurance Engineer": """We need a QA Engineer with experience in manual and automated testing. Proficiency in testing frameworks, bug tracking tools, and test case design. Experience with Selenium, API testing, and performance testing. Strong attention to detail and analytical skills.""",
-
-    "Graphic Designer": """Looking for a creative Graphic Designer with expertise in brand design, print design, and digital graphics. Proficiency in Adobe Creative Suite, typography, and color theory. Strong portfolio showcasing diverse design projects and brand identity work.""",
-
-    "Operations Manager": """Seeking an Operations Manager to optimize business processes and improve efficiency. Experience with process improvement, supply chain management, and team leadership. Strong analytical skills and experience with operational metrics and KPIs.""",
-
-    "Customer Success Manager": """We are hiring a Customer Success Manager to ensure customer satisfaction and retention. Experience with customer onboarding, account management, and relationship building. Strong communication skills and experience with CRM systems and customer analytics.""",
-
-    "Machine Learning Engineer": """Looking for an ML Engineer with experience in deploying machine learning models to production. Proficiency in Python, TensorFlow, PyTorch, and MLOps tools. Experience with model optimization, A/B testing, and cloud ML platforms. Strong software engineering background.""",
-
-    "Network Administrator": """Seeking a Network Administrator to manage and maintain network infrastructure. Experience with routers, switches, firewalls, and network protocols. Knowledge of network security, troubleshooting, and performance monitoring. Relevant certifications preferred.""",
+# Optionally run analyses in worker processes, so concurrent sessions use
+# several cores. Streamlit runs this script in a thread, so the workers are
+# started with forkserver and each loads its own model; an analysis no worker
+# answers within a minute runs in this process instead.
+# Enable with RESUME_RANKER_WORKERS=<number of processes>.
+@st.cache_resource
+def load_analysis_pool(_nlp_analyzer, processes):
+    return AnalysisPool(_nlp_analyzer, processes=processes)
 
-    "Social Media Manager": """We need a Social Media Manager to develop and execute social media strategies. Experience with content creation, community management, and social media analytics. Proficiency in social media platforms and scheduling tools. Strong creative and analytical skills.""",
+analysis_workers = int(os.environ.get("RESUME_RANKER_WORKERS", "0"))
+analysis_pool = load_analysis_pool(nlp_analyzer, analysis_workers) if analysis_workers > 0 else None
 
-    "Database Administrator": """Looking for a DBA with experience in database design, optimization, and maintenance. Proficiency in SQL, database management systems (MySQL, PostgreSQL, Oracle), and backup/recovery procedures. Experience with performance tuning and security management.""",
+# Index the sample jobs once so any resume can be matched against all of them
+@st.cache_resource
+def load_sample_job_index(_nlp_analyzer):
+    return MatchIndex(_nlp_analyzer).fit(SAMPLE_JOBS)
+
+# Memoize analysis results so re-submitting a resume/job pair analyzed
+# earlier (by any session) is instant. Entries are keyed on a hash of both
+# texts and the model, so a model or analysis change never reuses them.
+RESULT_CACHE_ENTRIES = int(os.environ.get("RESUME_RANKER_RESULT_CACHE_ENTRIES", "256"))
+RESULT_CACHE_TTL = int(os.environ.get("RESUME_RANKER_RESULT_CACHE_TTL", "3600"))
+
+def analysis_key(*texts):
+    digest = hashlib.sha256(nlp_analyzer.model_id().encode("utf-8"))
+    for text in texts:
+        digest.update(b"\0" + (text or "").encode("utf-8"))
+    return digest.hexdigest()
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, ttl=RESULT_CACHE_TTL, show_spinner=False)
+def analyze_match(key, _resume_text, _job_description):
+    """Match score, recommendations and missing keywords; cached on key only."""
+    if analysis_pool:
+        # Score, recommendations and missing keywords in one worker task
+        result = analysis_pool.analyze_match(_resume_text, _job_description)
+        return {
+            "match_score": result["match_score"],
+            "recommendations": result["recommendations"],
+            "missing_keywords": result["missing_keywords"],
+        }
+
+    # Run the NLP pipeline once per text and share the results. The resume is
+    # analyzed whole, as in the worker pool; the job description is cached by
+    # paragraph, so editing it only re-analyzes the paragraphs that changed
+    resume_doc = nlp_analyzer.analyze(_resume_text)
+    job_doc = nlp_analyzer.analyze(_job_description, incremental=True)
+    return {
+        "match_score": nlp_analyzer.calculate_match_score(resume_doc, job_doc),
+        "recommendations": recommender.generate_recommendations(resume_doc, job_doc),
+        "missing_keywords": nlp_analyzer.find_missing_keywords(resume_doc, job_doc),
+    }
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, ttl=RESULT_CACHE_TTL, show_spinner=False)
+def suggest_jobs(key, _resume_text):
+    """The sample jobs a resume fits best; cached on key only."""
+    return load_sample_job_index(nlp_analyzer).top_jobs(_resume_text, k=3)
+
+# Several uploaded resumes are parsed in one process pool shared by all
+# sessions, so parsing runs on every core and keeps its per-page PDF timeout
+# (which needs a main thread). Each session keeps at most RESUME_RANKER_UPLOAD_CONCURRENCY files
+# in flight, so one large upload cannot starve the others.
+UPLOAD_CONCURRENCY = int(os.environ.get("RESUME_RANKER_UPLOAD_CONCURRENCY", "4"))
 
-    "Technical Writer": """Seeking a Technical Writer to create clear and comprehensive documentation. Experience with API documentation, user manuals, and technical guides. Strong writing skills and ability to translate complex technical concepts into user-friendly content."""
-}
+@st.cache_resource
+def load_upload_executor():
+    return parse_executor()
+
+def rank_uploads(uploads, job_description):
+    """Parse and score uploads concurrently, redrawing the ranked table as each finishes."""
+    st.subheader("Ranked Candidates")
+    progress = st.progress(0.0, text=f"Ranking {len(uploads)} resumes...")
+    table = st.empty()
+    rows = []
+    parsed = parse_uploads(load_upload_executor(), uploads, max_pending=UPLOAD_CONCURRENCY)
+    for result in score_resumes(nlp_analyzer, recommender, job_description, parsed, batch_size=1):
+        rows.append({
+            "Resume": result["file"],
+            "Match Score": result.get("score"),
+            "Missing Skills": ", ".join(result.get("missing_skills", [])[:8]),
+            "Note": result.get("error", ""),
+        })
+        # Best first; files that could not be read go last
+        rows.sort(key=lambda row: -1 if row["Match Score"] is None else row["Match Score"],
+                  reverse=True)
+        table.dataframe(rows, use_container_width=True)
+        progress.progress(len(rows) / len(uploads),
+                          text=f"Ranked {len(rows)} of {len(uploads)} resumes")
+
+def preview_resume(upload):
+    """Parse one upload, show its text and best matching sample jobs; returns the text."""
+    # Parse the upload in memory; no temp files are written
+    resume_text = DocumentParser.parse_stream(upload, upload.name)
+    if not resume_text:
+        return None
+
+    with st.expander("Preview Resume Text"):
+        st.text_area("Extracted Text", resume_text, height=300)
+
+    # Suggest the sample jobs this resume fits best
+    best_jobs = suggest_jobs(analysis_key(resume_text), resume_text)
+    if best_jobs:
+        st.markdown("**🔎 Best matching sample jobs:**")
+        for job_title, score in best_jobs:
+            st.markdown(f"• {job_title} — {score}%")
+    return resume_text
 
 # App title and description
 st.title("🚀 Expert Journey")
@@ -97,24 +168,18 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Upload Your Resume")
-    uploaded_resume = st.file_uploader("Upload your resume (PDF or DOCX)", type=["pdf", "docx"])
-    
+    uploaded_resumes = st.file_uploader("Upload your resume (PDF or DOCX), or several to rank them",
+                                        type=["pdf", "docx"], accept_multiple_files=True) or []
+    # One resume gets a detailed analysis; several are ranked against the job
+    uploaded_resume = uploaded_resumes[0] if len(uploaded_resumes) == 1 else None
+
     if uploaded_resume:
-        # Save uploaded file to temp location
-        temp_dir = tempfile.TemporaryDirectory()
-        file_path = os.path.join(temp_dir.name, uploaded_resume.name)
-        with open(file_path, "wb") as f:
-            f.write(uploaded_resume.getbuffer())
-        
-        # Parse the document
-        resume_text = DocumentParser.parse_document(file_path)
-        
-        if resume_text:
-            st.success(f"Resume uploaded successfully: {uploaded_resume.name}")
-            with st.expander("Preview Resume Text"):
-                st.text_area("Extracted Text", resume_text, height=300)
-        else:
-            st.error("Failed to extract text from the resume. Please try another file.")
+        # Parsed when the form is submitted, not on every rerun
+        st.success(f"Resume uploaded: {uploaded_resume.name}. "
+                   "Analyze to preview it and match it against the job description.")
+    elif uploaded_resumes:
+        st.success(f"{len(uploaded_resumes)} resumes uploaded. "
+                   "Analyze to rank them against the job description.")
 
 with col2:
     st.subheader("Enter Job Description")
@@ -142,30 +207,46 @@ with col2:
     if 'selected_job' in st.session_state and st.session_state.selected_job != "Custom (paste your own)":
         selected_job = st.session_state.selected_job
 
-    # Job description text area
-    if selected_job == "Custom (paste your own)":
-        job_description = st.text_area("Paste the job description here", height=300)
-    else:
-        job_description = st.text_area(
-            f"Job description for {selected_job}:",
-            value=SAMPLE_JOBS[selected_job],
-            height=300
-        )
-        st.info(f"💡 You can edit this sample job description or select 'Custom' to paste your own.")
+    # Edits to the job description only rerun the app when the form is submitted
+    with st.form("analysis_form"):
+        if selected_job == "Custom (paste your own)":
+            job_description = st.text_area("Paste the job description here", height=300)
+        else:
+            job_description = st.text_area(
+                f"Job description for {selected_job}:",
+                value=SAMPLE_JOBS[selected_job],
+                height=300
+            )
+            st.info(f"💡 You can edit this sample job description or select 'Custom' to paste your own.")
+        analyze_clicked = st.form_submit_button("Analyze Resume Match")
+
+# Parse a single resume only on submit, so reruns (e.g. picking another
+# sample job) do no document or NLP work
+resume_text = None
+if analyze_clicked and uploaded_resume:
+    with col1:
+        resume_text = preview_resume(uploaded_resume)
 
 # Analysis button
-if st.button("Analyze Resume Match"):
-    if not uploaded_resume:
+if analyze_clicked:
+    if not uploaded_resumes:
         st.warning("Please upload your resume first.")
     elif not job_description:
         st.warning("Please enter a job description.")
+    elif len(uploaded_resumes) > 1:
+        rank_uploads(uploaded_resumes, job_description)
+    elif not resume_text:
+        st.error("Failed to extract text from the resume. Please try another file.")
     else:
         with st.spinner("Analyzing your resume against the job description..."):
-            # Calculate match score
-            match_score = nlp_analyzer.calculate_match_score(resume_text, job_description)
-            
-            # Generate recommendations
-            recommendations = recommender.generate_recommendations(resume_text, job_description)
+            # Time this analysis per stage when RESUME_RANKER_METRICS is set;
+            # a cached result records nothing
+            with metrics.recording() as trace:
+                result = analyze_match(analysis_key(resume_text, job_description),
+                                       resume_text, job_description)
+            match_score = result["match_score"]
+            recommendations = result["recommendations"]
+            missing_keywords = result["missing_keywords"]
             
             # Display results
             st.subheader("Analysis Results")
@@ -208,7 +289,6 @@ if st.button("Analyze Resume Match"):
                             st.write(rec["content"])
             
             # Display missing keywords
-            missing_keywords = nlp_analyzer.find_missing_keywords(resume_text, job_description)
             if missing_keywords:
                 st.subheader("Missing Keywords")
                 st.markdown("These important keywords from the job description are missing in your resume:")
@@ -223,6 +303,11 @@ if st.button("Analyze Resume Match"):
                 # Keyword usage suggestion
                 st.info("💡 Try incorporating these keywords naturally into your resume where applicable.")
 
+            # Worker processes keep their own metrics, so only in-process runs show up here
+            if trace.stages:
+                with st.expander("Performance breakdown"):
+                    st.table(trace.as_rows())
+
 # Sample jobs showcase
 st.markdown("---")
 st.subheader("📋 Available Sample Jobs")
@@ -0,0 +1,138 @@
+"""
+Synthetic resume and job description corpus for benchmarks.
+
+Documents are assembled from lines of the data/sample_* files and the sample
+job library, mixed with skills from the taxonomy, so they read like real
+resumes but can be made any size. The same seed always gives the same
+corpus. Each resume is written as PDF, DOCX and plain text with identical
+content.
+"""
+
+import io
+import os
+import random
+
+from utils.sample_jobs import SAMPLE_JOBS
+from utils.skill_taxonomy import SkillTaxonomy
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+_VERBS = ["Built", "Designed", "Led", "Maintained", "Automated", "Migrated", "Optimized", "Tested"]
+_OBJECTS = ["reporting pipelines", "customer dashboards", "internal APIs", "data models",
+            "deployment tooling", "analytics workflows", "web services", "training programs"]
+
+
+def _sample_lines():
+    """Non-trivial lines from the sample resume, sample job and job library."""
+    lines = []
+    for folder in ("sample_resumes", "sample_jobs"):
+        directory = os.path.join(DATA_DIR, folder)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".txt"):
+                with open(os.path.join(directory, name), encoding="utf-8") as f:
+                    lines.extend(f.read().splitlines())
+    for description in SAMPLE_JOBS.values():
+        lines.extend(description.splitlines())
+    return [line.strip("-• ").strip() for line in lines if len(line.split()) >= 4]
+
+
+def make_text(rng, words, lines, skills):
+    """Roughly `words` words of resume-like text."""
+    out = []
+    count = 0
+    while count < words:
+        if rng.random() < 0.3:
+            line = (f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} using "
+                    f"{', '.join(rng.sample(skills, 3))}.")
+        else:
+            line = rng.choice(lines)
+        out.append(line)
+        count += len(line.split())
+    return "\n".join(out)
+
+
+def make_pdf(text, lines_per_page=50, width=90):
+    """A text PDF with Helvetica lines; long lines are wrapped at width characters."""
+    wrapped = []
+    for line in text.splitlines():
+        while len(line) > width:
+            cut = line.rfind(" ", 0, width)
+            cut = cut if cut > 0 else width
+            wrapped.append(line[:cut])
+            line = line[cut:].lstrip()
+        wrapped.append(line)
+    pages = [wrapped[i:i + lines_per_page] for i in range(0, len(wrapped), lines_per_page)] or [[]]
+
+    def escape(line):
+        line = line.encode("latin-1", "replace").decode("latin-1")
+        return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join("%d 0 R" % (4 + 2 * i) for i in range(len(pages))), len(pages))).encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, page in enumerate(pages):
+        content = ("BT /F1 11 Tf 50 780 Td 14 TL %s ET" % " ".join(
+            "(%s) '" % escape(line) for line in page)).encode("latin-1")
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            "/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        ).encode())
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def make_docx(text):
+    """A DOCX with one paragraph per line."""
+    import docx
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_corpus(output_dir, resumes=20, jobs=5, resume_words=600, job_words=300, seed=0):
+    """Write the corpus under output_dir and return its layout.
+
+    Returns {"resumes": [{"txt", "pdf", "docx"} paths], "jobs": [txt paths]}.
+    """
+    rng = random.Random(seed)
+    lines = _sample_lines()
+    skills = sorted(SkillTaxonomy.load().skills)
+
+    os.makedirs(os.path.join(output_dir, "resumes"), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, "jobs"), exist_ok=True)
+
+    corpus = {"resumes": [], "jobs": []}
+    for i in range(resumes):
+        text = make_text(rng, resume_words, lines, skills)
+        paths = {}
+        for extension, data in (("txt", text.encode("utf-8")), ("pdf", make_pdf(text)),
+                                ("docx", make_docx(text))):
+            paths[extension] = os.path.join(output_dir, "resumes", f"resume_{i:04d}.{extension}")
+            with open(paths[extension], "wb") as f:
+                f.write(data)
+        corpus["resumes"].append(paths)
+
+    for i in range(jobs):
+        path = os.path.join(output_dir, "jobs", f"job_{i:04d}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(make_text(rng, job_words, lines, skills))
+        corpus["jobs"].append(path)
+    return corpus
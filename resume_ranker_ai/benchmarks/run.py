@@ -0,0 +1,237 @@
+"""
+Per-stage benchmarks with a stored baseline.
+
+Run from resume_ranker_ai/:
+
+    python -m benchmarks.run                    # time stages, compare to baseline.json
+    python -m benchmarks.run --update-baseline  # record the current timings
+
+Each stage runs over a synthetic corpus (see benchmarks/corpus.py) and
+reports milliseconds per item, items per second, how much the stage raised
+the process's peak RSS, and the process peak itself.
+
+Stage times are also expressed relative to a fixed calibration workload
+timed in the same run, which cancels most of the speed difference between
+machines. The run fails (exit status 1) when a stage's relative time exceeds
+its baseline by more than --threshold. baseline.json keeps one baseline per
+model and corpus settings; only the one matching this run is compared, so
+record one with the model the check runs against.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+STAGES = ("parse_pdf", "parse_docx", "extract_keywords", "extract_skills",
+          "calculate_match_score", "generate_recommendations")
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# Timed runs per stage at least, whatever --repeat says: relative timings are
+# a median over runs, which needs several to be stable
+MIN_RUNS = 7
+
+
+def calibration_ms():
+    """Time in ms of one fixed tokenize-and-count workload, the unit for relative timings."""
+    import re
+    from collections import Counter
+
+    started = time.perf_counter()
+    Counter(re.findall(r"\w+", _CALIBRATION_TEXT.lower())).most_common(30)
+    return (time.perf_counter() - started) * 1000
+
+
+_CALIBRATION_TEXT = " ".join(f"Word{i % 997} skill{i % 89}, experience" for i in range(20000))
+
+
+def stage_functions(corpus, nlp_analyzer, recommender):
+    """Map stage name to (function, items): function(item) is timed per item."""
+    from utils.document_parser import DocumentParser
+
+    def read(path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    resumes = [read(paths["txt"]) for paths in corpus["resumes"]]
+    jobs = [read(path) for path in corpus["jobs"]]
+    pairs = [(resume, jobs[i % len(jobs)]) for i, resume in enumerate(resumes)]
+
+    return {
+        "parse_pdf": (DocumentParser.parse_pdf, [paths["pdf"] for paths in corpus["resumes"]]),
+        "parse_docx": (DocumentParser.parse_docx, [paths["docx"] for paths in corpus["resumes"]]),
+        "extract_keywords": (nlp_analyzer.extract_keywords, resumes),
+        "extract_skills": (nlp_analyzer.extract_skills, resumes),
+        "calculate_match_score": (lambda pair: nlp_analyzer.calculate_match_score(*pair), pairs),
+        "generate_recommendations": (lambda pair: recommender.generate_recommendations(*pair), pairs),
+    }
+
+
+def run_benchmarks(corpus, nlp_analyzer, recommender, stages=STAGES, repeat=5, min_time=1.0):
+    """Time each stage; returns {stage: {"items", "ms_per_item", "relative", "items_per_s",
+    "rss_growth_mb", "process_peak_rss_mb"}}.
+
+    Each stage is run once to warm up, then at least repeat (and MIN_RUNS)
+    times and for at least min_time seconds; the fastest run gives
+    ms_per_item. Every run is paired with a calibration_ms() run just before
+    it, and relative is the median of the per-run ratios, so load changes
+    during the stage cancel out. rss_growth_mb is how far the stage raised the
+    process's peak RSS; process_peak_rss_mb includes every earlier stage.
+    """
+    import statistics
+
+    functions = stage_functions(corpus, nlp_analyzer, recommender)
+    results = {}
+    for stage in stages:
+        function, items = functions[stage]
+        peak_before = peak_rss_mb() or 0
+        for item in items[:1]:
+            function(item)
+
+        timings = []
+        ratios = []
+        # Start each stage without the previous stage's garbage
+        gc.collect()
+        while len(timings) < max(repeat, MIN_RUNS) or sum(timings) < min_time:
+            calibration = calibration_ms()
+            started = time.perf_counter()
+            for item in items:
+                function(item)
+            elapsed = time.perf_counter() - started
+            timings.append(elapsed)
+            ratios.append(elapsed * 1000 / len(items) / calibration)
+
+        best = min(timings)
+        peak_after = peak_rss_mb() or 0
+        results[stage] = {
+            "items": len(items),
+            "ms_per_item": round(best * 1000 / len(items), 4),
+            "relative": round(statistics.median(ratios), 4),
+            "items_per_s": round(len(items) / best, 1) if best else None,
+            "rss_growth_mb": round(peak_after - peak_before, 1),
+            "process_peak_rss_mb": round(peak_after, 1),
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Stages slower than baseline by more than threshold, as (stage, now, before) tuples.
+
+    Relative timings are compared, so baseline may come from another machine.
+    """
+    regressions = []
+    for stage, result in results.items():
+        before = baseline.get("stages", {}).get(stage)
+        if before and result["relative"] > before["relative"] * (1 + threshold):
+            regressions.append((stage, result["relative"], before["relative"]))
+    return regressions
+
+
+def find_baseline(baselines, config):
+    """The recorded baseline with exactly these settings, or None."""
+    for baseline in baselines:
+        if baseline.get("config") == config:
+            return baseline
+    return None
+
+
+def format_report(results):
+    lines = [f"{'stage':<26}{'items':>7}{'ms/item':>12}{'relative':>10}{'items/s':>11}"
+             f"{'peak +MB':>10}{'process peak MB':>17}"]
+    for stage, result in results.items():
+        lines.append(f"{stage:<26}{result['items']:>7}{result['ms_per_item']:>12.3f}"
+                     f"{result['relative']:>10.3f}{result['items_per_s'] or 0:>11.1f}"
+                     f"{result['rss_growth_mb']:>10.1f}{result['process_peak_rss_mb']:>17.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=20, help="synthetic resumes (default: 20)")
+    parser.add_argument("--jobs", type=int, default=5, help="synthetic jobs (default: 5)")
+    parser.add_argument("--resume-words", type=int, default=600)
+    parser.add_argument("--job-words", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=MIN_RUNS,
+                        help=f"minimum timed runs per stage (default and floor: {MIN_RUNS})")
+    parser.add_argument("--min-time", type=float, default=1.0,
+                        help="minimum seconds of timed runs per stage (default: 1)")
+    parser.add_argument("--stage", action="append", choices=STAGES, help="only run these stages")
+    # Repeated runs on one machine differ by up to ~15%, occasionally more
+    parser.add_argument("--threshold", type=float, default=0.4,
+                        help="allowed relative slowdown over baseline, as a fraction (default: 0.4)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="record these timings as the baseline for this model and corpus")
+    args = parser.parse_args(argv)
+
+    from utils.nlp_analyzer import NLPAnalyzer
+    from utils.recommender import ResumeRecommender
+    from benchmarks.corpus import build_corpus
+
+    nlp_analyzer = NLPAnalyzer(allow_download=False)
+    recommender = ResumeRecommender(nlp_analyzer)
+    config = {
+        "model": nlp_analyzer.model_id(),
+        "resumes": args.resumes,
+        "jobs": args.jobs,
+        "resume_words": args.resume_words,
+        "job_words": args.job_words,
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = build_corpus(directory, args.resumes, args.jobs,
+                              args.resume_words, args.job_words)
+        results = run_benchmarks(corpus, nlp_analyzer, recommender,
+                                 stages=args.stage or STAGES, repeat=args.repeat,
+                                 min_time=args.min_time)
+    print(format_report(results))
+
+    baselines = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = json.load(f).get("baselines", [])
+    baseline = find_baseline(baselines, config)
+
+    if args.update_baseline:
+        if baseline is not None:
+            baselines.remove(baseline)
+        baselines.append({"config": config, "stages": results})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"baselines": baselines}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline for {config['model']} written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline for these settings ({config}); run with --update-baseline to record one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for stage, now, before in regressions:
+        print(f"REGRESSION {stage}: {now:.3f} vs baseline {before:.3f} relative "
+              f"(+{(now / before - 1) * 100:.0f}%, allowed +{args.threshold * 100:.0f}%)")
+    if regressions:
+        return 1
+    print(f"All stages within {args.threshold * 100:.0f}% of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
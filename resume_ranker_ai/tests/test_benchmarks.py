@@ -0,0 +1,42 @@
+import unittest
+import tempfile
+from unittest import mock
+from utils.document_parser import DocumentParser
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.recommender import ResumeRecommender
+from benchmarks.corpus import build_corpus
+from benchmarks.run import STAGES, compare, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.corpus = build_corpus(temp_dir.name, resumes=2, jobs=1, resume_words=150, job_words=80)
+
+    def test_formats_carry_the_same_text(self):
+        paths = self.corpus["resumes"][0]
+        with open(paths["txt"], encoding="utf-8") as f:
+            words = f.read().split()
+        self.assertGreaterEqual(len(words), 150)
+        self.assertEqual(DocumentParser.parse_docx(paths["docx"]).split(), words)
+        self.assertEqual(DocumentParser.parse_pdf(paths["pdf"]).split()[:10], words[:10])
+
+    def test_every_stage_is_timed_and_regressions_flagged(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer()
+        results = run_benchmarks(self.corpus, analyzer, ResumeRecommender(analyzer),
+                                 repeat=1, min_time=0)
+        self.assertEqual(list(results), list(STAGES))
+        self.assertTrue(all(result["items"] == 2 for result in results.values()))
+
+        baseline = {"stages": {stage: dict(result) for stage, result in results.items()}}
+        self.assertEqual(compare(results, baseline, 0.25), [])
+        baseline["stages"]["parse_docx"]["relative"] = results["parse_docx"]["relative"] / 2
+        self.assertEqual([stage for stage, _, _ in compare(results, baseline, 0.25)], ["parse_docx"])
+
+
+if __name__ == '__main__':
+    unittest.main()
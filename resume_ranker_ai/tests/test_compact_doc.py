@@ -0,0 +1,70 @@
+import unittest
+import tempfile
+from collections import Counter
+from utils.compact_doc import CompactDoc
+
+
+def make_doc(vocab):
+    from spacy.tokens import Doc
+
+    # "senior data engineer" is a noun chunk; "the google cloud team" has a stop word
+    return Doc(
+        vocab,
+        words=["senior", "data", "engineer", "joins", "the", "google", "cloud", "team", "today"],
+        pos=["ADJ", "NOUN", "NOUN", "VERB", "DET", "PROPN", "PROPN", "NOUN", "NOUN"],
+        heads=[2, 2, 3, 3, 7, 7, 7, 3, 3],
+        deps=["amod", "compound", "nsubj", "ROOT", "det", "compound", "compound", "dobj", "npadvmod"],
+        ents=["O", "O", "O", "O", "O", "B-ORG", "I-ORG", "O", "B-DATE"],
+    )
+
+
+class TestCompactDoc(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import spacy
+
+        cls.doc = make_doc(spacy.blank("en").vocab)
+        cls.compact = CompactDoc.from_doc(cls.doc)
+
+    def test_keeps_tokens_entities_and_chunks(self):
+        compact = self.compact
+        self.assertEqual(len(compact), len(self.doc))
+        self.assertEqual([compact.word(i) for i in compact.word_ids], [t.lower_ for t in self.doc])
+        self.assertEqual(compact.entity_texts({"ORG"}), ["google cloud"])
+        self.assertEqual(compact.chunk_texts(), ["senior data engineer"])
+        self.assertLess(compact.nbytes, len(self.doc.to_bytes()))
+
+    def test_count_words_matches_token_loop(self):
+        from spacy.parts_of_speech import NOUN, PROPN
+
+        mask = (self.compact.pos == NOUN) | (self.compact.pos == PROPN)
+        expected = Counter(t.lower_ for t in self.doc if t.pos_ in ("NOUN", "PROPN")
+                           and t.lower_ != "team")
+        counts = self.compact.count_words(mask, exclude={"team"})
+        self.assertEqual(counts, expected)
+        self.assertEqual(list(counts), list(expected))
+
+    def test_concat_offsets_spans(self):
+        merged = CompactDoc.concat([self.compact, self.compact])
+        self.assertEqual(merged.text, f"{self.doc.text} {self.doc.text}")
+        self.assertEqual(len(merged), 2 * len(self.doc))
+        self.assertEqual(merged.entity_texts({"ORG"}), ["google cloud"] * 2)
+        self.assertEqual(merged.chunk_texts(), ["senior data engineer"] * 2)
+
+    def test_save_many_round_trips_memory_mapped(self):
+        import numpy as np
+
+        with tempfile.TemporaryDirectory() as directory:
+            CompactDoc.save_many(directory, [self.compact, CompactDoc.concat([self.compact])])
+            first, second = CompactDoc.load_many(directory)
+            self.assertIsInstance(first.word_ids, np.memmap)
+            for loaded in (first, second):
+                self.assertEqual(loaded.text, self.doc.text)
+                self.assertEqual(loaded.entity_texts({"ORG", "DATE"}), ["google cloud", "today"])
+                self.assertEqual(loaded.count_words(np.ones(len(loaded), dtype=bool)),
+                                 Counter(t.lower_ for t in self.doc))
+
+
+if __name__ == '__main__':
+    unittest.main()
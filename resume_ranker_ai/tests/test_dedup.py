@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+from utils.dedup import NearDuplicateFinder
+from utils.nlp_analyzer import NLPAnalyzer
+
+BASE = ("senior python developer with eight years of experience building django "
+        "services postgresql databases docker containers and aws infrastructure "
+        "leading a team of five engineers and mentoring junior developers")
+
+
+class TestNearDuplicateFinder(unittest.TestCase):
+
+    def test_groups_near_duplicates_only(self):
+        texts = [
+            BASE,
+            "data analyst skilled in sql excel tableau dashboards and statistics reporting",
+            BASE + " references available on request",
+            BASE.replace("five", "six"),
+            "",
+            "",
+        ]
+        representatives = NearDuplicateFinder(threshold=0.6).group(texts)
+        self.assertEqual(representatives, [0, 1, 0, 0, 4, 5])
+
+    def test_chains_of_near_duplicates_join_one_cluster(self):
+        import numpy as np
+
+        finder = NearDuplicateFinder(threshold=0.5)
+        # One band over the first value puts every text in one bucket; each
+        # text is similar only to its neighbours in the chain
+        finder.rows, finder.bands = 1, 1
+        with mock.patch.object(finder, 'signature', side_effect=lambda text: np.array([7, int(text)])), \
+                mock.patch.object(finder, 'similarity',
+                                  side_effect=lambda a, b: float(abs(int(a[1]) - int(b[1])) == 1)):
+            self.assertEqual(finder.group(["0", "1", "2", "3", "9"]), [0, 0, 0, 0, 4])
+
+    def test_rank_resumes_analyzes_one_copy_per_group(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer()
+        resumes = {
+            "pdf": BASE,
+            "analyst": "Data analyst skilled in SQL, Excel and Tableau.",
+            "docx": BASE + " references available on request",
+        }
+        job = "Python developer with Django, Docker and AWS"
+
+        with mock.patch.object(analyzer, 'analyze_many', wraps=analyzer.analyze_many) as analyze_many:
+            ranked = analyzer.rank_resumes(job, resumes, dedup_threshold=0.6)
+        self.assertEqual(len(analyze_many.call_args[0][0]), 2)
+
+        by_id = {result["id"]: result for result in ranked}
+        self.assertEqual(by_id["docx"]["duplicate_of"], "pdf")
+        self.assertIsNone(by_id["pdf"]["duplicate_of"])
+        self.assertEqual(by_id["docx"]["score"], by_id["pdf"]["score"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import tempfile
+from unittest import mock
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from utils.idf_model import IDFModel
+from utils.nlp_analyzer import NLPAnalyzer
+
+CORPUS = [
+    "python developer django postgresql docker aws",
+    "data analyst sql excel tableau statistics",
+    "frontend engineer react typescript css",
+    "machine learning engineer python tensorflow sql",
+]
+
+
+class TestIDFModel(unittest.TestCase):
+
+    def test_vocabulary_transform_matches_sklearn(self):
+        model = IDFModel.fit(CORPUS)
+        vectorizer = TfidfVectorizer(stop_words='english').fit(CORPUS)
+        query = ["python sql developer with kubernetes"]
+
+        ours = model.transform(query).toarray()[0]
+        expected = vectorizer.transform(query).toarray()[0]
+        order = [vectorizer.vocabulary_[term] for term in model.terms]
+        np.testing.assert_allclose(ours, expected[order], rtol=1e-5)
+
+    def test_hashing_mode_keeps_unseen_terms(self):
+        model = IDFModel.fit(CORPUS, mode="hashing", n_features=2 ** 12)
+        a, b = model.transform(["kubernetes terraform", "kubernetes terraform"])
+        self.assertAlmostEqual(model.cosine(a, b), 1.0, places=5)
+        self.assertIsNone(model.cosine(*model.transform(["", "the and"])))
+
+    def test_saved_model_is_memory_mapped(self):
+        model = IDFModel.fit(CORPUS)
+        with tempfile.TemporaryDirectory() as directory:
+            model.save(directory)
+            loaded = IDFModel.load(directory)
+            self.assertIsInstance(loaded.idf, np.memmap)
+            np.testing.assert_array_equal(loaded.transform(CORPUS).toarray(),
+                                          model.transform(CORPUS).toarray())
+            del loaded
+
+    def test_analyzer_scores_with_idf_model(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer(idf_model=IDFModel.fit(CORPUS))
+        resume = "Python developer who has used Django and Docker on AWS."
+        job = "Looking for a Python developer with Django, PostgreSQL, Docker and AWS."
+
+        score = analyzer.calculate_match_score(resume, job)
+        self.assertGreater(score, 50)
+        ranked = analyzer.rank_resumes(job, [resume, "Excel and Tableau analyst"])
+        self.assertEqual(ranked[0]["id"], 0)
+        self.assertEqual(ranked[0]["score"], score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-import budget in seconds; override with UTILS_IMPORT_BUDGET on slow machines
+IMPORT_BUDGET = float(os.environ.get("UTILS_IMPORT_BUDGET", "0.1"))
+
+HEAVY_MODULES = ("spacy", "sklearn", "scipy", "numpy", "pdfplumber", "PyPDF2", "docx")
+
+
+def cold_import(statement):
+    """Import in a fresh interpreter; return (seconds, heavy modules loaded)."""
+    check = "import sys; print(','.join(m for m in %r if m in sys.modules))" % (HEAVY_MODULES,)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement + "; " + check],
+        cwd=PACKAGE_DIR, capture_output=True, text=True, check=True,
+    )
+
+    # Lines look like "import time: self [us] | cumulative | package"; sum the
+    # cumulative time of the top-level (unindented) utils entries
+    total_us = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].startswith(" utils") and fields[1].strip().isdigit():
+            total_us += int(fields[1])
+
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total_us / 1e6, loaded
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_package_import_is_lazy(self):
+        seconds, loaded = cold_import("import utils")
+        self.assertEqual(loaded, [])
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+    def test_modules_defer_heavy_dependencies(self):
+        seconds, loaded = cold_import(
+            "import utils.document_parser, utils.nlp_analyzer, utils.recommender, utils.matcher"
+        )
+        self.assertEqual(loaded, [])
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+    def test_lazy_attribute_loads_only_its_module(self):
+        _, loaded = cold_import("from utils import DocumentParser; DocumentParser.parse_docx")
+        self.assertEqual(loaded, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+from utils.nlp_analyzer import NLPAnalyzer
+from utils import job_library
+
+JOBS = {
+    "Backend Engineer": "Python developer with Django, PostgreSQL, Docker and AWS experience.",
+    "Data Analyst": "Analyst skilled in SQL, Excel, Tableau dashboards and statistics.",
+}
+
+
+class TestJobLibrary(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            self.analyzer = NLPAnalyzer()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, "jobs.npz")
+
+    def test_loaded_artifact_matches_fresh_analysis(self):
+        text = JOBS["Data Analyst"]
+        fresh = self.analyzer.analyze(text)
+        job_library.build_job_library(self.analyzer, JOBS, self.path)
+
+        with mock.patch.object(job_library, 'build_job_library') as build:
+            documents = job_library.load_job_library(self.analyzer, JOBS, self.path)
+        build.assert_not_called()
+
+        self.assertIs(self.analyzer.analyze(text), documents["Data Analyst"])
+        self.assertEqual(documents["Data Analyst"].keyword_counts, fresh.keyword_counts)
+        self.assertEqual(sorted(documents["Data Analyst"].skills), sorted(fresh.skills))
+        self.assertEqual(documents["Data Analyst"].term_counts, fresh.term_counts)
+
+    def test_stale_artifact_is_rebuilt(self):
+        job_library.build_job_library(self.analyzer, JOBS, self.path)
+        edited = dict(JOBS, **{"Data Analyst": "Analyst skilled in SQL and Power BI."})
+
+        documents = job_library.load_job_library(self.analyzer, edited, self.path)
+        self.assertIn("power", documents["Data Analyst"].term_counts)
+
+        # The rewritten artifact is current for the edited jobs
+        self.assertIsNotNone(job_library._read_artifact(self.analyzer, edited, self.path))
+        self.assertIsNone(job_library._read_artifact(self.analyzer, JOBS, self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import os
+from unittest import mock
+from utils.lite import LiteScreener
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.pipeline import prescreen
+from utils.sample_jobs import SAMPLE_JOBS
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+
+def load_sample(*parts):
+    with open(os.path.join(DATA_DIR, *parts), encoding='utf-8') as f:
+        return f.read()
+
+
+class TestLiteScreener(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = NLPAnalyzer(lite=True)
+        cls.job_text = load_sample('sample_jobs', 'data_scientist.txt')
+        cls.pool = dict(SAMPLE_JOBS, resume=load_sample('sample_resumes', 'sample_resume.txt'))
+
+    def test_lite_analyzer_never_loads_spacy(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model') as load:
+            analyzer = NLPAnalyzer(lite=True)
+        load.assert_not_called()
+        self.assertIsNone(analyzer.nlp)
+
+    def test_counts_match_fallback_analysis(self):
+        texts = list(self.pool.values())
+        counts, terms = LiteScreener().keyword_matrix(texts)
+        for row, text in enumerate(texts):
+            row_counts = counts[row]
+            self.assertEqual(dict(zip(terms[row_counts.indices], row_counts.data)),
+                             dict(self.analyzer.analyze(text).keyword_counts))
+
+    def test_top_keywords_break_ties_alphabetically(self):
+        screener = LiteScreener()
+        self.assertEqual(screener.top_keywords(["zebra apple zebra mango apple kiwi", ""], k=3),
+                         [["apple", "zebra", "kiwi"], []])
+
+    def test_scores_match_fallback_keyword_match(self):
+        # Short texts have fewer keywords than the top-k limits, so ties cannot differ
+        job = "Python developer with Django, Docker and AWS experience."
+        resumes = ["Python developer using Django and Docker on AWS", "SQL and Tableau analyst",
+                   "Pastry chef baking bread", ""]
+        self.assertEqual(LiteScreener().match_scores(job, resumes).tolist(),
+                         [self.analyzer._calculate_keyword_match(resume, job) for resume in resumes])
+
+    def test_prescreen_keeps_best_matches_and_failures(self):
+        parsed = [("empty", "")] + list(reversed(self.pool.items())) + [("unreadable", None)]
+        shortlist = prescreen(iter(parsed), self.job_text, keep=3, batch_size=4)
+        scores = LiteScreener().match_scores(self.job_text, list(self.pool.values()))
+        expected = sorted(zip(scores, self.pool), key=lambda item: (-item[0], item[1]))[:3]
+        self.assertEqual([path for path, _ in shortlist],
+                         [title for _, title in expected] + ["empty", "unreadable"])
+
+    def test_lite_mode_has_its_own_model_id(self):
+        self.assertTrue(self.analyzer.model_id().startswith("lite/"))
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            self.assertTrue(NLPAnalyzer().model_id().startswith("fallback/"))
+
+
+class TestLiteQuality(unittest.TestCase):
+    """Lite screening against full spaCy analysis; skipped without a spaCy model."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = NLPAnalyzer(allow_download=False)
+        if not cls.analyzer.nlp:
+            raise unittest.SkipTest("No spaCy model installed")
+        cls.job_text = load_sample('sample_jobs', 'data_scientist.txt')
+        cls.pool = dict(SAMPLE_JOBS, resume=load_sample('sample_resumes', 'sample_resume.txt'))
+
+    def test_shortlist_keeps_best_full_matches(self):
+        ranked = [result["id"] for result in self.analyzer.rank_resumes(self.job_text, self.pool)]
+        titles = list(self.pool)
+        shortlist = [titles[index] for index in
+                     LiteScreener().shortlist(self.job_text, list(self.pool.values()), 8)]
+        self.assertTrue(set(ranked[:2]) <= set(shortlist))
+
+    def test_lite_keywords_cover_spacy_keywords(self):
+        for text in (self.job_text, self.pool["resume"]):
+            spacy_keywords = self.analyzer.extract_keywords(text, 10)
+            lite_keywords = LiteScreener(stop_words=self.analyzer.stop_words).top_keywords([text], 30)[0]
+            covered = len(set(spacy_keywords) & set(lite_keywords)) / len(spacy_keywords)
+            self.assertGreaterEqual(covered, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
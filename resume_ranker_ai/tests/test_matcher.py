@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.matcher import MatchIndex
+
+JOBS = {
+    "Backend Engineer": "Python developer with Django, PostgreSQL, Docker and AWS experience.",
+    "Data Analyst": "Analyst skilled in SQL, Excel, Tableau dashboards and statistics.",
+    "Pastry Chef": "Chef experienced in baking bread, cakes and French pastry.",
+}
+
+
+class TestMatchIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            cls.analyzer = NLPAnalyzer()
+
+    def test_top_jobs_for_unindexed_resume(self):
+        index = MatchIndex(self.analyzer).fit(JOBS)
+        matches = index.top_jobs("Senior Python developer using Docker on AWS", k=2)
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(matches[0][0], "Backend Engineer")
+        self.assertGreaterEqual(matches[0][1], matches[1][1])
+
+    def test_chunked_many_to_many_matches_unchunked(self):
+        resumes = {
+            "dev": "Python and Docker developer",
+            "analyst": "SQL and Tableau analyst",
+            "baker": "Baking bread and pastry",
+        }
+        chunked = MatchIndex(self.analyzer, chunk_size=1).fit(JOBS)
+        chunked.add_resumes(resumes)
+        whole = MatchIndex(self.analyzer).fit(JOBS)
+        whole.add_resumes(resumes)
+
+        self.assertEqual(chunked.top_jobs_for_resumes(k=2), whole.top_jobs_for_resumes(k=2))
+        self.assertEqual(chunked.top_jobs_for_resumes(k=1)["baker"][0][0], "Pastry Chef")
+        self.assertEqual(chunked.top_resumes_for_jobs(k=1)["Data Analyst"][0][0], "analyst")
+
+    def test_add_jobs_without_refit(self):
+        index = MatchIndex(self.analyzer).fit(JOBS)
+        vocabulary = dict(index.vectorizer.vocabulary_)
+        index.add_jobs({"DevOps Engineer": "Docker, Kubernetes and AWS automation"})
+        self.assertEqual(index.vectorizer.vocabulary_, vocabulary)
+        self.assertEqual(index.job_matrix.shape[0], 4)
+
+    def test_jobs_without_vocabulary_match_nothing(self):
+        for jobs in ([], ["", "the and of"]):
+            index = MatchIndex(self.analyzer).fit(jobs)
+            index.add_resumes({"dev": "Python developer"})
+            self.assertEqual(index.top_jobs("Python developer"), [])
+            self.assertEqual(index.top_jobs_for_resumes(), {})
+            self.assertEqual(index.top_resumes_for_jobs(), {})
+
+    def test_uses_analyzer_idf_model(self):
+        from utils.idf_model import IDFModel
+
+        corpus = [self.analyzer.preprocess_text(text) for text in JOBS.values()]
+        idf_model = IDFModel.fit(corpus + ["kubernetes terraform automation"])
+        with mock.patch.object(self.analyzer, 'idf_model', idf_model):
+            index = MatchIndex(self.analyzer).fit(JOBS)
+            matches = index.top_jobs("Senior Python developer using Docker on AWS", k=1)
+
+        self.assertIs(index.vectorizer, idf_model)
+        self.assertEqual(index.job_matrix.shape[1], len(idf_model.terms))
+        self.assertEqual((index.job_matrix != idf_model.transform(corpus)).nnz, 0)
+        self.assertEqual(matches[0][0], "Backend Engineer")
+
+
+if __name__ == '__main__':
+    unittest.main()
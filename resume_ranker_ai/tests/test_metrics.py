@@ -0,0 +1,81 @@
+import unittest
+import asyncio
+from unittest import mock
+from utils import metrics
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.recommender import ResumeRecommender
+from utils.service import ScoringService
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.addCleanup(metrics.enable, metrics.enabled())
+
+    def test_disabled_records_nothing(self):
+        metrics.enable(False)
+        with metrics.timer("parse_pdf"):
+            pass
+        metrics.observe("pages", 3)
+        metrics.increment("text_cache", result="hit")
+        self.assertEqual(metrics.snapshot(), {"stages": {}, "sizes": {}, "counters": []})
+        self.assertEqual(metrics.to_prometheus(), "\n")
+
+    def test_timers_sizes_and_counters(self):
+        metrics.enable()
+        with metrics.recording() as trace:
+            for _ in range(2):
+                with metrics.timer("spacy"):
+                    pass
+            metrics.observe("pages", 3)
+            metrics.increment("text_cache", result="miss")
+        metrics.increment("text_cache", result="hit")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["stages"]["spacy"]["count"], 2)
+        self.assertEqual(snapshot["sizes"]["pages"], {"count": 1, "sum": 3, "max": 3})
+        self.assertCountEqual(snapshot["counters"], [
+            {"event": "text_cache", "result": "miss", "count": 1},
+            {"event": "text_cache", "result": "hit", "count": 1},
+        ])
+        # The trace only holds what happened inside the recording block
+        self.assertEqual([row["stage"] for row in trace.as_rows()], ["spacy"])
+        self.assertEqual(trace.as_rows()[0]["calls"], 2)
+        self.assertEqual(trace.counters, {("text_cache", (("result", "miss"),)): 1})
+
+    def test_prometheus_format(self):
+        metrics.enable()
+        with metrics.timer("tfidf"):
+            pass
+        metrics.observe("tokens", 120)
+        metrics.increment("fallback", path="keyword_match")
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE resume_ranker_stage_duration_seconds summary", text)
+        self.assertIn('resume_ranker_stage_duration_seconds_count{stage="tfidf"} 1', text)
+        self.assertIn('resume_ranker_document_size_sum{measure="tokens"} 120', text)
+        self.assertIn('resume_ranker_events_total{event="fallback",path="keyword_match"} 1', text)
+
+    def test_analysis_is_instrumented(self):
+        metrics.enable()
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer()
+        recommender = ResumeRecommender(analyzer)
+        recommender.generate_recommendations("Python developer with Django",
+                                             "Python and Django engineer")
+
+        stages = metrics.snapshot()["stages"]
+        for stage in ("keywords", "skills", "recommendations"):
+            self.assertIn(stage, stages)
+
+        service = ScoringService(analyzer, recommender)
+        status, payload = asyncio.run(service._route("GET", "/metrics", b""))
+        self.assertEqual(status, 200)
+        self.assertIn('resume_ranker_stage_duration_seconds_count{stage="recommendations"} 1', payload)
+        self.assertIn('resume_ranker_events_total{event="fallback",path="no_spacy_model"} 1', payload)
+
+
+if __name__ == '__main__':
+    unittest.main()
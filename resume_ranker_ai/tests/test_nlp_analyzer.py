@@ -0,0 +1,168 @@
+import unittest
+import os
+from unittest import mock
+from utils.nlp_analyzer import NLPAnalyzer, AnalyzedDocument
+from utils.recommender import ResumeRecommender
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+
+def load_sample(*parts):
+    with open(os.path.join(DATA_DIR, *parts), encoding='utf-8') as f:
+        return f.read()
+
+
+class TestNLPAnalyzer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Run in fallback mode so the tests never try to download a model
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            cls.analyzer = NLPAnalyzer()
+        cls.resume_text = load_sample('sample_resumes', 'sample_resume.txt')
+        cls.job_text = load_sample('sample_jobs', 'data_scientist.txt')
+
+    def test_analyze_returns_reusable_document(self):
+        document = self.analyzer.analyze(self.resume_text)
+        self.assertIsInstance(document, AnalyzedDocument)
+        self.assertIs(self.analyzer.analyze(document), document)
+        self.assertEqual(self.analyzer.extract_keywords(document, 10),
+                         self.analyzer.extract_keywords(self.resume_text, 10))
+
+    def test_match_score_matches_pairwise_tfidf(self):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        matrix = TfidfVectorizer(stop_words='english').fit_transform([
+            self.analyzer.preprocess_text(self.resume_text),
+            self.analyzer.preprocess_text(self.job_text),
+        ])
+        expected = round(cosine_similarity(matrix[0:1], matrix[1:2])[0][0] * 100)
+        self.assertEqual(self.analyzer.calculate_match_score(self.resume_text, self.job_text),
+                         expected)
+
+    def test_empty_text_scores_zero(self):
+        self.assertEqual(self.analyzer.calculate_match_score("", self.job_text), 0)
+        self.assertEqual(ResumeRecommender(self.analyzer).generate_recommendations("", self.job_text), [])
+
+    def test_recommendations_accept_analyzed_documents(self):
+        recommender = ResumeRecommender(self.analyzer)
+        resume = self.analyzer.analyze(self.resume_text)
+        job = self.analyzer.analyze(self.job_text)
+        self.assertEqual(recommender.generate_recommendations(resume, job),
+                         recommender.generate_recommendations(self.resume_text, self.job_text))
+
+    def test_rank_resumes_orders_pool_by_score(self):
+        pool = {
+            'match': self.resume_text,
+            'unrelated': "Pastry chef with ten years baking bread and cakes.",
+            'empty': "",
+        }
+        results = self.analyzer.rank_resumes(self.job_text, pool)
+        self.assertEqual([r['id'] for r in results], ['match', 'unrelated', 'empty'])
+        self.assertEqual([r['rank'] for r in results], [1, 2, 3])
+        self.assertEqual(results[-1]['score'], 0)
+        self.assertTrue(results[1]['missing_keywords'])
+
+        top = self.analyzer.rank_resumes(self.job_text, pool, top_k=1)
+        self.assertEqual(len(top), 1)
+        self.assertEqual(top[0]['id'], 'match')
+
+    def test_incremental_analysis_matches_full_analysis(self):
+        full = self.analyzer.analyze(self.job_text)
+        incremental = self.analyzer.analyze(self.job_text, incremental=True)
+        self.assertEqual(incremental.processed_text, full.processed_text)
+        self.assertEqual(incremental.keyword_counts, full.keyword_counts)
+        self.assertEqual(incremental.term_counts, full.term_counts)
+        self.assertEqual(incremental.skills, full.skills)
+        self.assertEqual(self.analyzer.calculate_match_score(self.resume_text, incremental),
+                         self.analyzer.calculate_match_score(self.resume_text, full))
+
+    def test_incremental_analysis_only_reprocesses_edited_paragraphs(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer()
+        analyzer.analyze(self.job_text, incremental=True)
+
+        edited = self.job_text.rstrip() + "\n\nExperience with Rust and Kubernetes"
+        with mock.patch.object(analyzer, '_skill_parts', wraps=analyzer._skill_parts) as skill_parts:
+            document = analyzer.analyze(edited, incremental=True)
+        skill_parts.assert_called_once_with("Experience with Rust and Kubernetes", None)
+        self.assertIn("kubernetes", document.skills)
+        self.assertEqual(document.keyword_counts, analyzer.analyze(edited).keyword_counts)
+
+    def test_incremental_analysis_keeps_wrapped_lines_together(self):
+        import spacy
+
+        # Extracted text wraps mid-phrase; paragraphs keep each phrase whole
+        nlp = spacy.blank("en")
+        nlp.add_pipe("entity_ruler", name="ner").add_patterns(
+            [{"label": "ORG", "pattern": "google cloud"}])
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=nlp):
+            analyzer = NLPAnalyzer()
+        wrapped = ("Build machine\nlearning pipelines on Google\nCloud with React\nNative clients.\n\n"
+                   "Mentor engineers in deep\nlearning and data\nscience.")
+
+        full = analyzer.analyze(wrapped)
+        incremental = analyzer.analyze(wrapped, incremental=True)
+        self.assertEqual(incremental.keyword_counts, full.keyword_counts)
+        self.assertEqual(incremental.skills, full.skills)
+        for skill in ("machine learning", "react native", "gcp", "deep learning"):
+            self.assertIn(skill, incremental.skills)
+
+    def test_operations_disable_unneeded_components(self):
+        import spacy
+
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        nlp.add_pipe("entity_ruler", name="ner").add_patterns(
+            [{"label": "PRODUCT", "pattern": "tensorflow"}])
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=nlp):
+            analyzer = NLPAnalyzer()
+
+        self.assertEqual(analyzer.disabled_components(("keywords",)), ["sentencizer", "ner"])
+        self.assertEqual(analyzer.disabled_components(("skills",)), ["sentencizer"])
+
+        document = analyzer.analyze("Built models in tensorflow", ("keywords",))
+        self.assertEqual(document.operations, {"keywords"})
+        self.assertEqual(len(document.doc.entities), 0)
+
+        # Asking for skills later runs only the missing components
+        analyzer.analyze(document, ("skills",))
+        self.assertEqual(document.operations, {"keywords", "skills"})
+        self.assertEqual(document.doc.entity_texts({"PRODUCT"}), ["tensorflow"])
+
+
+class TestSemanticScoring(unittest.TestCase):
+
+    def setUp(self):
+        import numpy as np
+        import spacy
+
+        # Tokenizer-only pipeline with tiny word vectors; "ml" and "machine
+        # learning" point the same way, "cooking" elsewhere
+        nlp = spacy.blank("en")
+        for word, vector in [("ml", [1, 0, 0]), ("machine", [1, 0, 0]), ("learning", [1, 0, 0]),
+                             ("python", [0, 1, 0]), ("cooking", [0, 0, 1])]:
+            nlp.vocab.set_vector(word, np.array(vector, dtype=np.float32))
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=nlp):
+            self.analyzer = NLPAnalyzer(semantic_weight=0.5, vector_dtype="float16")
+
+    def test_vectors_are_normalized_and_cached(self):
+        import numpy as np
+
+        matrix = self.analyzer.embed(["ML python", "machine learning", "ML python"])
+        self.assertEqual(matrix.dtype, np.float16)
+        np.testing.assert_allclose(np.linalg.norm(matrix.astype(np.float32), axis=1), 1, atol=1e-3)
+        self.assertEqual(len(self.analyzer._vector_cache), 2)
+
+    def test_synonyms_raise_the_blended_score(self):
+        job = "machine learning"
+        self.assertEqual(self.analyzer.calculate_match_score("ML", job), 50)
+        self.assertEqual(self.analyzer.calculate_match_score("cooking", job), 0)
+
+        ranked = self.analyzer.rank_resumes(job, {"cook": "cooking", "ml": "ML"})
+        self.assertEqual([(r["id"], r["score"]) for r in ranked], [("ml", 50), ("cook", 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,58 @@
 import unittest
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from utils import document_parser
 from utils.document_parser import DocumentParser
 
+
+def make_docx_bytes(*paragraphs, table=None):
+    import docx
+
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    if table:
+        docx_table = document.add_table(rows=len(table), cols=len(table[0]))
+        for row, values in zip(docx_table.rows, table):
+            for cell, value in zip(row.cells, values):
+                cell.text = value
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_pdf_bytes(pages):
+    """Build a minimal text PDF with one Helvetica text block per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join("%d 0 R" % (4 + 2 * i) for i in range(len(pages))), len(pages))).encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, lines in enumerate(pages):
+        content = ("BT /F1 11 Tf 50 780 Td 14 TL %s ET" % " ".join(
+            "(%s) '" % line for line in lines)).encode("latin-1")
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            "/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i)
+        ).encode())
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref)
+    return bytes(pdf)
+
+
 class TestDocumentParser(unittest.TestCase):
     
     def test_parse_pdf(self):
@@ -30,5 +81,138 @@ class TestDocumentParser(unittest.TestCase):
         self.assertIsNotNone(text)
         self.assertTrue(len(text) > 0)
 
+    def test_parse_bytes_detects_format_from_content(self):
+        data = make_docx_bytes("Python developer", "SQL and Docker")
+        # The misleading extension is ignored in favour of the magic bytes
+        text = DocumentParser.parse_bytes(data, "resume.pdf")
+        self.assertEqual(text, "Python developer\nSQL and Docker")
+        self.assertEqual(DocumentParser.parse_stream(io.BytesIO(data)), text)
+
+    def test_parse_bytes_rejects_unknown_and_oversized_input(self):
+        self.assertIsNone(DocumentParser.parse_bytes(b"plain text resume", "resume.txt"))
+
+        data = make_docx_bytes("Python developer")
+        original_limit = DocumentParser.MAX_DOCUMENT_BYTES
+        DocumentParser.MAX_DOCUMENT_BYTES = len(data) - 1
+        try:
+            self.assertIsNone(DocumentParser.parse_bytes(data, "resume.docx"))
+        finally:
+            DocumentParser.MAX_DOCUMENT_BYTES = original_limit
+
+    def test_parallel_pdf_matches_sequential(self):
+        pages = [["Page %d python developer" % page, "SQL and Docker"] for page in range(1, 7)]
+        source = io.BytesIO(make_pdf_bytes(pages))
+
+        sequential = DocumentParser.parse_pdf(source, parallel=False)
+        parallel = DocumentParser.parse_pdf(source, parallel=True)
+        self.assertIn("Page 6 python developer", sequential)
+        self.assertEqual(parallel, sequential)
+
+    def test_parallel_pdf_sends_workers_a_path(self):
+        sources = []
+
+        def extract(source, page_numbers, page_timeout=None):
+            sources.append(source)
+            return ["page %d" % n for n in page_numbers]
+
+        with ThreadPoolExecutor(2) as pool, \
+                mock.patch.dict(DocumentParser.PDF_EXTRACTORS, {'pdfplumber': extract}), \
+                mock.patch.object(DocumentParser, '_get_pdf_pool', return_value=pool):
+            pages = DocumentParser._extract_pages_parallel(b"%PDF-1.4", [0, 1, 2], 'pdfplumber')
+
+        self.assertEqual(pages, ["page 0", "page 1", "page 2"])
+        self.assertTrue(all(isinstance(source, str) for source in sources))
+        self.assertFalse(os.path.exists(sources[0]))
+
+    def test_broken_pool_resets_only_the_pool_it_used(self):
+        current = mock.Mock()
+        with mock.patch.object(DocumentParser, '_pdf_pool', current):
+            DocumentParser._reset_pdf_pool(mock.Mock())
+            self.assertIs(DocumentParser._pdf_pool, current)
+            current.shutdown.assert_not_called()
+
+    def test_registered_extractor_with_per_page_fallback(self):
+        calls = []
+
+        def first_page_only(source, page_numbers, page_timeout=None):
+            calls.append(list(page_numbers))
+            return ["Custom page one" if n == 0 else "" for n in page_numbers]
+
+        DocumentParser.register_pdf_extractor('first_page_only', first_page_only)
+        try:
+            pdf = make_pdf_bytes([["Page one"], ["Page two"], ["Page three"]])
+            text = DocumentParser.parse_pdf(io.BytesIO(pdf), parallel=False,
+                                            extractor='first_page_only')
+        finally:
+            del DocumentParser.PDF_EXTRACTORS['first_page_only']
+
+        # Only the two empty pages are retried with the default extractor
+        self.assertEqual(calls, [[0, 1, 2]])
+        self.assertEqual(text, "Custom page one\nPage two\nPage three")
+
+    def test_extractor_is_chosen_per_page(self):
+        calls = {}
+
+        def recording(name):
+            extract = DocumentParser.PDF_EXTRACTORS[name]
+
+            def record(source, page_numbers, page_timeout=None):
+                calls[name] = list(page_numbers)
+                return extract(source, page_numbers, page_timeout)
+            return record
+
+        pdf = make_pdf_bytes([["Cover"], ["Page two"], ["Page three"]])
+        extractors = {name: recording(name) for name in ('pdfplumber', 'pypdf2')}
+        # An image-only cover page does not send the other pages to the fallback
+        with mock.patch.dict(DocumentParser.PDF_EXTRACTORS, extractors), \
+                mock.patch.object(document_parser, '_pdf_page_fonts', return_value=[False, True, True]):
+            text = DocumentParser.parse_pdf(io.BytesIO(pdf), parallel=False)
+        self.assertEqual(calls, {'pdfplumber': [1, 2], 'pypdf2': [0]})
+        self.assertIn("Page three", text)
+
+    def test_pdf_unreadable_by_pypdf2_uses_pdfplumber(self):
+        import PyPDF2
+
+        pdf = make_pdf_bytes([["Page one"], ["Page two"]])
+        with mock.patch.object(PyPDF2, 'PdfReader', side_effect=ValueError("bad xref")):
+            text = DocumentParser.parse_pdf(io.BytesIO(pdf), parallel=False)
+        self.assertEqual(text, "Page one\nPage two")
+
+    def test_streaming_docx_ignores_tab_stop_definitions(self):
+        import docx
+        from docx.shared import Inches
+
+        document = docx.Document()
+        document.add_paragraph("Summary")
+        paragraph = document.add_paragraph()
+        for position in (1, 2):
+            paragraph.paragraph_format.tab_stops.add_tab_stop(Inches(position))
+        paragraph.add_run("Skills")
+        document.add_paragraph().add_run("Python\tSQL")
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        streamed = DocumentParser.parse_docx(io.BytesIO(buffer.getvalue()))
+        self.assertEqual(streamed, "Summary\nSkills\nPython\tSQL")
+        DocumentParser.DOCX_STREAMING = False
+        try:
+            self.assertEqual(DocumentParser.parse_docx(io.BytesIO(buffer.getvalue())), streamed)
+        finally:
+            DocumentParser.DOCX_STREAMING = True
+
+    def test_streaming_docx_includes_tables(self):
+        data = make_docx_bytes("Summary", "Data engineer",
+                               table=[["Languages", "Python, SQL"], ["Tools", "Docker"]])
+        streamed = DocumentParser.parse_docx(io.BytesIO(data))
+        self.assertEqual(streamed, "Summary\nData engineer\nLanguages\nPython, SQL\nTools\nDocker")
+
+        DocumentParser.DOCX_STREAMING = False
+        try:
+            # python-docx fallback keeps body paragraphs only
+            self.assertEqual(DocumentParser.parse_docx(io.BytesIO(data)), "Summary\nData engineer")
+        finally:
+            DocumentParser.DOCX_STREAMING = True
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
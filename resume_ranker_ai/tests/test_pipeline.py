@@ -0,0 +1,102 @@
+import unittest
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.recommender import ResumeRecommender
+from utils.pipeline import discover_files, parse_executor, parse_files, parse_uploads, score_resumes
+
+JOB = "Python developer with Django, Docker and AWS experience."
+
+
+class TestPipeline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            cls.analyzer = NLPAnalyzer()
+        cls.recommender = ResumeRecommender(cls.analyzer)
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        os.makedirs(os.path.join(self.root, "team"))
+        for name, text in [("dev.txt", "Python developer using Django and Docker on AWS"),
+                           ("team/analyst.txt", "SQL and Tableau analyst"),
+                           ("empty.txt", ""),
+                           ("notes.md", "not a resume")]:
+            with open(os.path.join(self.root, name), "w", encoding="utf-8") as f:
+                f.write(text)
+
+    def test_discovers_supported_files_in_order(self):
+        found = [os.path.relpath(path, self.root) for path in discover_files(self.root)]
+        self.assertEqual(found, ["dev.txt", "empty.txt", os.path.join("team", "analyst.txt")])
+
+    def test_results_match_direct_scoring(self):
+        for workers in (1, 2):
+            parsed = parse_files(discover_files(self.root), workers=workers, max_pending=1)
+            results = {os.path.basename(result["file"]): result
+                       for result in score_resumes(self.analyzer, self.recommender, JOB, parsed,
+                                                   batch_size=1)}
+
+            self.assertEqual(set(results), {"dev.txt", "analyst.txt", "empty.txt"})
+            self.assertIn("error", results["empty.txt"])
+            self.assertEqual(results["dev.txt"]["score"], self.analyzer.calculate_match_score(
+                "Python developer using Django and Docker on AWS", JOB))
+            self.assertGreater(results["dev.txt"]["score"], results["analyst.txt"]["score"])
+
+    def test_parse_uploads_bounds_work_in_flight(self):
+        import docx
+
+        def upload(name, text):
+            document = docx.Document()
+            document.add_paragraph(text)
+            stream = io.BytesIO()
+            document.save(stream)
+            stream.name = name
+            return stream
+
+        uploads = [upload(f"resume_{i}.docx", f"Python developer number {i}") for i in range(6)]
+        broken = io.BytesIO(b"not a document")
+        broken.name = "broken.pdf"
+
+        submitted = []
+        parsed = {}
+        peak = 0
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, function, *args):
+                # Submitted but not yet handed back to the caller
+                nonlocal peak
+                submitted.append(args)
+                peak = max(peak, len(submitted) - len(parsed))
+                return super().submit(function, *args)
+
+        with CountingExecutor(max_workers=4) as executor:
+            for name, text in parse_uploads(executor, uploads + [broken], max_pending=2):
+                parsed[name] = text
+
+        self.assertEqual(peak, 2)
+        self.assertIsNone(parsed.pop("broken.pdf"))
+        self.assertEqual(parsed, {f"resume_{i}.docx": f"Python developer number {i}"
+                                  for i in range(6)})
+
+    def test_parse_uploads_in_process_pool(self):
+        import docx
+
+        document = docx.Document()
+        document.add_paragraph("Python developer")
+        stream = io.BytesIO()
+        document.save(stream)
+        stream.name = "resume.docx"
+
+        with parse_executor(max_workers=1) as executor:
+            parsed = dict(parse_uploads(executor, [stream]))
+        self.assertEqual(parsed, {"resume.docx": "Python developer"})
+
+
+if __name__ == '__main__':
+    unittest.main()
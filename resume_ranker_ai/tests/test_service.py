@@ -0,0 +1,121 @@
+import unittest
+import asyncio
+import json
+from unittest import mock
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.recommender import ResumeRecommender
+from utils.service import ScoringService
+
+JOB = "Python developer with Django, Docker and AWS experience."
+RESUMES = [
+    "Python developer using Django and Docker on AWS",
+    "SQL and Tableau analyst",
+    "Pastry chef baking bread",
+    "",
+]
+
+
+async def request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+async def send_raw(port, data):
+    """Send data as is; returns the response status."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data.encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split()[1])
+
+
+class TestScoringService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            cls.analyzer = NLPAnalyzer()
+        cls.recommender = ResumeRecommender(cls.analyzer)
+
+    def run_with_service(self, client, **options):
+        async def main():
+            service = ScoringService(self.analyzer, self.recommender, **options)
+            server = await service.start("127.0.0.1", 0)
+            try:
+                return service, await client(server.sockets[0].getsockname()[1])
+            finally:
+                await service.close()
+        return asyncio.run(main())
+
+    def test_concurrent_requests_share_batches(self):
+        async def client(port):
+            return await asyncio.gather(*[
+                request(port, "POST", "/match", {"resume": resume, "job": JOB})
+                for resume in RESUMES
+            ])
+
+        service, responses = self.run_with_service(client, max_batch_size=8, max_wait=0.05)
+        self.assertLess(service.batcher.batches, len(RESUMES))
+        for resume, (status, result) in zip(RESUMES, responses):
+            self.assertEqual(status, 200)
+            self.assertEqual(result["match_score"], self.analyzer.calculate_match_score(resume, JOB))
+            self.assertEqual(sorted(result["missing_keywords"]),
+                             sorted(self.analyzer.find_missing_keywords(resume, JOB)))
+
+    def test_health_and_errors(self):
+        async def client(port):
+            return [
+                await request(port, "GET", "/health"),
+                await request(port, "POST", "/match", {"resume": "only a resume"}),
+                await request(port, "GET", "/match"),
+                await request(port, "GET", "/missing"),
+            ]
+
+        _, responses = self.run_with_service(client)
+        status, health = responses[0]
+        self.assertEqual(status, 200)
+        self.assertEqual(health["mode"], "fallback")
+        self.assertTrue(health["ready"])
+        self.assertEqual([status for status, _ in responses[1:]], [400, 405, 404])
+
+    def test_invalid_content_length_is_rejected(self):
+        async def client(port):
+            return [await send_raw(port, f"POST /match HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}")
+                    for length in ("-2", "abc", "+2", "1_0")]
+
+        _, statuses = self.run_with_service(client)
+        self.assertEqual(statuses, [400, 400, 400, 400])
+
+    def test_unsupported_requests_are_rejected(self):
+        async def client(port):
+            return [
+                await send_raw(port, "POST /match HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                     "2\r\n{}\r\n0\r\n\r\n"),
+                await send_raw(port, "POST /match HTTP/1.1\r\nX-Long: " + "a" * 70000 + "\r\n\r\n"),
+            ]
+
+        _, statuses = self.run_with_service(client)
+        self.assertEqual(statuses, [501, 431])
+
+    def test_batches_reuse_precomputed_documents(self):
+        job = self.analyzer.analyze(JOB)
+        with mock.patch.dict(self.analyzer.precomputed, {JOB: job}), \
+                mock.patch.object(self.analyzer, 'analyze_many', wraps=self.analyzer.analyze_many) as many:
+            service = ScoringService(self.analyzer, self.recommender)
+            results = service.batcher.match_batch([(resume, JOB) for resume in RESUMES[:2]])
+        many.assert_called_once()
+        self.assertEqual(many.call_args[0][0], RESUMES[:2])
+        self.assertEqual([result["match_score"] for result in results],
+                         [self.analyzer.calculate_match_score(resume, job) for resume in RESUMES[:2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from unittest import mock
+from utils.skill_taxonomy import SkillTaxonomy
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.recommender import ResumeRecommender
+
+
+class TestSkillTaxonomy(unittest.TestCase):
+
+    def setUp(self):
+        self.taxonomy = SkillTaxonomy({
+            "kubernetes": ["k8s"],
+            "node.js": ["nodejs", "node js"],
+            "react": ["reactjs"],
+            "react native": [],
+            "c++": ["cpp"],
+        })
+
+    def test_aliases_map_to_canonical_ids(self):
+        skills = self.taxonomy.find("Deployed Node JS services on K8s, some C++ and cpp.")
+        self.assertEqual(skills, ["node.js", "kubernetes", "c++"])
+        self.assertEqual(self.taxonomy.canonical("NodeJS"), "node.js")
+        self.assertIsNone(self.taxonomy.canonical("node"))
+
+    def test_longest_match_wins(self):
+        self.assertEqual(self.taxonomy.find("React Native and ReactJS"), ["react native", "react"])
+
+    def test_missing_skills_compare_canonical_ids(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer(skill_taxonomy=self.taxonomy)
+        resume = "built services with nodejs"
+        job = "we run node.js on kubernetes"
+
+        self.assertEqual(analyzer.find_missing_skills(resume, job), ["kubernetes"])
+        recommendations = ResumeRecommender(analyzer).generate_recommendations(resume, job)
+        skills = [r["content"] for r in recommendations if r["type"] == "missing_skills"]
+        self.assertEqual(skills, [["kubernetes"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
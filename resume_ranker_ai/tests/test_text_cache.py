@@ -0,0 +1,38 @@
+import unittest
+import os
+import tempfile
+from utils.text_cache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+
+    def test_key_depends_on_content_and_version(self):
+        key = TextCache.make_key(b"resume bytes", "1", ".pdf")
+        self.assertEqual(key, TextCache.make_key(b"resume bytes", "1", ".pdf"))
+        self.assertNotEqual(key, TextCache.make_key(b"resume bytes", "2", ".pdf"))
+        self.assertNotEqual(key, TextCache.make_key(b"other bytes", "1", ".pdf"))
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = TextCache(max_chars=10)
+        cache.set("a", "aaaa")
+        cache.set("b", "bbbb")
+        self.assertEqual(cache.get("a"), "aaaa")
+        cache.set("c", "cccc")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "aaaa")
+        self.assertEqual(cache.get("c"), "cccc")
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_disk_tier_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "text_cache.sqlite3")
+            TextCache(db_path=db_path).set("key", "extracted text")
+
+            other = TextCache(db_path=db_path)
+            self.assertEqual(other.get("key"), "extracted text")
+            self.assertIsNone(other.get("missing"))
+
+
+if __name__ == '__main__':
+    unittest.main()
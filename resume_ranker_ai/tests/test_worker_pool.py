@@ -0,0 +1,124 @@
+import unittest
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from unittest import mock
+from utils import worker_pool
+from utils.nlp_analyzer import NLPAnalyzer
+from utils.recommender import ResumeRecommender
+from utils.worker_pool import AnalysisPool
+
+RESUME = "Python developer with SQL, Docker and AWS experience building data pipelines."
+JOB = "Seeking a Python engineer with Docker, Kubernetes and AWS cloud experience."
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "requires fork")
+class TestAnalysisPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            cls.analyzer = NLPAnalyzer()
+
+    def test_results_match_in_process_analysis(self):
+        recommender = ResumeRecommender(self.analyzer)
+        with AnalysisPool(self.analyzer, processes=2, start_method="fork") as pool:
+            result = pool.analyze_match(RESUME, JOB)
+            self.assertEqual(pool.calculate_match_score(RESUME, JOB), result["match_score"])
+
+        self.assertEqual(result["match_score"], self.analyzer.calculate_match_score(RESUME, JOB))
+        self.assertEqual(result["recommendations"],
+                         recommender.generate_recommendations(RESUME, JOB))
+        self.assertEqual(sorted(result["missing_keywords"]),
+                         sorted(self.analyzer.find_missing_keywords(RESUME, JOB)))
+
+    def test_bounded_queue_with_recycled_workers(self):
+        pairs = [(RESUME, JOB)] * 12
+        with AnalysisPool(self.analyzer, processes=2, max_tasks_per_child=2,
+                          max_pending=3, start_method="fork") as pool:
+            scores = [result["match_score"] for result in pool.analyze_matches(pairs)]
+        self.assertEqual(scores, [self.analyzer.calculate_match_score(RESUME, JOB)] * 12)
+
+    def test_workers_are_replaced_after_max_tasks(self):
+        with AnalysisPool(self.analyzer, processes=1, max_tasks_per_child=2,
+                          start_method="fork") as pool:
+            pids = [pool._pool.apply(os.getpid) for _ in range(6)]
+        self.assertEqual(pids[0], pids[1])
+        self.assertEqual(len(set(pids)), 3)
+
+    def test_submit_blocks_at_max_pending(self):
+        def sleep(analyzer, recommender, seconds):
+            time.sleep(seconds)
+
+        # Forked workers see the patched task table
+        with mock.patch.dict(worker_pool._TASKS, {"sleep": sleep}):
+            with AnalysisPool(self.analyzer, processes=2, max_pending=1, start_method="fork") as pool:
+                running = pool.submit("sleep", 0.5)
+                # A second worker is idle, but the one slot is taken
+                with self.assertRaises(TimeoutError):
+                    pool.submit("sleep", 0, timeout=0.05)
+                running.get()
+                pool.submit("sleep", 0, timeout=1).get()
+
+    def test_hung_worker_falls_back_to_in_process_analysis(self):
+        parent = os.getpid()
+
+        def hang_in_worker(analyzer, recommender, resume_text, job_text):
+            if os.getpid() != parent:
+                time.sleep(2)
+            return "in process"
+
+        with mock.patch.dict(worker_pool._TASKS, {"analyze_match": hang_in_worker}):
+            pool = AnalysisPool(self.analyzer, processes=1, start_method="fork", task_timeout=0.2)
+            try:
+                self.assertEqual(pool.analyze_match(RESUME, JOB), "in process")
+                self.assertEqual(list(pool.analyze_matches([(RESUME, JOB)] * 2)), ["in process"] * 2)
+            finally:
+                pool.terminate()
+
+    @unittest.skipUnless("forkserver" in multiprocessing.get_all_start_methods(),
+                         "requires forkserver")
+    def test_forkserver_workers_match_in_process_analysis(self):
+        # Lite mode, so workers that build their own analyzer load no model
+        analyzer = NLPAnalyzer(lite=True)
+        with AnalysisPool(analyzer, processes=1, start_method="forkserver") as pool:
+            self.assertEqual(pool.calculate_match_score(RESUME, JOB),
+                             analyzer.calculate_match_score(RESUME, JOB))
+
+    def test_default_start_method_avoids_fork_with_threads(self):
+        started = threading.Event()
+        stop = threading.Event()
+        thread = threading.Thread(target=lambda: (started.set(), stop.wait()))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+        started.wait()
+        self.assertNotEqual(worker_pool._default_start_method(), "fork")
+
+
+class TestWorkerSettings(unittest.TestCase):
+
+    def test_unforked_workers_rebuild_the_full_analyzer(self):
+        with mock.patch.object(NLPAnalyzer, '_load_spacy_model', return_value=None):
+            analyzer = NLPAnalyzer(semantic_weight=0.3, vector_dtype="float16", lite=True)
+        analyzer.precomputed[JOB] = analyzer.analyze(JOB)
+
+        # Start methods other than fork pickle the initializer arguments
+        settings, precomputed = pickle.loads(pickle.dumps(
+            (worker_pool._analyzer_settings(analyzer), analyzer.precomputed)))
+        worker_pool._init_worker(None, settings, precomputed)
+        self.addCleanup(setattr, worker_pool, "_worker_analyzer", None)
+        self.addCleanup(setattr, worker_pool, "_worker_recommender", None)
+
+        worker = worker_pool._worker_analyzer
+        self.assertEqual(worker.model_id(), analyzer.model_id())
+        self.assertEqual((worker.semantic_weight, worker.vector_dtype, worker.lite),
+                         (0.3, "float16", True))
+        self.assertEqual(worker.analyze(JOB).keyword_counts, analyzer.analyze(JOB).keyword_counts)
+        self.assertIn(JOB, worker.precomputed)
+
+
+if __name__ == '__main__':
+    unittest.main()
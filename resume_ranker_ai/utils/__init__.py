@@ -1 +1,38 @@
-# This file is intentionally left empty to make the directory a Python package
\ No newline at end of file
+"""
+Utils package for the resume ranker.
+
+Classes are exposed as lazy module attributes: `from utils import NLPAnalyzer`
+imports only nlp_analyzer, and heavy dependencies (spaCy, scikit-learn,
+pdfplumber, PyPDF2, python-docx) load on first use inside each module.
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'DocumentParser': 'document_parser',
+    'TextCache': 'text_cache',
+    'NLPAnalyzer': 'nlp_analyzer',
+    'AnalyzedDocument': 'nlp_analyzer',
+    'ResumeRecommender': 'recommender',
+    'MatchIndex': 'matcher',
+    'AnalysisPool': 'worker_pool',
+    'IDFModel': 'idf_model',
+    'SkillTaxonomy': 'skill_taxonomy',
+    'NearDuplicateFinder': 'dedup',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,275 @@
+"""
+Compact, array-backed stand-in for an analyzed spaCy Doc.
+
+Keyword and skill extraction only read each token's lowercase form, part of
+speech, stop flag and position, plus entity and noun chunk spans. CompactDoc
+keeps exactly that as NumPy arrays taken from Doc.to_array, roughly an order
+of magnitude smaller than the Doc with its tensors and per-token structs, and
+needs no Vocab to be read back.
+
+Lowercase forms are stored as ids into a table of distinct words (packed
+UTF-8), so counting is a vectorized unique/count over ids. Many documents
+can be saved as one set of .npy arrays (CompactDoc.save_many) and
+memory-mapped on load.
+"""
+
+import os
+from collections import Counter
+
+# Arrays written by save_many / to_arrays; see to_arrays for their layout
+ARRAY_NAMES = ("words", "word_offsets", "word_ids", "pos", "is_stop", "idx", "length",
+               "token_offsets", "entities", "entity_labels", "entity_offsets", "chunks", "chunk_offsets",
+               "text", "text_offsets")
+
+
+class CompactDoc:
+    """Token arrays of one document: only what keyword and skill extraction read."""
+
+    __slots__ = ("text", "words", "word_offsets", "word_ids", "pos", "is_stop", "idx",
+                 "length", "entities", "entity_labels", "chunks")
+
+    def __init__(self, text, words, word_offsets, word_ids, pos, is_stop, idx, length,
+                 entities, entity_labels, chunks):
+        self.text = text
+        # Distinct lowercase forms (possibly shared by many documents) as one
+        # UTF-8 buffer, word i at words[word_offsets[i]:word_offsets[i + 1]],
+        # and per token the id of its form
+        self.words = words
+        self.word_offsets = word_offsets
+        self.word_ids = word_ids
+        # Per token: coarse POS symbol id, spaCy stop flag, character offset
+        # in text and length in characters
+        self.pos = pos
+        self.is_stop = is_stop
+        self.idx = idx
+        self.length = length
+        # (start, end) token spans, with one label per entity
+        self.entities = entities
+        self.entity_labels = entity_labels
+        self.chunks = chunks
+
+    @classmethod
+    def from_doc(cls, doc):
+        """Build from a spaCy Doc; noun chunks are kept only if it was parsed."""
+        import numpy as np
+        from spacy.attrs import IDX, IS_STOP, LENGTH, LOWER, POS
+
+        arrays = doc.to_array([LOWER, POS, IS_STOP, IDX, LENGTH])
+        if not len(doc):
+            arrays = arrays.reshape(0, 5)
+        hashes, word_ids = np.unique(arrays[:, 0], return_inverse=True)
+        strings = doc.vocab.strings
+        words, word_offsets = _pack_words([strings[int(key)] for key in hashes])
+
+        chunks = doc.noun_chunks if doc.has_annotation("DEP") else []
+        return cls(
+            doc.text,
+            words,
+            word_offsets,
+            word_ids.astype(np.int32),
+            # POS symbol ids (ADJ=84 ... SPACE=103) fit in a byte
+            arrays[:, 1].astype(np.uint8),
+            arrays[:, 2].astype(bool),
+            arrays[:, 3].astype(np.int32),
+            arrays[:, 4].astype(np.int32),
+            np.array([(ent.start, ent.end) for ent in doc.ents], dtype=np.int32).reshape(-1, 2),
+            np.array([ent.label_ for ent in doc.ents], dtype=str),
+            np.array([(chunk.start, chunk.end) for chunk in chunks], dtype=np.int32).reshape(-1, 2),
+        )
+
+    def __len__(self):
+        return len(self.word_ids)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the arrays (text excluded)."""
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if name != "text")
+
+    def word(self, word_id):
+        """Lowercase form with id word_id."""
+        start, end = self.word_offsets[word_id], self.word_offsets[word_id + 1]
+        return bytes(self.words[start:end]).decode("utf-8")
+
+    def span_text(self, start, end):
+        """Text of tokens start..end-1."""
+        if end <= start:
+            return ""
+        return self.text[self.idx[start]:self.idx[end - 1] + self.length[end - 1]]
+
+    def count_words(self, mask, exclude=()):
+        """Counter of the lowercase forms of tokens selected by mask.
+
+        Forms in exclude are dropped. Keys are inserted in order of first
+        occurrence, so most_common breaks ties as a token-by-token count would.
+        """
+        import numpy as np
+
+        ids, first, counts = np.unique(self.word_ids[mask], return_index=True, return_counts=True)
+        keywords = Counter()
+        for position in np.argsort(first, kind="stable"):
+            word = self.word(ids[position])
+            if word not in exclude:
+                keywords[word] = int(counts[position])
+        return keywords
+
+    def entity_texts(self, labels):
+        """Lowercased text of entities with one of labels, in document order."""
+        import numpy as np
+
+        selected = np.isin(self.entity_labels, list(labels))
+        return [self.span_text(start, end).lower() for start, end in self.entities[selected]]
+
+    def chunk_texts(self):
+        """Lowercased text of noun chunks that contain no stop words, in document order."""
+        import numpy as np
+
+        stops = np.concatenate([[0], np.cumsum(self.is_stop, dtype=np.int64)])
+        starts, ends = self.chunks[:, 0], self.chunks[:, 1]
+        clean = stops[ends] - stops[starts] == 0
+        return [self.span_text(start, end).lower() for start, end in self.chunks[clean]]
+
+    @classmethod
+    def concat(cls, docs, separator=" "):
+        """One CompactDoc for the texts of docs joined with separator."""
+        import numpy as np
+
+        docs = list(docs)
+        words, word_offsets, word_ids = _merge_words(docs)
+        char_offsets = np.cumsum([0] + [len(doc.text) + len(separator) for doc in docs[:-1]])
+        token_offsets = np.cumsum([0] + [len(doc) for doc in docs[:-1]])
+        return cls(
+            separator.join(doc.text for doc in docs),
+            words,
+            word_offsets,
+            _concatenate(word_ids, np.int32),
+            _concatenate([doc.pos for doc in docs], np.uint8),
+            _concatenate([doc.is_stop for doc in docs], bool),
+            _concatenate([doc.idx + offset for doc, offset in zip(docs, char_offsets)], np.int32),
+            _concatenate([doc.length for doc in docs], np.int32),
+            _concatenate([doc.entities + offset for doc, offset in zip(docs, token_offsets)],
+                         np.int32).reshape(-1, 2),
+            _concatenate([doc.entity_labels for doc in docs], str),
+            _concatenate([doc.chunks + offset for doc, offset in zip(docs, token_offsets)],
+                         np.int32).reshape(-1, 2),
+        )
+
+    @staticmethod
+    def to_arrays(docs):
+        """Pack docs into one dict of arrays (see ARRAY_NAMES).
+
+        Per-token arrays are concatenated with token_offsets marking where each
+        document starts; entities, chunks and the UTF-8 text likewise use
+        entity_offsets, chunk_offsets and text_offsets. Word ids index one
+        shared word table.
+        """
+        import numpy as np
+
+        docs = list(docs)
+        words, word_offsets, word_ids = _merge_words(docs)
+        texts = [doc.text.encode("utf-8") for doc in docs]
+
+        def offsets(lengths):
+            return np.cumsum([0] + list(lengths), dtype=np.int64)
+
+        return {
+            "words": words,
+            "word_offsets": word_offsets,
+            "word_ids": _concatenate(word_ids, np.int32),
+            "pos": _concatenate([doc.pos for doc in docs], np.uint8),
+            "is_stop": _concatenate([doc.is_stop for doc in docs], bool),
+            "idx": _concatenate([doc.idx for doc in docs], np.int32),
+            "length": _concatenate([doc.length for doc in docs], np.int32),
+            "token_offsets": offsets(len(doc) for doc in docs),
+            "entities": _concatenate([doc.entities for doc in docs], np.int32).reshape(-1, 2),
+            "entity_labels": _concatenate([doc.entity_labels for doc in docs], str),
+            "entity_offsets": offsets(len(doc.entities) for doc in docs),
+            "chunks": _concatenate([doc.chunks for doc in docs], np.int32).reshape(-1, 2),
+            "chunk_offsets": offsets(len(doc.chunks) for doc in docs),
+            "text": np.frombuffer(b"".join(texts), dtype=np.uint8),
+            "text_offsets": offsets(len(text) for text in texts),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Unpack to_arrays output; documents are views into the arrays."""
+        token_offsets = arrays["token_offsets"]
+        entity_offsets = arrays["entity_offsets"]
+        chunk_offsets = arrays["chunk_offsets"]
+        text_offsets = arrays["text_offsets"]
+        text = arrays["text"]
+
+        docs = []
+        for i in range(len(token_offsets) - 1):
+            tokens = slice(token_offsets[i], token_offsets[i + 1])
+            entities = slice(entity_offsets[i], entity_offsets[i + 1])
+            docs.append(cls(
+                bytes(text[text_offsets[i]:text_offsets[i + 1]]).decode("utf-8"),
+                arrays["words"],
+                arrays["word_offsets"],
+                arrays["word_ids"][tokens],
+                arrays["pos"][tokens],
+                arrays["is_stop"][tokens],
+                arrays["idx"][tokens],
+                arrays["length"][tokens],
+                arrays["entities"][entities],
+                arrays["entity_labels"][entities],
+                arrays["chunks"][chunk_offsets[i]:chunk_offsets[i + 1]],
+            ))
+        return docs
+
+    @staticmethod
+    def save_many(directory, docs):
+        """Write docs as one .npy file per array."""
+        import numpy as np
+
+        os.makedirs(directory, exist_ok=True)
+        for name, array in CompactDoc.to_arrays(docs).items():
+            np.save(os.path.join(directory, f"{name}.npy"), array)
+
+    @classmethod
+    def load_many(cls, directory, mmap=True):
+        """Load docs saved with save_many; arrays are memory-mapped read-only by default."""
+        import numpy as np
+
+        mmap_mode = "r" if mmap else None
+        return cls.from_arrays({
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in ARRAY_NAMES
+        })
+
+
+def _pack_words(words):
+    """Words as one UTF-8 buffer and the offsets of each word in it."""
+    import numpy as np
+
+    encoded = [word.encode("utf-8") for word in words]
+    offsets = np.cumsum([0] + [len(word) for word in encoded], dtype=np.int64)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _merge_words(docs):
+    """One packed word table for docs, and each doc's word ids remapped into it."""
+    import numpy as np
+
+    table = {}
+    remaps = {}
+    word_ids = []
+    for doc in docs:
+        # Documents unpacked from one file share a table; map it only once
+        remap = remaps.get(id(doc.words))
+        if remap is None:
+            remap = remaps[id(doc.words)] = np.array(
+                [table.setdefault(doc.word(i), len(table)) for i in range(len(doc.word_offsets) - 1)],
+                dtype=np.int32)
+        word_ids.append(remap[doc.word_ids] if len(remap) else doc.word_ids)
+    words, word_offsets = _pack_words(list(table))
+    return words, word_offsets, word_ids
+
+
+def _concatenate(arrays, dtype):
+    import numpy as np
+
+    arrays = list(arrays)
+    if not arrays:
+        return np.array([], dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
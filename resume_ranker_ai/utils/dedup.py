@@ -0,0 +1,91 @@
+import zlib
+
+# Mersenne prime above 2**32 for the (a * x + b) mod p hash family
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class NearDuplicateFinder:
+    """Group near-identical texts with MinHash signatures and LSH banding.
+
+    Each text is reduced to the set of its word shingles and summarized by a
+    MinHash signature, whose agreement rate estimates Jaccard similarity.
+    Signatures are split into bands; texts sharing any band land in the same
+    bucket and only those candidates are compared, so grouping a pool is
+    roughly linear in its size rather than quadratic.
+    """
+
+    def __init__(self, threshold=0.9, num_perm=128, shingle_size=5, seed=1):
+        import numpy as np
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.rows = self._band_rows(threshold, num_perm)
+        self.bands = num_perm // self.rows
+
+        generator = np.random.RandomState(seed)
+        # a < 2**29 keeps a * x + b below 2**61 for 32-bit x, so uint64 never overflows
+        self._a = generator.randint(1, 1 << 29, size=num_perm).astype(np.uint64)
+        self._b = generator.randint(0, 1 << 29, size=num_perm).astype(np.uint64)
+
+    def signature(self, processed_text):
+        """MinHash signature of a preprocessed text (None if it has no words)."""
+        import numpy as np
+
+        words = processed_text.split()
+        if not words:
+            return None
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+        hashes = np.fromiter((zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        permuted = (hashes[:, None] * self._a + self._b) % _PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+    def group(self, processed_texts):
+        """Representative index for each text: the first text of its cluster.
+
+        Texts i and j end up in one cluster when a chain of pairs with
+        estimated Jaccard similarity >= threshold links them. Texts without
+        words are never grouped.
+        """
+        signatures = [self.signature(text) for text in processed_texts]
+        parents = list(range(len(signatures)))
+
+        def find(index):
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        for band in range(self.bands):
+            start, end = band * self.rows, (band + 1) * self.rows
+            buckets = {}
+            for index, signature in enumerate(signatures):
+                if signature is None:
+                    continue
+                members = buckets.setdefault(signature[start:end].tobytes(), [])
+                # Every member is compared, so chains of near-duplicates link up
+                for member in members:
+                    root, member_root = find(index), find(member)
+                    if root == member_root:
+                        continue
+                    if self.similarity(signature, signatures[member]) >= self.threshold:
+                        # The earliest text stays the representative
+                        parents[max(root, member_root)] = min(root, member_root)
+                members.append(index)
+
+        return [find(index) for index in range(len(signatures))]
+
+    @staticmethod
+    def similarity(signature_a, signature_b):
+        """Estimated Jaccard similarity of the texts behind two signatures."""
+        return float((signature_a == signature_b).mean())
+
+    @staticmethod
+    def _band_rows(threshold, num_perm):
+        """Rows per band whose LSH threshold (1/bands)**(1/rows) is closest to threshold."""
+        divisors = [rows for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+        return min(divisors, key=lambda rows: abs((rows / num_perm) ** (1 / rows) - threshold))
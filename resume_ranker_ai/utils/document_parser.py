@@ -1,46 +1,373 @@
-import PyPDF2
-import pdfplumber
-import docx
+# PDF and DOCX libraries are imported where they are used, so importing this
+# module (e.g. for the streaming DOCX path) does not load all of them
+import io
 import os
+import signal
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import nullcontext
+from itertools import islice
+from . import metrics
+from .text_cache import TextCache
 
 class DocumentParser:
     """Parse PDF and DOCX documents to extract text content."""
+
+    # Bump whenever extraction output changes so cached text is not reused
+    PARSER_VERSION = "4"
+
+    # Optional TextCache consulted by parse_document (disabled by default)
+    cache = None
+
+    # Largest document parse_bytes / parse_stream will accept (None for no limit)
+    MAX_DOCUMENT_BYTES = 20 * 1024 * 1024
+
+    # File extensions and MIME types accepted as a format hint
+    FORMAT_HINTS = {
+        '.pdf': 'pdf',
+        'application/pdf': 'pdf',
+        '.docx': 'docx',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    }
+
+    # PDFs with at least this many pages are extracted by a process pool
+    PARALLEL_MIN_PAGES = 24
+
+    # Worker processes for parallel extraction (None uses os.cpu_count())
+    PDF_WORKERS = None
+
+    # Pages extracted per document (None for no limit)
+    PDF_PAGE_BUDGET = None
+
+    # Seconds a single page may take in a worker before it is skipped
+    PDF_PAGE_TIMEOUT = 10
+
+    # Registered PDF extractors (see register_pdf_extractor)
+    PDF_EXTRACTORS = {}
+    PDF_EXTRACTOR = 'pdfplumber'
+    PDF_FALLBACK_EXTRACTOR = 'pypdf2'
+
+    # Read DOCX text straight from word/document.xml (python-docx as fallback)
+    DOCX_STREAMING = True
+
+    _pdf_pool = None
+    _pdf_pool_lock = threading.Lock()
+
+    @classmethod
+    def enable_cache(cls, max_chars=32 * 1024 * 1024, db_path=None):
+        """Cache extracted text keyed on file contents; returns the cache."""
+        cls.cache = TextCache(max_chars=max_chars, db_path=db_path)
+        return cls.cache
     
     @staticmethod
-    def parse_pdf(file_path):
-        """Extract text from PDF files using pdfplumber for better text extraction."""
-        text = ""
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-            
-            # If pdfplumber fails to extract text, try PyPDF2 as fallback
-            if not text.strip():
-                with open(file_path, 'rb') as file:
-                    reader = PyPDF2.PdfReader(file)
-                    for page_num in range(len(reader.pages)):
-                        text += reader.pages[page_num].extract_text() or ""
-        except Exception as e:
-            print(f"Error parsing PDF: {e}")
-            return None
+    def parse_pdf(file_path, parallel=None, extractor=None):
+        """Extract text from PDF files using pdfplumber for better text extraction.
+
+        Accepts a file path or a seekable binary file object. A cheap pre-check
+        of each page's resources picks its extractor: PDF_EXTRACTOR for pages
+        with fonts, PDF_FALLBACK_EXTRACTOR for pages without a text layer.
+        Pages that come back empty but have fonts are retried with the other
+        extractor. PDFs PyPDF2 cannot read skip the pre-check and go to
+        PDF_EXTRACTOR. Pass extractor to force a registered backend, e.g.
+        when benchmarking.
+
+        Long documents (PARALLEL_MIN_PAGES or more) are split across a process
+        pool unless parallel is False; parallel=True forces the pool. Pages
+        are joined with newlines so words at page boundaries stay apart.
+        """
+        with metrics.timer("parse_pdf"):
+            primary = DocumentParser.PDF_EXTRACTOR
+            fallback = DocumentParser.PDF_FALLBACK_EXTRACTOR
+            try:
+                fonts = _pdf_page_fonts(file_path, DocumentParser.PDF_PAGE_BUDGET)
+                page_count = len(fonts) if fonts is not None else _pdf_page_count(file_path)
+                if DocumentParser.PDF_PAGE_BUDGET is not None:
+                    page_count = min(page_count, DocumentParser.PDF_PAGE_BUDGET)
+                metrics.observe("pages", page_count)
+
+                page_numbers = list(range(page_count))
+                if extractor is not None or fonts is None:
+                    assignments = {extractor or primary: page_numbers}
+                else:
+                    assignments = {
+                        primary: [n for n in page_numbers if fonts[n]],
+                        fallback: [n for n in page_numbers if not fonts[n]],
+                    }
+
+                if parallel is None:
+                    # A pool only pays off with several cores and many pages
+                    workers = DocumentParser.PDF_WORKERS or os.cpu_count() or 1
+                    parallel = workers > 1 and page_count >= DocumentParser.PARALLEL_MIN_PAGES
+
+                pages = [""] * page_count
+                for name, numbers in assignments.items():
+                    if not numbers:
+                        continue
+                    metrics.increment("pdf_extractor", len(numbers), extractor=name)
+                    extracted = DocumentParser._extract_pages(file_path, numbers, name, parallel)
+                    for page_number, page_text in zip(numbers, extracted):
+                        pages[page_number] = page_text
+
+                    # Retry only empty pages that have fonts; image-only pages have
+                    # no text for any extractor to find
+                    retry_extractor = fallback if name == primary else primary
+                    empty = [n for n in numbers
+                             if not pages[n].strip() and fonts is not None and fonts[n]]
+                    if empty and retry_extractor != name:
+                        metrics.increment("pdf_page_retry", len(empty), extractor=retry_extractor)
+                        retried = DocumentParser._extract_pages(
+                            file_path, empty, retry_extractor, parallel=False)
+                        for page_number, page_text in zip(empty, retried):
+                            pages[page_number] = page_text
+
+                text = "\n".join(pages)
+            except Exception as e:
+                print(f"Error parsing PDF: {e}")
+                return None
         
+        metrics.observe("characters", len(text))
         return text.strip()
-    
+
+    @classmethod
+    def register_pdf_extractor(cls, name, extract):
+        """Register a PDF text extractor under name.
+
+        extract(source, page_numbers, page_timeout=None) receives a path,
+        bytes or binary file object and zero-based page numbers, and returns
+        one text string per page. Parallel workers look extractors up by name,
+        so register them at import time of an importable module.
+        """
+        cls.PDF_EXTRACTORS[name] = extract
+
+    @classmethod
+    def _extract_pages(cls, source, page_numbers, extractor, parallel):
+        """Extract the given pages with a registered extractor, in page order."""
+        if not page_numbers:
+            return []
+        if parallel:
+            return cls._extract_pages_parallel(source, page_numbers, extractor)
+        return list(cls.PDF_EXTRACTORS[extractor](source, page_numbers))
+
+    @classmethod
+    def _extract_pages_parallel(cls, file_path, page_numbers, extractor):
+        """Extract pages in a process pool, returned in page order.
+
+        In-memory PDFs are written to a temporary file once, so workers
+        receive a path rather than a copy of the bytes with every chunk.
+        """
+        import tempfile
+        from concurrent.futures.process import BrokenProcessPool
+
+        temp_path = None
+        if hasattr(file_path, 'read') or isinstance(file_path, (bytes, bytearray, memoryview)):
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp:
+                if hasattr(file_path, 'read'):
+                    file_path.seek(0)
+                    temp.write(file_path.read())
+                else:
+                    temp.write(file_path)
+            source = temp_path = temp.name
+        else:
+            source = file_path
+
+        workers = cls.PDF_WORKERS or os.cpu_count() or 1
+        # A few ranges per worker keeps the pool busy when pages vary in cost
+        pages_per_task = max(1, -(-len(page_numbers) // (workers * 4)))
+        chunks = [page_numbers[i:i + pages_per_task]
+                  for i in range(0, len(page_numbers), pages_per_task)]
+
+        try:
+            pool = cls._get_pdf_pool()
+            futures = [pool.submit(_extract_pdf_pages, source, chunk, cls.PDF_PAGE_TIMEOUT, extractor)
+                       for chunk in chunks]
+
+            pages = []
+            broken = False
+            for chunk, future in zip(chunks, futures):
+                try:
+                    pages.extend(future.result())
+                except BrokenProcessPool as e:
+                    print(f"Error extracting PDF pages {chunk[0] + 1}-{chunk[-1] + 1}: {e}")
+                    if not broken:
+                        broken = True
+                        cls._reset_pdf_pool(pool)
+                    pages.extend([""] * len(chunk))
+                except Exception as e:
+                    print(f"Error extracting PDF pages {chunk[0] + 1}-{chunk[-1] + 1}: {e}")
+                    pages.extend([""] * len(chunk))
+            return pages
+        finally:
+            if temp_path is not None:
+                os.unlink(temp_path)
+
+    @classmethod
+    def _get_pdf_pool(cls):
+        """Process pool shared by all parallel PDF extractions."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        with cls._pdf_pool_lock:
+            if cls._pdf_pool is None:
+                cls._pdf_pool = ProcessPoolExecutor(max_workers=cls.PDF_WORKERS)
+            return cls._pdf_pool
+
+    @classmethod
+    def _reset_pdf_pool(cls, pool):
+        """Drop a broken pool so the next parse starts a fresh one.
+
+        Does nothing if another parse has already replaced pool.
+        """
+        with cls._pdf_pool_lock:
+            if cls._pdf_pool is pool:
+                cls._pdf_pool.shutdown(wait=False)
+                cls._pdf_pool = None
+
     @staticmethod
     def parse_docx(file_path):
-        """Extract text from DOCX files."""
+        """Extract text from DOCX files (file path or binary file object).
+
+        By default word/document.xml is streamed with an incremental XML parser,
+        emitting body paragraphs and table cell paragraphs in document order.
+        python-docx (body paragraphs only) is used if streaming fails or
+        DOCX_STREAMING is off.
+        """
+        with metrics.timer("parse_docx"):
+            if DocumentParser.DOCX_STREAMING:
+                try:
+                    text = "\n".join(_iter_docx_paragraphs(file_path)).strip()
+                    metrics.observe("characters", len(text))
+                    return text
+                except Exception as e:
+                    print(f"Streaming DOCX extraction failed, using python-docx: {e}")
+                    metrics.increment("fallback", path="python_docx")
+
+            try:
+                import docx
+
+                doc = docx.Document(_binary_source(file_path))
+                text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+                metrics.observe("characters", len(text))
+                return text.strip()
+            except Exception as e:
+                print(f"Error parsing DOCX: {e}")
+                return None
+    
+    @classmethod
+    def parse_document(cls, file_path):
+        """Parse document based on file extension, using the text cache if enabled."""
+        if cls.cache is None:
+            return cls._parse_by_extension(file_path)
+
         try:
-            doc = docx.Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text.strip()
-        except Exception as e:
-            print(f"Error parsing DOCX: {e}")
+            with open(file_path, 'rb') as file:
+                data = file.read()
+        except OSError as e:
+            print(f"Error reading document: {e}")
             return None
-    
+
+        _, file_extension = os.path.splitext(file_path)
+        return cls._cached_parse(data, file_extension.lower(),
+                                 lambda: cls._parse_by_extension(file_path))
+
+    @classmethod
+    def parse_bytes(cls, data, filename_or_mime=None):
+        """Parse an in-memory PDF or DOCX without writing it to disk.
+
+        The format is detected from the content; filename_or_mime is only used
+        when the content is not recognised. Accepts bytes, bytearray or
+        memoryview.
+        """
+        return cls._parse_buffer(data, io.BytesIO(data), filename_or_mime)
+
+    @classmethod
+    def parse_stream(cls, fileobj, filename_or_mime=None):
+        """Parse a binary file object such as a Streamlit UploadedFile.
+
+        BytesIO-like objects are parsed in place through their buffer;
+        other streams are read into memory up to MAX_DOCUMENT_BYTES.
+        """
+        if hasattr(fileobj, 'getbuffer') and hasattr(fileobj, 'seek'):
+            return cls._parse_buffer(fileobj.getbuffer(), fileobj, filename_or_mime)
+
+        limit = cls.MAX_DOCUMENT_BYTES
+        data = fileobj.read() if limit is None else fileobj.read(limit + 1)
+        return cls.parse_bytes(data, filename_or_mime)
+
+    @classmethod
+    def detect_format(cls, stream, filename_or_mime=None):
+        """Return 'pdf' or 'docx' from a stream's magic bytes, else from the hint."""
+        stream.seek(0)
+        head = stream.read(1024)
+        stream.seek(0)
+
+        if b'%PDF-' in head:
+            return 'pdf'
+        if head.startswith(b'PK\x03\x04'):
+            try:
+                with zipfile.ZipFile(stream) as archive:
+                    if 'word/document.xml' in archive.namelist():
+                        return 'docx'
+            except zipfile.BadZipFile:
+                pass
+            finally:
+                stream.seek(0)
+            return None
+
+        if filename_or_mime:
+            hint = filename_or_mime.lower()
+            _, extension = os.path.splitext(hint)
+            return cls.FORMAT_HINTS.get(hint) or cls.FORMAT_HINTS.get(extension)
+        return None
+
+    @classmethod
+    def _parse_buffer(cls, data, stream, filename_or_mime):
+        """Size-check, detect and parse a document held in memory."""
+        size = memoryview(data).nbytes
+        if cls.MAX_DOCUMENT_BYTES is not None and size > cls.MAX_DOCUMENT_BYTES:
+            print(f"Document too large: {size} bytes (limit {cls.MAX_DOCUMENT_BYTES})")
+            return None
+
+        file_format = cls.detect_format(stream, filename_or_mime)
+        if file_format == 'pdf':
+            parse = cls.parse_pdf
+        elif file_format == 'docx':
+            parse = cls.parse_docx
+        else:
+            print(f"Unsupported file format: {filename_or_mime or 'unknown'}")
+            return None
+
+        def parse_stream():
+            stream.seek(0)
+            return parse(stream)
+
+        return cls._cached_parse(data, '.' + file_format, parse_stream)
+
+    @classmethod
+    def _cached_parse(cls, data, file_format, parse):
+        """Return cached text for data, or run parse() and cache its result."""
+        if cls.cache is None:
+            return parse()
+
+        key = TextCache.make_key(data, cls.PARSER_VERSION, file_format)
+        text = cls.cache.get(key)
+        metrics.increment("text_cache", result="miss" if text is None else "hit")
+        if text is None:
+            text = parse()
+            if text is not None:
+                cls.cache.set(key, text)
+        return text
+
     @staticmethod
-    def parse_document(file_path):
-        """Parse document based on file extension."""
+    def _open_binary(source):
+        """Open a path for reading, or rewind and reuse a file object."""
+        if hasattr(source, 'read'):
+            source.seek(0)
+            return nullcontext(source)
+        return open(source, 'rb')
+
+    @staticmethod
+    def _parse_by_extension(file_path):
+        """Dispatch to the parser for the file extension."""
         _, file_extension = os.path.splitext(file_path)
         
         if file_extension.lower() == '.pdf':
@@ -49,4 +376,177 @@ class DocumentParser:
             return DocumentParser.parse_docx(file_path)
         else:
             print(f"Unsupported file format: {file_extension}")
-            return None
\ No newline at end of file
+            return None
+
+
+class _PageTimeout(Exception):
+    """Raised inside a worker when one page exceeds its time budget."""
+
+
+def _extract_pdf_pages(source, page_numbers, page_timeout, extractor):
+    """Worker: extract pages from a PDF path or bytes with a registered extractor."""
+    return list(DocumentParser.PDF_EXTRACTORS[extractor](source, page_numbers, page_timeout))
+
+
+def _binary_source(source):
+    """Normalize a path, bytes or file object into something parsers can open."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, 'read'):
+        source.seek(0)
+    return source
+
+
+def _pdf_page_fonts(source, max_pages=None):
+    """Whether each of the first max_pages pages declares fonts, or None if PyPDF2 cannot read the PDF."""
+    import PyPDF2
+
+    try:
+        with DocumentParser._open_binary(source) as file:
+            reader = PyPDF2.PdfReader(file)
+            return [_page_has_fonts(page) for page in islice(reader.pages, max_pages)]
+    except Exception as e:
+        print(f"PyPDF2 could not read PDF, skipping pre-check: {e}")
+        return None
+
+
+def _pdf_page_count(source):
+    """Number of pages according to pdfplumber."""
+    import pdfplumber
+
+    with pdfplumber.open(_binary_source(source)) as pdf:
+        return len(pdf.pages)
+
+
+def _page_has_fonts(page):
+    """True if a PyPDF2 page (or a form XObject it draws) declares fonts."""
+    try:
+        resources = page.get('/Resources')
+        if resources is None:
+            return False
+        resources = resources.get_object()
+        if '/Font' in resources:
+            return True
+        xobjects = resources.get('/XObject')
+        if xobjects is None:
+            return False
+        for xobject in xobjects.get_object().values():
+            xobject = xobject.get_object()
+            xobject_resources = xobject.get('/Resources')
+            if xobject.get('/Subtype') == '/Form' and xobject_resources is not None \
+                    and '/Font' in xobject_resources.get_object():
+                return True
+    except Exception:
+        # When in doubt, assume there is text so nothing is skipped
+        return True
+    return False
+
+
+def _extract_page_text(extract, page_timeout, page_number):
+    """Run extract() for one page, giving up after page_timeout seconds.
+
+    The timeout uses SIGALRM, so it only applies on Unix in a main thread
+    (e.g. inside pool workers); elsewhere the page runs unbounded.
+    """
+    use_alarm = bool(page_timeout) and hasattr(signal, 'SIGALRM') and \
+        threading.current_thread() is threading.main_thread()
+    if not use_alarm:
+        return extract() or ""
+
+    timed_out = []
+
+    def on_timeout(signum, frame):
+        timed_out.append(True)
+        raise _PageTimeout()
+
+    previous = signal.signal(signal.SIGALRM, on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, page_timeout)
+    try:
+        return extract() or ""
+    except Exception:
+        # pdfplumber may wrap the timeout in its own exception type
+        if not timed_out:
+            raise
+        print(f"Skipping PDF page {page_number}: exceeded {page_timeout}s")
+        return ""
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W + 'body'
+_W_P = _W + 'p'
+_W_T = _W + 't'
+_W_R = _W + 'r'
+_W_PPR = _W + 'pPr'
+# Run content only: w:tab also defines tab stops under w:pPr/w:tabs
+_DOCX_BREAKS = {_W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n'}
+_DOCX_CONTEXTS = (_W_P, _W_R, _W_PPR)
+
+
+def _iter_docx_paragraphs(source):
+    """Yield paragraph texts from word/document.xml in document order.
+
+    Table cells are paragraphs too, so their text is included. Each top-level
+    block is discarded once parsed, keeping memory bounded by the largest
+    paragraph or table rather than the document.
+    """
+    with zipfile.ZipFile(_binary_source(source)) as archive:
+        with archive.open('word/document.xml') as xml_file:
+            body = None
+            depth = 0
+            # Text boxes nest paragraphs inside paragraphs, hence a stack
+            open_paragraphs = []
+            # Innermost enclosing paragraph, run or paragraph properties
+            contexts = []
+            for event, element in ET.iterparse(xml_file, events=('start', 'end')):
+                tag = element.tag
+                if event == 'start':
+                    depth += 1
+                    if tag in _DOCX_CONTEXTS:
+                        contexts.append(tag)
+                    if tag == _W_P:
+                        open_paragraphs.append([])
+                    elif tag == _W_BODY:
+                        body = element
+                    continue
+
+                depth -= 1
+                if tag in _DOCX_CONTEXTS:
+                    contexts.pop()
+                if open_paragraphs:
+                    if tag == _W_T:
+                        open_paragraphs[-1].append(element.text or "")
+                    elif tag in _DOCX_BREAKS and contexts and contexts[-1] == _W_R:
+                        open_paragraphs[-1].append(_DOCX_BREAKS[tag])
+                if tag == _W_P:
+                    yield "".join(open_paragraphs.pop())
+
+                # document > body > block: drop finished top-level blocks
+                if depth == 2 and body is not None:
+                    body.clear()
+
+
+def _extract_with_pdfplumber(source, page_numbers, page_timeout=None):
+    """Layout-aware extraction with pdfplumber."""
+    import pdfplumber
+
+    pages = [page_number + 1 for page_number in page_numbers]
+    with pdfplumber.open(_binary_source(source), pages=pages) as pdf:
+        return [_extract_page_text(page.extract_text, page_timeout, page.page_number)
+                for page in pdf.pages]
+
+
+def _extract_with_pypdf2(source, page_numbers, page_timeout=None):
+    """Fast content-stream extraction with PyPDF2."""
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(_binary_source(source))
+    return [_extract_page_text(reader.pages[page_number].extract_text, page_timeout,
+                               page_number + 1)
+            for page_number in page_numbers]
+
+
+DocumentParser.register_pdf_extractor('pdfplumber', _extract_with_pdfplumber)
+DocumentParser.register_pdf_extractor('pypdf2', _extract_with_pypdf2)
@@ -0,0 +1,212 @@
+"""
+Corpus-fitted IDF weights for transform-only TF-IDF scoring.
+
+Instead of fitting a TfidfVectorizer on each resume/job pair, an IDFModel is
+fitted once offline on a job and resume corpus and saved as plain .npy files.
+Loading memory-maps them read-only, so every worker process shares the same
+pages and per-request work is a lookup plus a sparse dot product.
+
+Two modes are supported:
+
+- "vocabulary": a sorted term array and matching IDF weights; terms outside
+  the fitted vocabulary are ignored, as with TfidfVectorizer.transform.
+- "hashing": terms are hashed into n_features buckets (stateless, no
+  vocabulary), so unseen terms still contribute with the bucket's IDF.
+
+Build a model from resume_ranker_ai/ with:
+
+    python -m utils.idf_model OUTPUT_DIR CORPUS_PATH [CORPUS_PATH ...]
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+
+MODEL_FORMAT = 1
+
+
+class IDFModel:
+    """Pre-fitted TF-IDF weighting shared between processes via memory maps."""
+
+    def __init__(self, idf, terms=None, mode="vocabulary", n_documents=0):
+        self.idf = idf
+        self.terms = terms
+        self.mode = mode
+        self.n_features = len(idf)
+        self.n_documents = n_documents
+        self._analyzer = None
+        self._hasher = None
+
+    @classmethod
+    def fit(cls, texts, mode="vocabulary", n_features=2 ** 20):
+        """Fit IDF weights on preprocessed texts (see NLPAnalyzer.preprocess_text)."""
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        texts = list(texts)
+        if mode == "vocabulary":
+            vectorizer = TfidfVectorizer(stop_words='english').fit(texts)
+            terms = sorted(vectorizer.vocabulary_)
+            order = [vectorizer.vocabulary_[term] for term in terms]
+            return cls(vectorizer.idf_[order].astype(np.float32), np.array(terms),
+                       mode=mode, n_documents=len(texts))
+
+        if mode != "hashing":
+            raise ValueError(f"Unknown IDF model mode: {mode}")
+
+        model = cls(np.zeros(n_features, dtype=np.float32), mode=mode, n_documents=len(texts))
+        counts = model._hashed_counts(
+            [Counter(model._tokenize(text)) for text in texts]
+        )
+        document_frequency = np.bincount(counts.indices, minlength=n_features)
+        # Same smoothing as TfidfVectorizer(smooth_idf=True)
+        model.idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+        return model
+
+    def save(self, directory):
+        """Write the model as .npy arrays plus a small JSON header."""
+        import numpy as np
+
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "idf.npy"), self.idf)
+        if self.terms is not None:
+            np.save(os.path.join(directory, "terms.npy"), self.terms)
+        with open(os.path.join(directory, "idf_model.json"), "w", encoding="utf-8") as f:
+            json.dump({"format": MODEL_FORMAT, "mode": self.mode,
+                       "n_documents": self.n_documents}, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """Load a saved model; arrays are memory-mapped read-only by default."""
+        import numpy as np
+
+        with open(os.path.join(directory, "idf_model.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != MODEL_FORMAT:
+            raise ValueError(f"Unsupported IDF model format: {meta.get('format')}")
+
+        mmap_mode = "r" if mmap else None
+        idf = np.load(os.path.join(directory, "idf.npy"), mmap_mode=mmap_mode)
+        terms = None
+        if meta["mode"] == "vocabulary":
+            terms = np.load(os.path.join(directory, "terms.npy"), mmap_mode=mmap_mode)
+        return cls(idf, terms, mode=meta["mode"], n_documents=meta.get("n_documents", 0))
+
+    def transform(self, processed_texts):
+        """L2-normalized TF-IDF rows (CSR) for preprocessed texts."""
+        return self.transform_counts([Counter(self._tokenize(text)) for text in processed_texts])
+
+    def transform_counts(self, counts_list):
+        """L2-normalized TF-IDF rows (CSR) for term-count mappings."""
+        from sklearn.preprocessing import normalize
+
+        if self.mode == "hashing":
+            matrix = self._hashed_counts(counts_list)
+        else:
+            matrix = self._vocabulary_counts(counts_list)
+
+        matrix.data *= self.idf[matrix.indices]
+        return normalize(matrix, norm="l2", copy=False)
+
+    @staticmethod
+    def cosine(vector_a, vector_b):
+        """Cosine similarity of two L2-normalized rows (None if both are empty)."""
+        if not vector_a.nnz and not vector_b.nnz:
+            return None
+        return float(vector_a.multiply(vector_b).sum())
+
+    def _tokenize(self, text):
+        """Tokens as TfidfVectorizer(stop_words='english') would produce them."""
+        if self._analyzer is None:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+
+            self._analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
+        return self._analyzer(text)
+
+    def _hashed_counts(self, counts_list):
+        """Raw term counts hashed into n_features columns."""
+        if self._hasher is None:
+            from sklearn.feature_extraction import FeatureHasher
+
+            self._hasher = FeatureHasher(n_features=self.n_features, input_type="dict",
+                                         alternate_sign=False)
+        matrix = self._hasher.transform(dict(counts) for counts in counts_list).tocsr()
+        matrix.sum_duplicates()
+        return matrix
+
+    def _vocabulary_counts(self, counts_list):
+        """Raw term counts in vocabulary columns; unknown terms are dropped."""
+        import numpy as np
+        import scipy.sparse as sp
+
+        indptr = [0]
+        indices = []
+        data = []
+        for counts in counts_list:
+            if counts:
+                query = np.array(list(counts))
+                positions = np.minimum(np.searchsorted(self.terms, query), len(self.terms) - 1)
+                known = self.terms[positions] == query
+                indices.append(positions[known])
+                data.append(np.fromiter(counts.values(), dtype=np.float32, count=len(counts))[known])
+                indptr.append(indptr[-1] + int(known.sum()))
+            else:
+                indptr.append(indptr[-1])
+
+        matrix = sp.csr_matrix(
+            (np.concatenate(data) if data else np.zeros(0, dtype=np.float32),
+             np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+             indptr),
+            shape=(len(indptr) - 1, self.n_features),
+            dtype=np.float32,
+        )
+        matrix.sort_indices()
+        return matrix
+
+
+def _iter_corpus(paths):
+    """Yield document texts from .txt/.pdf/.docx files and directories of them."""
+    from .document_parser import DocumentParser
+
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, name)
+                           for root, _, names in os.walk(path) for name in names)
+        else:
+            files = [path]
+        for file_path in files:
+            extension = os.path.splitext(file_path)[1].lower()
+            if extension == ".txt":
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    yield f.read()
+            elif extension in (".pdf", ".docx"):
+                text = DocumentParser.parse_document(file_path)
+                if text:
+                    yield text
+
+
+def main(argv=None):
+    """Fit an IDF model on a corpus plus the sample jobs and save it."""
+    import argparse
+    from .nlp_analyzer import NLPAnalyzer
+    from .sample_jobs import SAMPLE_JOBS
+
+    parser = argparse.ArgumentParser(prog="python -m utils.idf_model", description=main.__doc__)
+    parser.add_argument("output", help="directory to write the model to")
+    parser.add_argument("corpus", nargs="*", help="text, PDF or DOCX files or directories")
+    parser.add_argument("--mode", choices=["vocabulary", "hashing"], default="vocabulary")
+    parser.add_argument("--n-features", type=int, default=2 ** 20)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    texts = [NLPAnalyzer.preprocess_text(text) for text in _iter_corpus(args.corpus)]
+    texts += [NLPAnalyzer.preprocess_text(text) for text in SAMPLE_JOBS.values()]
+
+    model = IDFModel.fit(texts, mode=args.mode, n_features=args.n_features)
+    model.save(args.output)
+    print(f"Fitted {model.mode} IDF model on {len(texts)} documents "
+          f"({model.n_features} features) into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
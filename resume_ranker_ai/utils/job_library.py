@@ -0,0 +1,166 @@
+"""
+Precompiled analysis of a job description library.
+
+The sample jobs are constants, so their keywords, skills, TF-IDF terms and
+token arrays (CompactDoc) are computed once and stored in a versioned artifact. The artifact
+is keyed on the analyzer's model_id() and a hash of the job texts; a stale or
+missing artifact is rebuilt automatically on load.
+
+Build it ahead of time (e.g. in a container image) from resume_ranker_ai/:
+
+    python -m utils.job_library
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+
+from .compact_doc import CompactDoc
+from .nlp_analyzer import AnalyzedDocument
+
+ARTIFACT_FORMAT = 3
+
+DEFAULT_ARTIFACT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data", "artifacts", "sample_jobs.npz",
+)
+
+
+def artifact_key(nlp_analyzer, jobs):
+    """Key that changes with the artifact format, model, analysis logic or jobs."""
+    content = json.dumps(jobs, sort_keys=True).encode("utf-8")
+    return f"{ARTIFACT_FORMAT}/{nlp_analyzer.model_id()}/{hashlib.sha256(content).hexdigest()}"
+
+
+def build_job_library(nlp_analyzer, jobs, path=DEFAULT_ARTIFACT_PATH):
+    """Analyze every job once, write the artifact to path and return the documents.
+
+    Returns a dict of job title to AnalyzedDocument. Pass path=None to skip
+    writing.
+    """
+    import numpy as np
+
+    titles = list(jobs)
+    documents = dict(zip(titles, nlp_analyzer.analyze_many([jobs[title] for title in titles])))
+
+    vectors = None
+    doc_arrays = {}
+    if nlp_analyzer.nlp:
+        doc_arrays = CompactDoc.to_arrays(documents[title].doc for title in titles)
+        if nlp_analyzer.nlp.vocab.vectors_length:
+            # Normalized, and cached on each document by embed()
+            vectors = nlp_analyzer.embed([documents[title] for title in titles]).astype(np.float32)
+
+    if path:
+        meta = {
+            "key": artifact_key(nlp_analyzer, jobs),
+            "titles": titles,
+            "keyword_counts": [dict(documents[title].keyword_counts) for title in titles],
+            "skills": [documents[title].skills for title in titles],
+            "term_counts": [dict(documents[title].term_counts) for title in titles],
+        }
+        if vectors is None:
+            vectors = np.zeros((len(titles), 0), dtype=np.float32)
+        _write_artifact(path, meta, doc_arrays, vectors)
+
+    return documents
+
+
+def load_job_library(nlp_analyzer, jobs, path=DEFAULT_ARTIFACT_PATH, rebuild=True):
+    """Load precompiled job analyses and register them with the analyzer.
+
+    Afterwards nlp_analyzer.analyze(job_text) returns the stored document for
+    any of the jobs without running spaCy. A missing or stale artifact is
+    rebuilt (and rewritten) when rebuild is true. Returns the documents.
+    """
+    documents = _read_artifact(nlp_analyzer, jobs, path)
+    if documents is None:
+        if not rebuild:
+            return {}
+        try:
+            documents = build_job_library(nlp_analyzer, jobs, path)
+        except OSError as e:
+            # Read-only deployments still get the analyses, just not persisted
+            print(f"Could not write job library artifact: {e}")
+            documents = build_job_library(nlp_analyzer, jobs, path=None)
+
+    for document in documents.values():
+        nlp_analyzer.precomputed[document.text] = document
+    return documents
+
+
+def _read_artifact(nlp_analyzer, jobs, path):
+    """Documents from an up-to-date artifact at path, or None."""
+    if not path or not os.path.exists(path):
+        return None
+
+    import numpy as np
+
+    try:
+        with np.load(path, allow_pickle=False) as artifact:
+            meta = json.loads(artifact["meta"].tobytes().decode("utf-8"))
+            vectors = artifact["vectors"]
+            doc_arrays = {name[len("doc_"):]: artifact[name]
+                          for name in artifact.files if name.startswith("doc_")}
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Ignoring unreadable job library artifact: {e}")
+        return None
+
+    if meta.get("key") != artifact_key(nlp_analyzer, jobs):
+        print("Job library artifact is stale, rebuilding")
+        return None
+
+    titles = meta["titles"]
+    docs = [None] * len(titles)
+    if nlp_analyzer.nlp and doc_arrays:
+        docs = CompactDoc.from_arrays(doc_arrays)
+
+    documents = {}
+    for i, title in enumerate(titles):
+        text = jobs[title]
+        documents[title] = AnalyzedDocument(
+            text,
+            nlp_analyzer.preprocess_text(text),
+            doc=docs[i],
+            keyword_counts=Counter(meta["keyword_counts"][i]),
+            skills=meta["skills"][i],
+            term_counts=Counter(meta["term_counts"][i]),
+            operations=nlp_analyzer.OPERATIONS,
+            vector=vectors[i].astype(nlp_analyzer.vector_dtype) if vectors.shape[1] else None,
+        )
+    return documents
+
+
+def _write_artifact(path, meta, doc_arrays, vectors):
+    """Write the artifact atomically so concurrent readers never see a partial file."""
+    import numpy as np
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(
+            f,
+            meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+            vectors=vectors,
+            **{f"doc_{name}": array for name, array in doc_arrays.items()},
+        )
+    os.replace(temp_path, path)
+
+
+def main(argv=None):
+    """Build the sample job artifact: python -m utils.job_library [PATH]"""
+    from .nlp_analyzer import NLPAnalyzer
+    from .sample_jobs import SAMPLE_JOBS
+
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else DEFAULT_ARTIFACT_PATH
+
+    nlp_analyzer = NLPAnalyzer()
+    build_job_library(nlp_analyzer, SAMPLE_JOBS, path)
+    print(f"Wrote {len(SAMPLE_JOBS)} job analyses for {nlp_analyzer.model_id()} to {path}")
+
+
+if __name__ == "__main__":
+    main()
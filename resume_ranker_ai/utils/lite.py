@@ -0,0 +1,110 @@
+"""
+spaCy-free batch screening for very large resume pools.
+
+LiteScreener counts a whole batch of texts into one sparse document-term
+matrix, drops stop words and short words as a column mask, and takes each
+row's top-k keywords and the keyword-overlap score against a job with sparse
+operations, with no per-document Python loop. Keywords are the same words
+NLPAnalyzer counts without spaCy; among equally frequent words the
+alphabetically first are kept.
+
+Use it to pre-filter a pool cheaply and send only the shortlist through
+full NLP analysis (python -m resume_ranker_ai rank --shortlist N).
+"""
+
+from .nlp_analyzer import NLPAnalyzer
+
+
+class LiteScreener:
+    """Keyword extraction and keyword-overlap scoring over sparse count matrices."""
+
+    def __init__(self, stop_words=None, min_length=3, job_keywords=50, resume_keywords=100):
+        """
+        Args:
+            stop_words: words never counted; defaults to the analyzer's
+                fallback stop words.
+            min_length: shortest word counted.
+            job_keywords, resume_keywords: how many of the most frequent
+                keywords of the job and of each resume are compared, as in
+                NLPAnalyzer's keyword match.
+        """
+        self.stop_words = frozenset(NLPAnalyzer.FALLBACK_STOP_WORDS if stop_words is None
+                                    else stop_words)
+        self.min_length = min_length
+        self.job_keywords = job_keywords
+        self.resume_keywords = resume_keywords
+
+    def keyword_matrix(self, texts):
+        """Sparse keyword counts (one CSR row per text) and the term of each column."""
+        import numpy as np
+        import scipy.sparse as sp
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        texts = list(texts)
+        # Runs of word characters in the lowercased text are exactly the words
+        # of NLPAnalyzer.preprocess_text, found in one regex pass
+        vectorizer = CountVectorizer(token_pattern=r"(?u)\w+", lowercase=True, dtype=np.int32)
+        try:
+            counts = vectorizer.fit_transform(texts)
+        except ValueError:
+            # No words in any text
+            return sp.csr_matrix((len(texts), 0), dtype=np.int32), np.array([], dtype=str)
+        terms = vectorizer.get_feature_names_out()
+
+        keep = (np.char.str_len(terms.astype(str)) >= self.min_length) \
+            & ~np.isin(terms, list(self.stop_words))
+        return counts[:, keep].tocsr(), terms[keep]
+
+    @staticmethod
+    def top_k(counts, k):
+        """Binary CSR marking each row's k most frequent columns (ties: lowest column)."""
+        import numpy as np
+        import scipy.sparse as sp
+
+        counts = counts.tocsr()
+        counts.sort_indices()
+        rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        # One sort over every nonzero: by row, then count descending, then column
+        order = np.lexsort((counts.indices, -counts.data, rows))
+        rank = np.arange(counts.nnz) - counts.indptr[rows[order]]
+        keep = order[rank < k]
+        marks = np.ones(len(keep), dtype=np.int32)
+        return sp.csr_matrix((marks, (rows[keep], counts.indices[keep])), shape=counts.shape)
+
+    def top_keywords(self, texts, k=30):
+        """The k most frequent keywords of each text, most frequent first."""
+        import numpy as np
+
+        counts, terms = self.keyword_matrix(texts)
+        counts.sort_indices()
+        top = self.top_k(counts, k).multiply(counts).tocsr()
+        keywords = []
+        for row in range(top.shape[0]):
+            columns = top.indices[top.indptr[row]:top.indptr[row + 1]]
+            values = top.data[top.indptr[row]:top.indptr[row + 1]]
+            keywords.append(terms[columns[np.lexsort((columns, -values))]].tolist())
+        return keywords
+
+    def match_scores(self, job_text, resumes):
+        """Keyword-match percentages (0-100) of every resume against the job.
+
+        The share of the job's top keywords found among each resume's top
+        keywords, computed for the whole batch with one sparse product.
+        """
+        import numpy as np
+
+        resumes = list(resumes)
+        counts, _ = self.keyword_matrix([job_text] + resumes)
+        top = self.top_k(counts, self.resume_keywords)
+        job = self.top_k(counts[0], self.job_keywords)
+        if not job.nnz or not resumes:
+            return np.zeros(len(resumes), dtype=int)
+        shared = np.asarray((top[1:] @ job.T).todense()).ravel()
+        return np.clip(np.round(shared * 100 / job.nnz), 0, 100).astype(int)
+
+    def shortlist(self, job_text, resumes, k):
+        """Indices of the k best-scoring resumes, best first (ties keep input order)."""
+        import numpy as np
+
+        scores = self.match_scores(job_text, resumes)
+        return np.argsort(-scores, kind="stable")[:k].tolist()
@@ -0,0 +1,197 @@
+class MatchIndex:
+    """Match many resumes against many jobs with sparse TF-IDF matrices.
+
+    Resumes and jobs are kept as L2-normalized sparse rows in a shared TF-IDF
+    space, so a similarity block is a single sparse matrix product. When the
+    analyzer has semantic scoring on, normalized document vectors are kept
+    alongside and each block is blended with one dense product of them.
+    Blocks are computed a chunk of rows at a time to bound memory, and the
+    best matches per row are selected with argpartition. When the analyzer
+    has an idf_model, its vocabulary and IDF weights are used instead of
+    fitting a vectorizer on the indexed texts.
+    """
+
+    def __init__(self, nlp_analyzer, chunk_size=1024):
+        self.nlp_analyzer = nlp_analyzer
+        self.chunk_size = chunk_size
+        self.vectorizer = None
+        self.job_ids = []
+        self.job_matrix = None
+        self.resume_ids = []
+        self.resume_matrix = None
+        self.job_vectors = None
+        self.resume_vectors = None
+        self._fitted = False
+
+    def fit(self, jobs, resumes=None):
+        """Fit the TF-IDF vocabulary on jobs (and resumes) and index them.
+
+        Jobs and resumes may be lists of texts or dicts of id to text. If the
+        texts leave no vocabulary (empty or only stop words), nothing is
+        indexed and every lookup returns no matches.
+        """
+        job_ids, job_texts = self._split_items(jobs, 0)
+        resume_ids, resume_texts = self._split_items(resumes or [], 0)
+
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        processed = [self.nlp_analyzer.preprocess_text(text) for text in job_texts + resume_texts]
+        if self.nlp_analyzer.idf_model is not None:
+            # Transform-only against the corpus IDF, like pairwise scoring
+            self.vectorizer = self.nlp_analyzer.idf_model
+            matrix = self.vectorizer.transform(processed)
+        else:
+            self.vectorizer = TfidfVectorizer(stop_words='english')
+            try:
+                matrix = self.vectorizer.fit_transform(processed)
+            except ValueError:
+                # Empty vocabulary
+                self.vectorizer = None
+
+        self._fitted = True
+        self.job_ids = job_ids
+        self.resume_ids = resume_ids
+        if self.vectorizer is None:
+            self.job_matrix = self.resume_matrix = None
+            self.job_vectors = self.resume_vectors = None
+            return self
+
+        self.job_matrix = matrix[:len(job_texts)].tocsr()
+        self.resume_matrix = matrix[len(job_texts):].tocsr()
+        self.job_vectors = self.embed(job_texts)
+        self.resume_vectors = self.embed(resume_texts)
+        return self
+
+    def add_jobs(self, jobs):
+        """Index more jobs with the fitted vocabulary (fits on them if there is none)."""
+        if self.vectorizer is None:
+            return self.fit(jobs)
+
+        job_ids, job_texts = self._split_items(jobs, len(self.job_ids))
+        self.job_ids.extend(job_ids)
+        self.job_matrix = self._append_rows(self.job_matrix, self.transform(job_texts))
+        self.job_vectors = self._append_vectors(self.job_vectors, self.embed(job_texts))
+        return self
+
+    def add_resumes(self, resumes):
+        """Index more resumes with the fitted vocabulary, without refitting."""
+        if not self._fitted:
+            raise ValueError("MatchIndex must be fitted with jobs before adding resumes")
+
+        resume_ids, resume_texts = self._split_items(resumes, len(self.resume_ids))
+        self.resume_ids.extend(resume_ids)
+        if self.vectorizer is None:
+            # The jobs left no vocabulary, so there is nothing to match against
+            return self
+        self.resume_matrix = self._append_rows(self.resume_matrix, self.transform(resume_texts))
+        self.resume_vectors = self._append_vectors(self.resume_vectors, self.embed(resume_texts))
+        return self
+
+    def transform(self, texts):
+        """Vectorize texts into L2-normalized TF-IDF rows (transform only).
+
+        vectorizer is a fitted TfidfVectorizer or the analyzer's IDFModel.
+        """
+        processed = [self.nlp_analyzer.preprocess_text(text) for text in texts]
+        return self.vectorizer.transform(processed).tocsr()
+
+    def embed(self, texts):
+        """Normalized document vectors for texts, or None when semantic scoring is off."""
+        if not self.nlp_analyzer.semantic_enabled():
+            return None
+        return self.nlp_analyzer.embed(texts)
+
+    def top_jobs(self, resume_text, k=5):
+        """Best matching indexed jobs for a resume that is not itself indexed."""
+        if self.vectorizer is None or not self.job_ids:
+            return []
+        query = self.transform([resume_text])
+        _, matches = next(self._top_k(query, self.job_matrix, self.job_ids, k,
+                                      self.embed([resume_text]), self.job_vectors))
+        return matches
+
+    def top_jobs_for_resumes(self, k=5):
+        """Return {resume_id: [(job_id, score), ...]} with the k best jobs each."""
+        if self.resume_matrix is None or not self.job_ids:
+            return {}
+        return {
+            self.resume_ids[row]: matches
+            for row, matches in self._top_k(self.resume_matrix, self.job_matrix, self.job_ids, k,
+                                            self.resume_vectors, self.job_vectors)
+        }
+
+    def top_resumes_for_jobs(self, k=5):
+        """Return {job_id: [(resume_id, score), ...]} with the k best resumes each."""
+        if self.job_matrix is None or not self.resume_ids:
+            return {}
+        return {
+            self.job_ids[row]: matches
+            for row, matches in self._top_k(self.job_matrix, self.resume_matrix, self.resume_ids, k,
+                                            self.job_vectors, self.resume_vectors)
+        }
+
+    def _top_k(self, query_matrix, target_matrix, target_ids, k,
+               query_vectors=None, target_vectors=None):
+        """Yield (row, matches) for each query row, computing one chunk at a time."""
+        import numpy as np
+
+        k = min(k, target_matrix.shape[0])
+        target_t = target_matrix.T.tocsc()
+        semantic = query_vectors is not None and target_vectors is not None
+        if semantic:
+            target_vectors_t = target_vectors.astype(np.float32).T
+
+        for start in range(0, query_matrix.shape[0], self.chunk_size):
+            block = (query_matrix[start:start + self.chunk_size] @ target_t).toarray()
+            if semantic:
+                chunk_vectors = query_vectors[start:start + self.chunk_size].astype(np.float32)
+                block = self.nlp_analyzer.blend_similarity(block, chunk_vectors @ target_vectors_t)
+
+            if k <= 0:
+                for offset in range(block.shape[0]):
+                    yield start + offset, []
+                continue
+
+            # Unordered top-k per row, then sort just those k columns
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            for offset in range(block.shape[0]):
+                yield start + offset, [
+                    (target_ids[col], self._to_percentage(score))
+                    for col, score in zip(top[offset], top_scores[offset])
+                ]
+
+    @staticmethod
+    def _to_percentage(similarity):
+        """Convert a cosine similarity to the 0-100 score used across the app."""
+        return max(0, min(round(float(similarity) * 100), 100))
+
+    @staticmethod
+    def _append_rows(matrix, rows):
+        """Stack new sparse rows under an existing matrix."""
+        import scipy.sparse as sp
+
+        if matrix is None or matrix.shape[0] == 0:
+            return rows
+        return sp.vstack([matrix, rows], format="csr")
+
+    @staticmethod
+    def _append_vectors(vectors, rows):
+        """Stack new dense rows under existing ones."""
+        import numpy as np
+
+        if vectors is None or rows is None:
+            return rows
+        return np.vstack([vectors, rows])
+
+    @staticmethod
+    def _split_items(items, offset):
+        """Split a dict of id to text, or a list of texts, into ids and texts."""
+        if isinstance(items, dict):
+            return list(items.keys()), list(items.values())
+        texts = list(items)
+        return list(range(offset, offset + len(texts))), texts
@@ -0,0 +1,201 @@
+"""
+Lightweight instrumentation for the parsing and analysis hot paths.
+
+Stages are timed with `with metrics.timer("parse_pdf"):`, document sizes are
+recorded with metrics.observe("pages", n) and events with
+metrics.increment("text_cache", result="hit"). Everything is a no-op until
+metrics are enabled (metrics.enable() or RESUME_RANKER_METRICS=1), so the
+calls can stay in hot paths.
+
+Totals are exported as Prometheus text (to_prometheus) or a structured log
+record (log_snapshot). To see what a single request cost, wrap it in
+`with metrics.recording() as trace:`.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PREFIX = "resume_ranker"
+
+_enabled = os.environ.get("RESUME_RANKER_METRICS", "0") not in ("", "0")
+_lock = threading.Lock()
+_local = threading.local()
+
+# name -> [count, total, max]
+_stages = {}
+_sizes = {}
+# (name, sorted label items) -> count
+_counters = {}
+
+
+class Trace:
+    """Stage durations, sizes and events recorded by one thread in a recording() block."""
+
+    def __init__(self):
+        self.stages = {}
+        self.sizes = {}
+        self.counters = {}
+
+    def as_rows(self):
+        """Stage rows (stage, calls, milliseconds), slowest first."""
+        return [
+            {"stage": name, "calls": count, "ms": round(total * 1000, 2)}
+            for name, (count, total, _) in sorted(self.stages.items(), key=lambda item: -item[1][1])
+        ]
+
+
+class _Timer:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _record(_stages, "stages", self.name, time.perf_counter() - self.started)
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+def enable(on=True):
+    """Turn recording on (or off)."""
+    global _enabled
+    _enabled = on
+
+
+def enabled():
+    return _enabled
+
+
+def timer(stage):
+    """Context manager adding the block's wall time to stage."""
+    return _Timer(stage) if _enabled else _NOOP_TIMER
+
+
+def observe(measure, value):
+    """Record a document size, e.g. observe("pages", 3)."""
+    if _enabled:
+        _record(_sizes, "sizes", measure, value)
+
+
+def increment(event, amount=1, **labels):
+    """Count an event, e.g. increment("text_cache", result="hit")."""
+    if not _enabled:
+        return
+    key = (event, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+    for trace in _active_traces():
+        trace.counters[key] = trace.counters.get(key, 0) + amount
+
+
+@contextmanager
+def recording():
+    """Collect what this thread records inside the block into a Trace."""
+    trace = Trace()
+    traces = _active_traces()
+    traces.append(trace)
+    try:
+        yield trace
+    finally:
+        traces.remove(trace)
+
+
+def snapshot():
+    """Totals so far as a JSON-serializable dict."""
+    with _lock:
+        return {
+            "stages": {name: {"count": count, "seconds": total, "max_seconds": peak}
+                       for name, (count, total, peak) in _stages.items()},
+            "sizes": {name: {"count": count, "sum": total, "max": peak}
+                      for name, (count, total, peak) in _sizes.items()},
+            "counters": [dict(labels, event=event, count=count)
+                         for (event, labels), count in _counters.items()],
+        }
+
+
+def reset():
+    """Forget everything recorded so far."""
+    with _lock:
+        _stages.clear()
+        _sizes.clear()
+        _counters.clear()
+
+
+def to_prometheus():
+    """Totals in the Prometheus text exposition format."""
+    with _lock:
+        stages = sorted(_stages.items())
+        sizes = sorted(_sizes.items())
+        counters = sorted(_counters.items())
+
+    lines = []
+    if stages:
+        name = f"{PREFIX}_stage_duration_seconds"
+        lines += [f"# HELP {name} Time spent in each processing stage.",
+                  f"# TYPE {name} summary"]
+        for stage, (count, total, _) in stages:
+            lines.append(f'{name}_sum{{stage="{stage}"}} {total:.6f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+    if sizes:
+        name = f"{PREFIX}_document_size"
+        lines += [f"# HELP {name} Size of processed documents (pages, characters, tokens).",
+                  f"# TYPE {name} summary"]
+        for measure, (count, total, _) in sizes:
+            lines.append(f'{name}_sum{{measure="{measure}"}} {total}')
+            lines.append(f'{name}_count{{measure="{measure}"}} {count}')
+    if counters:
+        name = f"{PREFIX}_events_total"
+        lines += [f"# HELP {name} Cache hits and misses, fallbacks and other events.",
+                  f"# TYPE {name} counter"]
+        for (event, labels), count in counters:
+            label_text = ",".join([f'event="{event}"'] + [f'{key}="{value}"' for key, value in labels])
+            lines.append(f"{name}{{{label_text}}} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def log_snapshot(logger=None, level=logging.INFO):
+    """Emit the totals as one structured (JSON) log record."""
+    logger = logger or logging.getLogger(f"{PREFIX}.metrics")
+    logger.log(level, json.dumps({"metrics": snapshot()}))
+
+
+def _record(totals, trace_field, name, value):
+    with _lock:
+        entry = totals.get(name)
+        if entry is None:
+            totals[name] = [1, value, value]
+        else:
+            entry[0] += 1
+            entry[1] += value
+            entry[2] = max(entry[2], value)
+    for trace in _active_traces():
+        entry = getattr(trace, trace_field).setdefault(name, [0, 0, value])
+        entry[0] += 1
+        entry[1] += value
+        entry[2] = max(entry[2], value)
+
+
+def _active_traces():
+    traces = getattr(_local, "traces", None)
+    if traces is None:
+        traces = _local.traces = []
+    return traces
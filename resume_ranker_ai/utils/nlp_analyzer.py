@@ -1,49 +1,203 @@
-import spacy
+# spaCy, scikit-learn and NumPy are imported on first use to keep importing
+# this module cheap
+import os
 import re
-from collections import Counter
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import math
+import hashlib
+import threading
+from collections import Counter, OrderedDict
 import subprocess
 import sys
 
+from . import metrics
+from .compact_doc import CompactDoc
+
+
+class AnalyzedDocument:
+    """Text analyzed once and shared by every NLPAnalyzer method.
+
+    Built by NLPAnalyzer.analyze(); holds the preprocessed text, a CompactDoc
+    of the spaCy analysis (None in fallback mode), keyword counts, extracted skills and the term
+    counts behind the TF-IDF vector. operations records which analyses
+    ("keywords", "skills") have been run on it. vector is the L2-normalized
+    spaCy document vector when one has been computed or loaded, and
+    tfidf_vector the row from the analyzer's IDFModel once scored against one.
+    """
+
+    def __init__(self, text, processed_text, doc=None, keyword_counts=None,
+                 skills=None, term_counts=None, operations=(), vector=None):
+        self.text = text or ""
+        self.processed_text = processed_text
+        self.doc = doc
+        self.keyword_counts = keyword_counts if keyword_counts is not None else Counter()
+        self.skills = skills if skills is not None else []
+        self.term_counts = term_counts if term_counts is not None else Counter()
+        self.operations = frozenset(operations)
+        self.vector = vector
+        self.tfidf_vector = None
+
+    def keywords(self, max_keywords=30):
+        """Return the most frequent keywords, most common first."""
+        return [word for word, freq in self.keyword_counts.most_common(max_keywords)]
+
+
 class NLPAnalyzer:
     """Analyze resume and job description using NLP techniques."""
 
-    def __init__(self):
-        # Load spaCy model with fallback
-        self.nlp = self._load_spacy_model()
+    OPERATIONS = ("keywords", "skills")
+
+    # spaCy components each operation reads; the rest are disabled per call.
+    # Keywords need POS tags (tagger + attribute_ruler, or a morphologizer);
+    # skills also need entities and the dependency parse for noun chunks.
+    PIPELINE_REQUIREMENTS = {
+        "keywords": {"tok2vec", "transformer", "tagger", "attribute_ruler", "morphologizer"},
+        "skills": {"tok2vec", "transformer", "tagger", "attribute_ruler", "morphologizer",
+                   "parser", "ner"},
+    }
+
+    # Components no operation uses; excluded when the model is loaded
+    EXCLUDED_COMPONENTS = ["lemmatizer"]
+
+    # Bump when keyword or skill extraction changes so precompiled analyses
+    # (see job_library) are rebuilt
+    ANALYSIS_VERSION = "2"
+
+    # Normalized document vectors kept per text hash for semantic scoring
+    VECTOR_CACHE_SIZE = 4096
+
+    # Analyzed paragraphs kept for analyze(..., incremental=True)
+    SEGMENT_CACHE_SIZE = 4096
+
+    # Entity labels whose text may name a skill
+    SKILL_ENTITY_LABELS = ("ORG", "PRODUCT", "GPE")
+
+    # Words never counted as keywords; with a spaCy model its stop words are added
+    EXTRA_STOP_WORDS = frozenset({
+        "experience", "year", "years", "skill", "skills", "job",
+        "work", "working", "candidate", "ability", "position"
+    })
+    # Stop words without spaCy (fallback and lite mode)
+    FALLBACK_STOP_WORDS = EXTRA_STOP_WORDS | {
+        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"
+    }
+
+    def __init__(self, model=None, allow_download=None, idf_model=None, skill_taxonomy=None,
+                 semantic_weight=None, vector_dtype=None, lite=None):
+        """
+        Args:
+            model: spaCy model name or path to load instead of searching the
+                default models; defaults to $RESUME_RANKER_SPACY_MODEL.
+            allow_download: whether a missing model may be downloaded at
+                runtime; defaults to $RESUME_RANKER_ALLOW_MODEL_DOWNLOAD
+                (anything but "0" allows it). A configured model is never
+                downloaded.
+            idf_model: pre-fitted IDFModel used for transform-only TF-IDF
+                scoring; defaults to the model saved at
+                $RESUME_RANKER_IDF_MODEL, else a two-document fit per pair.
+            skill_taxonomy: SkillTaxonomy that skills are matched against;
+                defaults to the file at $RESUME_RANKER_SKILL_TAXONOMY, else
+                data/skill_taxonomy.json.
+            semantic_weight: share (0-1) of the match score taken from the
+                cosine of spaCy document vectors rather than TF-IDF; defaults
+                to $RESUME_RANKER_SEMANTIC_WEIGHT, else 0 (off). Only used
+                when the model ships word vectors (e.g. en_core_web_md).
+            vector_dtype: storage type of cached document vectors, "float32"
+                or "float16"; defaults to $RESUME_RANKER_VECTOR_DTYPE.
+            lite: skip spaCy entirely and use the fallback analysis, for fast
+                first-pass screening (see utils/lite.py); defaults to
+                $RESUME_RANKER_LITE ("1" turns it on).
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.model = model or os.environ.get("RESUME_RANKER_SPACY_MODEL")
+        if allow_download is None:
+            allow_download = os.environ.get("RESUME_RANKER_ALLOW_MODEL_DOWNLOAD", "1") != "0"
+        self.allow_download = allow_download
+        if lite is None:
+            lite = os.environ.get("RESUME_RANKER_LITE", "0") not in ("", "0")
+        self.lite = lite
+
+        if lite:
+            # Chosen, not a failure: no model is loaded or downloaded
+            self.nlp = None
+        else:
+            # Load spaCy model with fallback
+            self.nlp = self._load_spacy_model()
+            if not self.nlp:
+                metrics.increment("fallback", path="no_spacy_model")
+
+        if idf_model is None and os.environ.get("RESUME_RANKER_IDF_MODEL"):
+            from .idf_model import IDFModel
+
+            idf_model = IDFModel.load(os.environ["RESUME_RANKER_IDF_MODEL"])
+        self.idf_model = idf_model
+
+        if skill_taxonomy is None:
+            from .skill_taxonomy import SkillTaxonomy, DEFAULT_TAXONOMY_PATH
+
+            skill_taxonomy = SkillTaxonomy.load(
+                os.environ.get("RESUME_RANKER_SKILL_TAXONOMY") or DEFAULT_TAXONOMY_PATH
+            )
+        self.skill_taxonomy = skill_taxonomy
+
+        if semantic_weight is None:
+            semantic_weight = float(os.environ.get("RESUME_RANKER_SEMANTIC_WEIGHT") or 0)
+        self.semantic_weight = min(max(semantic_weight, 0.0), 1.0)
+        self.vector_dtype = vector_dtype or os.environ.get("RESUME_RANKER_VECTOR_DTYPE") or "float32"
+        self._vector_cache = OrderedDict()
+        self._vector_lock = threading.Lock()
+        self._segment_cache = OrderedDict()
+        self._segment_lock = threading.Lock()
+
+        # Fully analyzed documents by exact text, e.g. the precompiled sample jobs
+        self.precomputed = {}
 
         # Common words to exclude from keyword analysis
         if self.nlp:
-            self.stop_words = self.nlp.Defaults.stop_words.union({
-                "experience", "year", "years", "skill", "skills", "job",
-                "work", "working", "candidate", "ability", "position"
-            })
+            self.stop_words = self.nlp.Defaults.stop_words.union(self.EXTRA_STOP_WORDS)
         else:
             # Fallback stop words if spaCy model fails to load
-            self.stop_words = {
-                "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by",
-                "experience", "year", "years", "skill", "skills", "job", "work", "working", "candidate", "ability", "position"
-            }
+            self.stop_words = set(self.FALLBACK_STOP_WORDS)
+
+        # Same tokenizer and stop words as TfidfVectorizer(stop_words='english')
+        self._tfidf_analyzer = TfidfVectorizer(stop_words='english').build_analyzer()
 
     def _load_spacy_model(self):
         """Load spaCy model with fallback options."""
+        import spacy
+
+        if self.model:
+            # Explicitly configured (e.g. an offline model directory): no search, no download
+            try:
+                nlp = spacy.load(self.model, exclude=self.EXCLUDED_COMPONENTS)
+                print(f"Successfully loaded spaCy model: {self.model}")
+                return nlp
+            except (OSError, ValueError) as e:
+                print(f"Failed to load configured spaCy model {self.model}: {e}")
+                print("Running in fallback mode without spaCy NLP features")
+                return None
+
         models_to_try = ["en_core_web_md", "en_core_web_sm", "en_core_web_lg"]
 
         for model_name in models_to_try:
             try:
-                nlp = spacy.load(model_name)
+                nlp = spacy.load(model_name, exclude=self.EXCLUDED_COMPONENTS)
                 print(f"Successfully loaded spaCy model: {model_name}")
                 return nlp
             except OSError:
                 print(f"Model {model_name} not found, trying next...")
                 continue
 
+        if not self.allow_download:
+            print("No spaCy models found and downloads are disabled")
+            print("Running in fallback mode without spaCy NLP features")
+            return None
+
         # If no models are available, try to download en_core_web_sm
         try:
             print("No spaCy models found. Attempting to download en_core_web_sm...")
             subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-            nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=self.EXCLUDED_COMPONENTS)
             print("Successfully downloaded and loaded en_core_web_sm")
             return nlp
         except Exception as e:
@@ -51,7 +205,21 @@ class NLPAnalyzer:
             print("Running in fallback mode without spaCy NLP features")
             return None
     
-    def preprocess_text(self, text):
+    def model_id(self):
+        """Identify the loaded model and analysis logic, for cache keys."""
+        analysis = f"analysis-{self.ANALYSIS_VERSION}/skills-{self.skill_taxonomy.digest}"
+        if self.lite:
+            return f"lite/{analysis}"
+        if not self.nlp:
+            return f"fallback/{analysis}"
+        import spacy
+
+        meta = self.nlp.meta
+        return (f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+                f"/spacy-{spacy.__version__}/{analysis}")
+
+    @staticmethod
+    def preprocess_text(text):
         """Clean and preprocess text."""
         if not text:
             return ""
@@ -62,97 +230,417 @@ class NLPAnalyzer:
         text = re.sub(r'\s+', ' ', text).strip()
         return text
     
+    def analyze(self, text, operations=OPERATIONS, incremental=False):
+        """Run the NLP pipeline once and return an AnalyzedDocument.
+
+        Only the spaCy components the requested operations need are run, in a
+        single pass. Passing an AnalyzedDocument returns it, first running any
+        operations it is missing, so every public method accepts either raw
+        text or a document analyzed earlier.
+
+        With incremental=True the text is analyzed paragraph by paragraph
+        (blocks separated by blank lines) and each paragraph's results are
+        cached, so re-analyzing an edited text only runs the pipeline on the
+        paragraphs that changed; keyword, skill and term counts are merged
+        from the paragraphs. Meant for a text being edited, such as a job
+        description: wrapped lines stay together, so spaCy sees whole
+        sentences.
+        """
+        if isinstance(text, AnalyzedDocument):
+            missing = set(operations) - text.operations
+            if missing:
+                self._complete_document(text, missing)
+            return text
+
+        text = text or ""
+        if text in self.precomputed:
+            metrics.increment("analysis_cache", result="hit")
+            return self.precomputed[text]
+
+        if incremental:
+            return self._analyze_segments(text)
+
+        processed_text = self.preprocess_text(text)
+        doc = self._run_pipeline(processed_text, operations)
+        return self._build_document(text, processed_text, doc, operations)
+
+    def _analyze_segments(self, text):
+        """Analyze text paragraph by paragraph, reusing cached ones, and merge the results."""
+        order = [paragraph.strip() for paragraph in re.split(r'\n\s*\n', text) if paragraph.strip()]
+        paragraphs = list(dict.fromkeys(order))
+
+        segments = {}
+        with self._segment_lock:
+            for paragraph in paragraphs:
+                segment = self._segment_cache.get(paragraph)
+                if segment is not None:
+                    self._segment_cache.move_to_end(paragraph)
+                    segments[paragraph] = segment
+        missing = [paragraph for paragraph in paragraphs if paragraph not in segments]
+        metrics.increment("segment_cache", len(paragraphs) - len(missing), result="hit")
+        metrics.increment("segment_cache", len(missing), result="miss")
+
+        if missing:
+            processed_paragraphs = [self.preprocess_text(paragraph) for paragraph in missing]
+            if self.nlp:
+                docs = self._timed_pipe(self.nlp.pipe(
+                    processed_paragraphs, disable=self.disabled_components(self.OPERATIONS)))
+            else:
+                docs = (None for _ in processed_paragraphs)
+            for paragraph, processed_paragraph, doc in zip(missing, processed_paragraphs, docs):
+                doc = CompactDoc.from_doc(doc) if doc is not None else None
+                with metrics.timer("keywords"):
+                    if doc is not None:
+                        keyword_counts = self._count_keywords(doc)
+                    else:
+                        keyword_counts = self._count_keywords_fallback(processed_paragraph)
+                with metrics.timer("skills"):
+                    skills, candidates = self._skill_parts(paragraph, doc)
+                segments[paragraph] = (processed_paragraph, doc, keyword_counts, skills, candidates,
+                                       Counter(self._tfidf_analyzer(processed_paragraph)))
+            with self._segment_lock:
+                for paragraph in missing:
+                    self._segment_cache[paragraph] = segments[paragraph]
+                while len(self._segment_cache) > self.SEGMENT_CACHE_SIZE:
+                    self._segment_cache.popitem(last=False)
+
+        # Sum each paragraph's contribution, in text order
+        processed_paragraphs = []
+        docs = []
+        keyword_counts = Counter()
+        term_counts = Counter()
+        skills = []
+        candidates = []
+        for paragraph in order:
+            processed, doc, part_keywords, part_skills, part_candidates, part_terms = segments[paragraph]
+            if processed:
+                processed_paragraphs.append(processed)
+            if doc is not None and len(doc):
+                docs.append(doc)
+            keyword_counts.update(part_keywords)
+            term_counts.update(part_terms)
+            skills.extend(part_skills)
+            candidates.extend(part_candidates)
+
+        return AnalyzedDocument(
+            text,
+            " ".join(processed_paragraphs),
+            doc=CompactDoc.concat(docs) if docs else None,
+            keyword_counts=keyword_counts,
+            skills=self._merge_skills(skills, candidates),
+            term_counts=term_counts,
+            operations=self.OPERATIONS,
+        )
+
+    def analyze_many(self, texts, batch_size=64, n_process=1, operations=OPERATIONS):
+        """Analyze many texts, streaming them through nlp.pipe in batches.
+
+        Yields one AnalyzedDocument per input text, in input order.
+        """
+        texts = [text or "" for text in texts]
+        processed_texts = [self.preprocess_text(text) for text in texts]
+
+        if self.nlp and operations:
+            docs = self._timed_pipe(self.nlp.pipe(processed_texts, batch_size=batch_size,
+                                                  n_process=n_process,
+                                                  disable=self.disabled_components(operations)))
+        else:
+            docs = (None for _ in processed_texts)
+
+        for text, processed_text, doc in zip(texts, processed_texts, docs):
+            yield self._build_document(text, processed_text, doc, operations)
+
+    @staticmethod
+    def _timed_pipe(docs):
+        """Yield from an nlp.pipe stream, timing the work behind each Doc."""
+        docs = iter(docs)
+        while True:
+            with metrics.timer("spacy"):
+                doc = next(docs, None)
+            if doc is None:
+                return
+            yield doc
+
+    def disabled_components(self, operations):
+        """Pipeline components none of the operations need."""
+        if not self.nlp:
+            return []
+        required = set()
+        for operation in operations:
+            required |= self.PIPELINE_REQUIREMENTS[operation]
+        return [name for name in self.nlp.pipe_names if name not in required]
+
+    def _run_pipeline(self, processed_text, operations):
+        """Run only the components the operations need (None without spaCy)."""
+        if not self.nlp or not operations:
+            return None
+        with metrics.timer("spacy"):
+            return self.nlp(processed_text, disable=self.disabled_components(operations))
+
+    def _build_document(self, text, processed_text, doc, operations):
+        """Derive keywords, skills and term counts for an AnalyzedDocument."""
+        if not self.nlp:
+            # Fallback extraction is cheap, so always do all of it
+            operations = self.OPERATIONS
+
+        document = AnalyzedDocument(
+            text,
+            processed_text,
+            term_counts=Counter(self._tfidf_analyzer(processed_text)),
+        )
+        self._fill_document(document, doc, operations)
+        return document
+
+    def _complete_document(self, document, operations):
+        """Run operations a document is missing and add their results to it."""
+        doc = self._run_pipeline(document.processed_text, operations)
+        self._fill_document(document, doc, operations)
+
+    def _fill_document(self, document, doc, operations):
+        """Store the results of operations (computed from doc) on document."""
+        if doc is not None:
+            metrics.observe("tokens", len(doc))
+            if document.vector is None and self.semantic_enabled():
+                document.vector = self._cached_vector(document.processed_text, doc)
+            # Keep only the token arrays extraction reads, so the Doc can be freed
+            doc = CompactDoc.from_doc(doc)
+            document.doc = doc
+        if "keywords" in operations:
+            with metrics.timer("keywords"):
+                if doc is not None:
+                    document.keyword_counts = self._count_keywords(doc)
+                else:
+                    document.keyword_counts = self._count_keywords_fallback(document.processed_text)
+        if "skills" in operations:
+            with metrics.timer("skills"):
+                document.skills = self._extract_skills(document.text, doc)
+        document.operations = document.operations | set(operations)
+
     def extract_keywords(self, text, max_keywords=30):
         """Extract important keywords from text using spaCy or fallback method."""
-        if self.nlp:
-            # Use spaCy for advanced keyword extraction
-            doc = self.nlp(self.preprocess_text(text))
-
-            # Extract nouns, proper nouns, and adjectives that aren't stop words
-            keywords = []
-            for token in doc:
-                if (token.pos_ in ["NOUN", "PROPN"] or
-                    (token.pos_ == "ADJ" and len(token.text) > 2)) and \
-                    not token.is_stop and token.text.lower() not in self.stop_words:
-                    keywords.append(token.text.lower())
-
-            # Count frequencies and return top keywords
-            keyword_freq = Counter(keywords)
-            return [word for word, freq in keyword_freq.most_common(max_keywords)]
-        else:
-            # Fallback method without spaCy
-            return self._extract_keywords_fallback(text, max_keywords)
+        return self.analyze(text, ("keywords",)).keywords(max_keywords)
+
+    def _count_keywords(self, doc):
+        """Count nouns, proper nouns and adjectives in a CompactDoc."""
+        from spacy.parts_of_speech import ADJ, NOUN, PROPN
+
+        selected = (((doc.pos == NOUN) | (doc.pos == PROPN) | ((doc.pos == ADJ) & (doc.length > 2)))
+                    & ~doc.is_stop)
+        return doc.count_words(selected, exclude=self.stop_words)
 
     def _extract_keywords_fallback(self, text, max_keywords=30):
         """Fallback keyword extraction without spaCy."""
-        processed_text = self.preprocess_text(text)
+        keyword_freq = self._count_keywords_fallback(self.preprocess_text(text))
+        return [word for word, freq in keyword_freq.most_common(max_keywords)]
+
+    def _count_keywords_fallback(self, processed_text):
+        """Count keywords in preprocessed text without spaCy."""
         words = processed_text.split()
 
         # Filter out stop words and short words
         keywords = [word for word in words
                    if len(word) > 2 and word.lower() not in self.stop_words]
 
-        # Count frequencies and return top keywords
-        keyword_freq = Counter(keywords)
-        return [word for word, freq in keyword_freq.most_common(max_keywords)]
+        return Counter(keywords)
     
     def extract_skills(self, text):
         """Extract skills from text using a combination of NER and keyword extraction."""
-        skills = []
+        return list(self.analyze(text, ("skills",)).skills)
 
-        if self.nlp:
-            # Use spaCy for advanced skill extraction
-            doc = self.nlp(self.preprocess_text(text))
+    def find_missing_skills(self, resume_text, job_text):
+        """Skills of the job that the resume does not mention, in job order."""
+        resume_skills = set(self.extract_skills(resume_text))
+        return [skill for skill in self.extract_skills(job_text) if skill not in resume_skills]
 
-            # Extract entities that might be skills
-            for ent in doc.ents:
-                if ent.label_ in ["ORG", "PRODUCT", "GPE"]:
-                    skills.append(ent.text.lower())
+    def _extract_skills(self, text, doc):
+        """Extract skills from raw text and its CompactDoc (None without spaCy).
 
-            # Add noun chunks that might represent skills
-            for chunk in doc.noun_chunks:
-                if not any(token.is_stop for token in chunk) and len(chunk.text) > 3:
-                    skills.append(chunk.text.lower())
+        Taxonomy skills come first as canonical IDs; entities, noun chunks and
+        (without spaCy) capitalized words follow, mapped to an ID when they
+        are a known alias.
+        """
+        return self._merge_skills(*self._skill_parts(text, doc))
 
-        # Add technical terms and programming languages (works with or without spaCy)
-        tech_pattern = r'\b(?:python|java|javascript|html|css|sql|react|node\.js|aws|docker|kubernetes|machine learning|ai|data science|nlp|c\+\+|ruby|php|swift|golang|scala|r|tableau|power bi|excel|word|powerpoint|photoshop|illustrator)\b'
-        tech_skills = re.findall(tech_pattern, text.lower())
-        skills.extend(tech_skills)
+    def _skill_parts(self, text, doc):
+        """Taxonomy skill IDs and other candidate phrases found in text and doc."""
+        # Technical skills from the taxonomy (works with or without spaCy)
+        skills = self.skill_taxonomy.find(text)
+        candidates = []
+
+        if doc is not None:
+            # Extract entities that might be skills
+            candidates.extend(doc.entity_texts(self.SKILL_ENTITY_LABELS))
+
+            # Add noun chunks without stop words that might represent skills
+            # (only parsed documents have chunks)
+            candidates.extend(chunk for chunk in doc.chunk_texts() if len(chunk) > 3)
 
         # If no spaCy, add some basic skill extraction
         if not self.nlp:
             # Extract capitalized words that might be technologies/skills
             cap_words = re.findall(r'\b[A-Z][a-zA-Z]+\b', text)
-            skills.extend([word.lower() for word in cap_words if len(word) > 2])
+            candidates.extend([word.lower() for word in cap_words if len(word) > 2])
+        return skills, candidates
 
-        # Remove duplicates and return
-        return list(set(skills))
+    def _merge_skills(self, skills, candidates):
+        """Skill IDs followed by canonicalized candidates, first mentions only."""
+        found = dict.fromkeys(skills)
+        for candidate in candidates:
+            found.setdefault(self.skill_taxonomy.canonical(candidate) or candidate)
+        return list(found)
     
     def calculate_match_score(self, resume_text, job_text):
         """Calculate match percentage between resume and job description."""
-        if not resume_text or not job_text:
-            return 0
-            
-        # Preprocess texts
-        resume_processed = self.preprocess_text(resume_text)
-        job_processed = self.preprocess_text(job_text)
-        
-        # Use TF-IDF vectorization for better semantic matching
-        vectorizer = TfidfVectorizer(stop_words='english')
-        try:
-            tfidf_matrix = vectorizer.fit_transform([resume_processed, job_processed])
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            # Convert to percentage
-            match_percentage = round(similarity * 100)
-            
-            # Ensure the score is between 0 and 100
-            return max(0, min(match_percentage, 100))
-        except:
-            # Fallback if vectorization fails
-            return self._calculate_keyword_match(resume_text, job_text)
-    
+        return self.calculate_match_scores([(resume_text, job_text)])[0]
+
+    def calculate_match_scores(self, pairs):
+        """Match percentages for (resume, job) pairs of texts or AnalyzedDocuments.
+
+        Same scores as calculate_match_score on each pair, but with an
+        IDFModel or semantic scoring the whole list is vectorized at once.
+        """
+        import numpy as np
+
+        # TF-IDF needs no spaCy components; keywords are only computed on fallback
+        pairs = [(self.analyze(resume, ()), self.analyze(job, ())) for resume, job in pairs]
+        if not pairs:
+            return []
+
+        with metrics.timer("tfidf"):
+            if self.idf_model is not None:
+                # Corpus IDF: transform-only, then a row-wise sparse dot product
+                import scipy.sparse as sp
+
+                resumes = sp.vstack([self.tfidf_vector(resume) for resume, _ in pairs], format="csr")
+                jobs = sp.vstack([self.tfidf_vector(job) for _, job in pairs], format="csr")
+                products = np.asarray(resumes.multiply(jobs).sum(axis=1)).ravel()
+                empty = (resumes.getnnz(axis=1) == 0) & (jobs.getnnz(axis=1) == 0)
+                similarities = [None if is_empty else float(product)
+                                for product, is_empty in zip(products, empty)]
+            else:
+                # TF-IDF fitted on the two documents, as TfidfVectorizer would
+                similarities = [self._tfidf_cosine(resume.term_counts, job.term_counts)
+                                for resume, job in pairs]
+
+        semantic = None
+        if self.semantic_enabled():
+            resume_vectors = self.embed([resume for resume, _ in pairs]).astype(np.float32)
+            job_vectors = self.embed([job for _, job in pairs]).astype(np.float32)
+            semantic = (resume_vectors * job_vectors).sum(axis=1)
+
+        scores = []
+        for index, ((resume, job), similarity) in enumerate(zip(pairs, similarities)):
+            if not resume.text or not job.text:
+                scores.append(0)
+            elif similarity is None:
+                # Fallback if vectorization fails
+                metrics.increment("fallback", path="keyword_match")
+                scores.append(self._calculate_keyword_match(resume, job))
+            else:
+                if semantic is not None:
+                    similarity = self.blend_similarity(similarity, semantic[index])
+                # Convert to a percentage between 0 and 100
+                scores.append(max(0, min(int(round(float(similarity) * 100)), 100)))
+        return scores
+
+    def semantic_enabled(self):
+        """Whether match scores blend in document-vector similarity."""
+        return bool(self.semantic_weight and self.nlp and self.nlp.vocab.vectors_length)
+
+    def blend_similarity(self, tfidf_similarity, semantic_similarity):
+        """Weighted mix of TF-IDF and (non-negative) document-vector cosines."""
+        import numpy as np
+
+        semantic_similarity = np.clip(semantic_similarity, 0.0, 1.0)
+        return ((1 - self.semantic_weight) * tfidf_similarity
+                + self.semantic_weight * semantic_similarity)
+
+    def document_vector(self, document):
+        """L2-normalized vector of an AnalyzedDocument (None without word vectors)."""
+        if document.vector is None and self.nlp and self.nlp.vocab.vectors_length:
+            document.vector = self._cached_vector(document.processed_text)
+        return document.vector
+
+    def embed(self, texts):
+        """Stack normalized vectors for texts or AnalyzedDocuments into one matrix.
+
+        Rows are L2-normalized, so embed(resumes) @ embed(jobs).T is the
+        matrix of cosine similarities. Returns None without word vectors.
+        """
+        import numpy as np
+
+        if not self.nlp or not self.nlp.vocab.vectors_length:
+            return None
+        rows = [
+            self.document_vector(text) if isinstance(text, AnalyzedDocument)
+            else self._cached_vector(self.preprocess_text(text))
+            for text in texts
+        ]
+        if not rows:
+            return np.zeros((0, self.nlp.vocab.vectors_length), dtype=self.vector_dtype)
+        return np.vstack(rows)
+
+    def _cached_vector(self, processed_text, doc=None):
+        """Normalized document vector, cached by a hash of the processed text."""
+        import numpy as np
+
+        key = hashlib.sha1(processed_text.encode("utf-8")).digest()
+        with self._vector_lock:
+            vector = self._vector_cache.get(key)
+            if vector is not None:
+                self._vector_cache.move_to_end(key)
+                metrics.increment("vector_cache", result="hit")
+                return vector
+
+        metrics.increment("vector_cache", result="miss")
+        with metrics.timer("embedding"):
+            # Static word vectors need only the tokenizer
+            if doc is None:
+                doc = self.nlp.make_doc(processed_text)
+            vector = np.asarray(doc.vector, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector = vector / norm
+            vector = vector.astype(self.vector_dtype)
+
+        with self._vector_lock:
+            self._vector_cache[key] = vector
+            while len(self._vector_cache) > self.VECTOR_CACHE_SIZE:
+                self._vector_cache.popitem(last=False)
+        return vector
+
+    def tfidf_vector(self, document):
+        """The document's L2-normalized row under idf_model, computed once."""
+        if document.tfidf_vector is None:
+            document.tfidf_vector = self.idf_model.transform_counts([document.term_counts])
+        return document.tfidf_vector
+
+    @staticmethod
+    def _tfidf_cosine(resume_counts, job_counts):
+        """Cosine similarity of two term-count vectors under a two-document TF-IDF fit.
+
+        Mirrors TfidfVectorizer defaults (smooth idf, l2 norm) without building
+        a vectorizer per pair. Returns None when the vocabulary is empty.
+        """
+        if not resume_counts and not job_counts:
+            return None
+
+        def idf(term):
+            df = (term in resume_counts) + (term in job_counts)
+            return math.log(3 / (1 + df)) + 1
+
+        def norm(counts):
+            return math.sqrt(sum((freq * idf(term)) ** 2 for term, freq in counts.items()))
+
+        resume_norm = norm(resume_counts)
+        job_norm = norm(job_counts)
+        if not resume_norm or not job_norm:
+            return 0.0
+
+        dot = sum(freq * job_counts[term] * idf(term) ** 2
+                  for term, freq in resume_counts.items() if term in job_counts)
+        return dot / (resume_norm * job_norm)
+
     def _calculate_keyword_match(self, resume_text, job_text):
         """Fallback method to calculate match based on keyword overlap."""
         job_keywords = set(self.extract_keywords(job_text, max_keywords=50))
@@ -173,4 +661,137 @@ class NLPAnalyzer:
         resume_keywords = set(self.extract_keywords(resume_text, max_keywords=100))
         
         missing_keywords = job_keywords - resume_keywords
-        return list(missing_keywords)
\ No newline at end of file
+        return list(missing_keywords)
+
+    def rank_resumes(self, job_text, resumes, top_k=None, n_process=1, batch_size=64,
+                     dedup_threshold=None):
+        """Rank a pool of resumes against one job description.
+
+        Resumes may be a list of texts or a dict of candidate id to text. They
+        are analyzed in batches with nlp.pipe, vectorized with a single TF-IDF
+        fit over the job and the whole pool, and scored with one sparse matrix
+        product (blended with one dense product of document vectors when
+        semantic scoring is on). Returns dicts with id, rank, score,
+        missing_keywords, missing_skills and duplicate_of, best match first.
+
+        With dedup_threshold set, near-duplicate resumes (estimated Jaccard
+        similarity of word shingles at or above it) are grouped first; only
+        the first of each group is analyzed and the others share its result,
+        with duplicate_of naming it.
+        """
+        if isinstance(resumes, dict):
+            candidate_ids = list(resumes.keys())
+            resume_texts = list(resumes.values())
+        else:
+            resume_texts = list(resumes)
+            candidate_ids = list(range(len(resume_texts)))
+
+        if not resume_texts:
+            return []
+
+        import numpy as np
+
+        job = self.analyze(job_text)
+        job_keywords = set(job.keywords(50))
+
+        representatives = list(range(len(resume_texts)))
+        if dedup_threshold:
+            from .dedup import NearDuplicateFinder
+
+            finder = NearDuplicateFinder(dedup_threshold)
+            representatives = finder.group([self.preprocess_text(text) for text in resume_texts])
+        unique = sorted(set(representatives))
+
+        # Keep only what ranking needs so the spaCy Docs can be freed per batch
+        semantic = self.semantic_enabled()
+        processed_texts = []
+        candidates = []
+        vectors = []
+        for document in self.analyze_many([resume_texts[index] for index in unique],
+                                          batch_size=batch_size, n_process=n_process):
+            processed_texts.append(document.processed_text)
+            candidates.append((set(document.keywords(100)), set(document.skills),
+                               bool(document.text)))
+            if semantic:
+                vectors.append(self.document_vector(document))
+
+        with metrics.timer("tfidf"):
+            scores = self._score_pool(job, processed_texts)
+        if scores is None:
+            # Fallback if vectorization fails
+            metrics.increment("fallback", path="keyword_match")
+            scores = np.array([
+                self._keyword_overlap(resume_keywords, job_keywords)
+                for resume_keywords, _, _ in candidates
+            ], dtype=float)
+        elif semantic:
+            # One matrix-vector product for the whole pool
+            job_vector = self.document_vector(job).astype(np.float32)
+            scores = self.blend_similarity(scores, np.vstack(vectors).astype(np.float32) @ job_vector)
+        # Empty resumes score zero, as in calculate_match_score
+        scores[[not has_text for _, _, has_text in candidates]] = 0.0
+        if not job.text:
+            scores[:] = 0.0
+
+        if len(unique) < len(representatives):
+            # Fan each representative's result out to its duplicates
+            positions = {index: position for position, index in enumerate(unique)}
+            rows = [positions[index] for index in representatives]
+            scores = scores[rows]
+            candidates = [candidates[row] for row in rows]
+
+        order = self._top_indices(scores, top_k)
+
+        results = []
+        for rank, index in enumerate(order, start=1):
+            resume_keywords, resume_skills, _ = candidates[index]
+            results.append({
+                "id": candidate_ids[index],
+                "rank": rank,
+                "score": max(0, min(round(scores[index] * 100), 100)),
+                "missing_keywords": list(job_keywords - resume_keywords),
+                "missing_skills": [skill for skill in job.skills if skill not in resume_skills],
+                "duplicate_of": (candidate_ids[representatives[index]]
+                                 if representatives[index] != index else None),
+            })
+        return results
+
+    def _score_pool(self, job, processed_texts):
+        """Cosine similarity of every resume to the job under one TF-IDF fit."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        if self.idf_model is not None:
+            # Transform-only against the corpus IDF
+            resume_matrix = self.idf_model.transform(processed_texts)
+            if not resume_matrix.nnz and not self.tfidf_vector(job).nnz:
+                return None
+            return (resume_matrix @ self.tfidf_vector(job).T).toarray().ravel()
+
+        vectorizer = TfidfVectorizer(stop_words='english')
+        try:
+            tfidf_matrix = vectorizer.fit_transform([job.processed_text] + processed_texts)
+        except ValueError:
+            return None
+
+        # Rows are L2-normalized, so the product is the cosine similarity
+        return (tfidf_matrix[1:] @ tfidf_matrix[0].T).toarray().ravel()
+
+    @staticmethod
+    def _keyword_overlap(resume_keywords, job_keywords):
+        """Share of job keywords present in the resume keywords, as a fraction."""
+        if not job_keywords:
+            return 0.0
+        return len(resume_keywords & job_keywords) / len(job_keywords)
+
+    @staticmethod
+    def _top_indices(scores, top_k=None):
+        """Indices of the top_k highest scores, best first (all when top_k is None)."""
+        import numpy as np
+
+        if top_k is None or top_k >= len(scores):
+            return np.argsort(-scores, kind="stable")
+        if top_k <= 0:
+            return np.array([], dtype=int)
+
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        return top[np.argsort(-scores[top], kind="stable")]
@@ -0,0 +1,204 @@
+"""
+Streaming stages for screening a large directory of resumes.
+
+Each stage is a generator feeding the next, so only a bounded number of
+files is in flight at any time: discovery walks the tree lazily, parsing
+keeps at most max_pending files queued in a process pool, and analysis works
+on one batch at a time. Results come out in completion order.
+
+parse_uploads does the same for in-memory uploads on a caller's executor,
+e.g. a parse_executor shared by every session of the Streamlit app. prescreen narrows a
+large pool to a shortlist with the spaCy-free LiteScreener first.
+"""
+
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+
+def discover_files(root, extensions=RESUME_EXTENSIONS):
+    """Yield resume file paths under root (or root itself), in sorted order."""
+    if os.path.isfile(root):
+        yield root
+        return
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(names):
+            if name.lower().endswith(extensions) and not name.startswith("~$"):
+                yield os.path.join(directory, name)
+
+
+def parse_file(path):
+    """Extract the text of a PDF, DOCX or plain-text file (None on failure)."""
+    from .document_parser import DocumentParser
+
+    if path.lower().endswith(".txt"):
+        try:
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except OSError as e:
+            print(f"Error reading document: {e}")
+            return None
+    return DocumentParser.parse_document(path)
+
+
+def parse_files(paths, workers=1, max_pending=None):
+    """Yield (path, text) for each path as its parse finishes.
+
+    With more than one worker, files are parsed in a process pool with at
+    most max_pending (default 4 per worker) submitted at once.
+    """
+    if workers <= 1:
+        for path in paths:
+            yield path, parse_file(path)
+        return
+
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker) as pool:
+        yield from _map_bounded(pool, parse_file, ((path, path) for path in paths), max_pending)
+
+
+def parse_executor(max_workers=None):
+    """A process pool for parse_uploads that is safe to create from a threaded server.
+
+    Parsing is CPU-bound, so threads would serialize on the GIL, and the
+    per-page PDF timeout only works in a main thread. Workers are started
+    with forkserver (spawn where unavailable) rather than forked from a
+    process that may be running other threads.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                               initializer=_init_parse_worker)
+
+
+def parse_uploads(executor, uploads, max_pending=4):
+    """Yield (name, text) for uploaded file objects as their parse finishes.
+
+    Uploads (with a name attribute, like Streamlit's UploadedFile) are read
+    into bytes and parsed with DocumentParser.parse_bytes on executor, so a
+    process pool works as well as a thread pool. At most max_pending are
+    submitted at once, so a large upload cannot crowd out other users of a
+    shared executor.
+    """
+    yield from _map_bounded(executor, _parse_upload,
+                            ((upload.name, (_read_upload(upload), upload.name))
+                             for upload in uploads), max_pending)
+
+
+def prescreen(parsed, job_text, keep, batch_size=1024, screener=None):
+    """The keep best (path, text) pairs by lite keyword match, best first.
+
+    Parsed pairs are scored batch by batch, so memory holds one batch plus
+    the shortlist. Equal scores are ordered by path, so the shortlist does
+    not depend on the order parses finish in. Files without text follow the
+    shortlist unchanged, so score_resumes still reports them as errors.
+    """
+    if screener is None:
+        from .lite import LiteScreener
+
+        screener = LiteScreener()
+
+    failed = []
+
+    def screen(batch):
+        scores = screener.match_scores(job_text, [text for _, text in batch])
+        for (path, text), score in zip(batch, scores):
+            yield int(score), path, text
+
+    def scored():
+        batch = []
+        for path, text in parsed:
+            if not text or not text.strip():
+                failed.append((path, text))
+                continue
+            batch.append((path, text))
+            if len(batch) >= batch_size:
+                yield from screen(batch)
+                batch = []
+        if batch:
+            yield from screen(batch)
+
+    # nsmallest keeps only keep entries while consuming the stream
+    best = heapq.nsmallest(keep, scored(), key=lambda entry: (-entry[0], entry[1]))
+    return [(path, text) for _, path, text in best] + failed
+
+
+def score_resumes(nlp_analyzer, recommender, job_text, parsed, batch_size=64, n_process=1):
+    """Analyze parsed (path, text) pairs in batches and yield one result dict each.
+
+    Results hold file, score, missing_keywords, missing_skills and
+    recommendations, or an error for files without extractable text.
+    """
+    job = nlp_analyzer.analyze(job_text)
+
+    batch = []
+    for path, text in parsed:
+        if not text or not text.strip():
+            yield {"file": path, "error": "No text could be extracted"}
+            continue
+        batch.append((path, text))
+        if len(batch) >= batch_size:
+            yield from _score_batch(nlp_analyzer, recommender, job, batch, n_process)
+            batch = []
+    if batch:
+        yield from _score_batch(nlp_analyzer, recommender, job, batch, n_process)
+
+
+def _score_batch(nlp_analyzer, recommender, job, batch, n_process):
+    documents = nlp_analyzer.analyze_many([text for _, text in batch],
+                                          batch_size=len(batch), n_process=n_process)
+    for (path, _), resume in zip(batch, documents):
+        yield {
+            "file": path,
+            "score": nlp_analyzer.calculate_match_score(resume, job),
+            "missing_keywords": nlp_analyzer.find_missing_keywords(resume, job),
+            "missing_skills": nlp_analyzer.find_missing_skills(resume, job),
+            "recommendations": recommender.generate_recommendations(resume, job),
+        }
+
+
+def _map_bounded(executor, function, items, max_pending):
+    """Run function over (name, argument) items, max_pending at a time; yield (name, result)."""
+    pending = {}
+    for name, argument in items:
+        if len(pending) >= max_pending:
+            yield from _collect(pending, wait(pending, return_when=FIRST_COMPLETED).done)
+        pending[executor.submit(function, argument)] = name
+    while pending:
+        yield from _collect(pending, wait(pending, return_when=FIRST_COMPLETED).done)
+
+
+def _read_upload(upload):
+    if hasattr(upload, "getvalue"):
+        return upload.getvalue()
+    upload.seek(0)
+    return upload.read()
+
+
+def _parse_upload(upload):
+    from .document_parser import DocumentParser
+
+    data, name = upload
+    return DocumentParser.parse_bytes(data, name)
+
+
+def _collect(pending, done):
+    """Yield (path, text) for finished futures and forget them."""
+    for future in done:
+        path = pending.pop(future)
+        try:
+            yield path, future.result()
+        except Exception as e:
+            print(f"Error parsing {path}: {e}")
+            yield path, None
+
+
+def _init_parse_worker():
+    """Parse each PDF in a single process; the files themselves are the unit of parallelism."""
+    from .document_parser import DocumentParser
+
+    DocumentParser.PDF_WORKERS = 1
@@ -1,3 +1,6 @@
+from . import metrics
+
+
 class ResumeRecommender:
     """Generate recommendations to improve resume based on job description."""
     
@@ -5,19 +8,32 @@ class ResumeRecommender:
         self.nlp_analyzer = nlp_analyzer
     
     def generate_recommendations(self, resume_text, job_text):
-        """Generate specific recommendations to improve resume alignment with job."""
+        """Generate specific recommendations to improve resume alignment with job.
+
+        Accepts raw text or AnalyzedDocument instances from NLPAnalyzer.analyze(),
+        so each document goes through the NLP pipeline at most once.
+        """
         if not resume_text or not job_text:
             return []
-            
-        recommendations = []
+
+        resume = self.nlp_analyzer.analyze(resume_text)
+        job = self.nlp_analyzer.analyze(job_text)
+        if not resume.text or not job.text:
+            return []
         
         # Find missing keywords
-        missing_keywords = self.nlp_analyzer.find_missing_keywords(resume_text, job_text)
+        missing_keywords = self.nlp_analyzer.find_missing_keywords(resume, job)
         
-        # Extract skills from job description
-        job_skills = self.nlp_analyzer.extract_skills(job_text)
-        resume_skills = self.nlp_analyzer.extract_skills(resume_text)
-        missing_skills = [skill for skill in job_skills if skill not in resume_skills]
+        # Skills of the job description the resume lacks
+        missing_skills = self.nlp_analyzer.find_missing_skills(resume, job)
+
+        # Analysis is timed in NLPAnalyzer; this covers building the advice
+        with metrics.timer("recommendations"):
+            return self._build_recommendations(resume, missing_keywords, missing_skills)
+
+    def _build_recommendations(self, resume, missing_keywords, missing_skills):
+        """Advice for an analyzed resume given what it lacks."""
+        recommendations = []
         
         # Generate recommendations based on missing keywords and skills
         if missing_keywords:
@@ -35,7 +51,7 @@ class ResumeRecommender:
             })
         
         # Check resume length and add recommendation if too short
-        if len(resume_text.split()) < 200:
+        if len(resume.text.split()) < 200:
             recommendations.append({
                 "type": "length",
                 "title": "Expand your resume content",
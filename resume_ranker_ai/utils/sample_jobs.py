@@ -0,0 +1,51 @@
+"""Sample job descriptions offered in the app and precompiled by job_library."""
+
+SAMPLE_JOBS = {
+    "Software Engineer": """We are seeking a skilled Software Engineer to join our development team. The ideal candidate will have experience with Python, JavaScript, React, Node.js, and SQL databases. You should be familiar with agile development methodologies, version control systems like Git, and cloud platforms such as AWS or Azure. Experience with Docker, Kubernetes, and CI/CD pipelines is a plus. Strong problem-solving skills and ability to work in a collaborative environment are essential.""",
+
+    "Data Scientist": """Looking for a Data Scientist with expertise in machine learning, statistical analysis, and data visualization. Required skills include Python, R, SQL, pandas, scikit-learn, TensorFlow, and Tableau. Experience with big data technologies like Spark, Hadoop, and cloud platforms (AWS, GCP, Azure) is preferred. Strong background in statistics, mathematics, and experience with A/B testing and predictive modeling.""",
+
+    "Product Manager": """Seeking an experienced Product Manager to drive product strategy and roadmap. Ideal candidate has experience with product lifecycle management, user research, market analysis, and cross-functional team leadership. Familiarity with agile methodologies, JIRA, analytics tools, and customer feedback systems. Strong communication skills and ability to translate business requirements into technical specifications.""",
+
+    "Digital Marketing Manager": """We need a Digital Marketing Manager with expertise in SEO, SEM, social media marketing, content marketing, and email campaigns. Experience with Google Analytics, Google Ads, Facebook Ads, HubSpot, and marketing automation tools. Strong analytical skills and experience with A/B testing, conversion optimization, and ROI analysis.""",
+
+    "UX/UI Designer": """Looking for a creative UX/UI Designer with experience in user-centered design, wireframing, prototyping, and visual design. Proficiency in Figma, Sketch, Adobe Creative Suite, and design systems. Experience with user research, usability testing, and responsive design. Strong portfolio demonstrating mobile and web design projects.""",
+
+    "DevOps Engineer": """Seeking a DevOps Engineer with experience in infrastructure automation, containerization, and cloud technologies. Required skills include Docker, Kubernetes, Jenkins, Terraform, AWS/Azure/GCP, Linux, and scripting languages (Python, Bash). Experience with monitoring tools, CI/CD pipelines, and infrastructure as code.""",
+
+    "Business Analyst": """We are hiring a Business Analyst to bridge the gap between business needs and technical solutions. Experience with requirements gathering, process mapping, data analysis, and stakeholder management. Proficiency in SQL, Excel, Tableau, and project management tools. Strong analytical and communication skills required.""",
+
+    "Cybersecurity Analyst": """Looking for a Cybersecurity Analyst to protect our organization's digital assets. Experience with security frameworks, threat analysis, incident response, and vulnerability assessment. Knowledge of firewalls, SIEM tools, penetration testing, and compliance standards (ISO 27001, NIST). Security certifications preferred.""",
+
+    "Sales Representative": """Seeking a motivated Sales Representative to drive revenue growth. Experience with CRM systems, lead generation, cold calling, and relationship building. Strong negotiation skills and track record of meeting sales targets. Knowledge of sales methodologies and customer acquisition strategies.""",
+
+    "Human Resources Manager": """We need an HR Manager to oversee recruitment, employee relations, and HR policies. Experience with HRIS systems, talent acquisition, performance management, and employment law. Strong interpersonal skills and experience with diversity and inclusion initiatives.""",
+
+    "Financial Analyst": """Looking for a Financial Analyst with expertise in financial modeling, budgeting, and forecasting. Proficiency in Excel, SQL, and financial software. Experience with variance analysis, financial reporting, and investment analysis. CFA or similar certification preferred.""",
+
+    "Project Manager": """Seeking an experienced Project Manager with PMP certification. Experience with project planning, resource management, risk assessment, and stakeholder communication. Proficiency in project management tools like Microsoft Project, JIRA, and Asana. Strong leadership and organizational skills.""",
+
+    "Content Writer": """We are hiring a Content Writer to create engaging content across multiple channels. Experience with SEO writing, blog posts, social media content, and email marketing. Strong research skills and ability to adapt writing style for different audiences. Knowledge of content management systems and analytics tools.""",
+
+    "Mobile App Developer": """Looking for a Mobile App Developer with experience in iOS and Android development. Proficiency in Swift, Kotlin, React Native, or Flutter. Experience with mobile UI/UX principles, API integration, and app store deployment. Knowledge of mobile testing frameworks and performance optimization.""",
+
+    "Cloud Architect": """Seeking a Cloud Architect to design and implement cloud infrastructure solutions. Expertise in AWS, Azure, or GCP services. Experience with microservices architecture, serverless computing, and cloud security. Strong background in system design and scalability planning.""",
+
+    "Quality Assurance Engineer": """We need a QA Engineer with experience in manual and automated testing. Proficiency in testing frameworks, bug tracking tools, and test case design. Experience with Selenium, API testing, and performance testing. Strong attention to detail and analytical skills.""",
+
+    "Graphic Designer": """Looking for a creative Graphic Designer with expertise in brand design, print design, and digital graphics. Proficiency in Adobe Creative Suite, typography, and color theory. Strong portfolio showcasing diverse design projects and brand identity work.""",
+
+    "Operations Manager": """Seeking an Operations Manager to optimize business processes and improve efficiency. Experience with process improvement, supply chain management, and team leadership. Strong analytical skills and experience with operational metrics and KPIs.""",
+
+    "Customer Success Manager": """We are hiring a Customer Success Manager to ensure customer satisfaction and retention. Experience with customer onboarding, account management, and relationship building. Strong communication skills and experience with CRM systems and customer analytics.""",
+
+    "Machine Learning Engineer": """Looking for an ML Engineer with experience in deploying machine learning models to production. Proficiency in Python, TensorFlow, PyTorch, and MLOps tools. Experience with model optimization, A/B testing, and cloud ML platforms. Strong software engineering background.""",
+
+    "Network Administrator": """Seeking a Network Administrator to manage and maintain network infrastructure. Experience with routers, switches, firewalls, and network protocols. Knowledge of network security, troubleshooting, and performance monitoring. Relevant certifications preferred.""",
+
+    "Social Media Manager": """We need a Social Media Manager to develop and execute social media strategies. Experience with content creation, community management, and social media analytics. Proficiency in social media platforms and scheduling tools. Strong creative and analytical skills.""",
+
+    "Database Administrator": """Looking for a DBA with experience in database design, optimization, and maintenance. Proficiency in SQL, database management systems (MySQL, PostgreSQL, Oracle), and backup/recovery procedures. Experience with performance tuning and security management.""",
+
+    "Technical Writer": """Seeking a Technical Writer to create clear and comprehensive documentation. Experience with API documentation, user manuals, and technical guides. Strong writing skills and ability to translate complex technical concepts into user-friendly content."""
+}
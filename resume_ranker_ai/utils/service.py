@@ -0,0 +1,276 @@
+"""
+HTTP scoring service with request micro-batching.
+
+    python -m resume_ranker_ai serve --port 8000
+
+Endpoints:
+
+- POST /match with {"resume": "...", "job": "..."} returns match_score,
+  missing_keywords, missing_skills and recommendations.
+- GET /health reports readiness and whether the spaCy model or the
+  fallback path is active.
+- GET /metrics exports per-stage timings, document sizes and cache and
+  fallback counters in the Prometheus text format (see utils/metrics.py).
+
+Requests that arrive within max_wait of each other (up to max_batch_size)
+are analyzed together in one nlp.pipe batch and scored with one vectorized
+call, on a worker thread so the event loop keeps accepting requests.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from . import metrics
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 431: "Request Header Fields Too Large",
+            500: "Internal Server Error", 501: "Not Implemented"}
+
+
+class MicroBatcher:
+    """Coalesce concurrent match requests into batches."""
+
+    def __init__(self, nlp_analyzer, recommender, max_batch_size=32, max_wait=0.005):
+        self.nlp_analyzer = nlp_analyzer
+        self.recommender = recommender
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.requests = 0
+        self._queue = None
+        self._task = None
+        # One thread: the analyzer is never used by two batches at once
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self):
+        """Start collecting batches on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=True)
+
+    async def match(self, resume_text, job_text):
+        """Result dict for one resume/job pair, computed in a shared batch."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((resume_text, job_text, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            pairs = [(resume_text, job_text) for resume_text, job_text, _ in batch]
+            try:
+                results = await loop.run_in_executor(self._executor, self.match_batch, pairs)
+            except Exception as e:
+                results = [e] * len(batch)
+            self.batches += 1
+            self.requests += len(batch)
+
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def match_batch(self, pairs):
+        """Analyze all distinct texts in one nlp.pipe call, then score every pair.
+
+        Precomputed texts (e.g. the sample jobs) are looked up rather than
+        analyzed again.
+        """
+        texts = list(dict.fromkeys(text for pair in pairs for text in pair))
+        precomputed = self.nlp_analyzer.precomputed
+        documents = {text: self.nlp_analyzer.analyze(text) for text in texts if text in precomputed}
+        texts = [text for text in texts if text not in documents]
+        if texts:
+            documents.update(zip(texts, self.nlp_analyzer.analyze_many(texts, batch_size=len(texts))))
+
+        pairs = [(documents[resume_text], documents[job_text]) for resume_text, job_text in pairs]
+        scores = self.nlp_analyzer.calculate_match_scores(pairs)
+        return [
+            {
+                "match_score": score,
+                "missing_keywords": self.nlp_analyzer.find_missing_keywords(resume, job),
+                "missing_skills": self.nlp_analyzer.find_missing_skills(resume, job),
+                "recommendations": self.recommender.generate_recommendations(resume, job),
+            }
+            for (resume, job), score in zip(pairs, scores)
+        ]
+
+
+class ScoringService:
+    """Minimal HTTP/1.1 server (keep-alive, JSON bodies) over asyncio streams."""
+
+    def __init__(self, nlp_analyzer, recommender, max_batch_size=32, max_wait=0.005):
+        self.nlp_analyzer = nlp_analyzer
+        self.batcher = MicroBatcher(nlp_analyzer, recommender, max_batch_size, max_wait)
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """Start listening; returns the asyncio server."""
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    def health(self):
+        return {
+            "status": "ok",
+            "ready": True,
+            "mode": "spacy" if self.nlp_analyzer.nlp else "fallback",
+            "model": self.nlp_analyzer.model_id(),
+            "batches": self.batcher.batches,
+            "requests": self.batcher.requests,
+        }
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except _BadRequest as e:
+            self._write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "Use GET"}
+            return 200, self.health()
+        if path == "/metrics":
+            if method != "GET":
+                return 405, {"error": "Use GET"}
+            return 200, metrics.to_prometheus()
+        if path == "/match":
+            if method != "POST":
+                return 405, {"error": "Use POST"}
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "Body must be JSON"}
+            if not isinstance(data, dict) or not isinstance(data.get("resume"), str) \
+                    or not isinstance(data.get("job"), str):
+                return 400, {"error": 'Expected {"resume": "...", "job": "..."}'}
+            try:
+                return 200, await self.batcher.match(data["resume"], data["job"])
+            except Exception as e:
+                print(f"Error scoring request: {e}")
+                return 500, {"error": "Scoring failed"}
+        return 404, {"error": "Not found"}
+
+    @staticmethod
+    async def _read_request(reader):
+        """(method, path, headers, body), or None when the client closed the connection."""
+        request_line = await _readline(reader)
+        if not request_line:
+            return None
+        try:
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise _BadRequest(400, "Malformed request line")
+
+        headers = {}
+        while True:
+            line = await _readline(reader)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        # Bodies are only read by Content-Length
+        if "transfer-encoding" in headers:
+            raise _BadRequest(501, "Transfer-Encoding is not supported")
+
+        # Digits only: int() would also take signs, spaces and underscores
+        length = headers.get("content-length", "0")
+        if not (length.isascii() and length.isdigit()):
+            raise _BadRequest(400, "Invalid Content-Length")
+        length = int(length)
+        if length > MAX_BODY_BYTES:
+            raise _BadRequest(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, path, headers, body
+
+    @staticmethod
+    def _write_response(writer, status, payload, keep_alive=True):
+        """Send payload as JSON, or as plain text when it is a string."""
+        if isinstance(payload, str):
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload).encode("utf-8")
+            content_type = "application/json"
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+
+
+class _BadRequest(Exception):
+    """A request that cannot be parsed; answered with status and the connection closed."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def _readline(reader):
+    """One line from reader; lines over the stream limit (64 KiB) are a 431."""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise _BadRequest(431, "Request line or header too long")
+
+
+async def serve(nlp_analyzer, recommender, host="127.0.0.1", port=8000,
+                max_batch_size=32, max_wait=0.005):
+    """Run the scoring service until cancelled."""
+    service = ScoringService(nlp_analyzer, recommender, max_batch_size, max_wait)
+    server = await service.start(host, port)
+    print(f"Serving on http://{host}:{port} ({service.health()['mode']} mode)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
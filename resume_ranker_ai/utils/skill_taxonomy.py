@@ -0,0 +1,111 @@
+"""
+Skill taxonomy and a token-trie matcher compiled from it.
+
+A taxonomy file maps canonical skill IDs to their aliases:
+
+    {"format": 1, "skills": {"kubernetes": ["k8s", "kube"], "node.js": ["nodejs", "node js"]}}
+
+Every ID and alias is tokenized and inserted into a trie of token sequences,
+so matching walks the text once and only ever follows as many trie edges as
+the longest alias has tokens. Matching time depends on the text, not on how
+many skills the taxonomy holds.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+TAXONOMY_FORMAT = 1
+
+DEFAULT_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data", "skill_taxonomy.json",
+)
+
+# Words with the punctuation technologies use (c++, c#, node.js, .net);
+# trailing dots are left out so "python." matches "python"
+_TOKEN_PATTERN = re.compile(r"\.?[^\W_](?:[\w+#.]*[\w+#])?")
+
+# Trie key marking the end of an alias; never a token
+_END = ""
+
+_loaded = {}
+
+
+class SkillTaxonomy:
+    """Canonical skills with aliases, compiled into a token trie."""
+
+    def __init__(self, skills, digest=None):
+        """
+        Args:
+            skills: dict of canonical skill ID to a list of aliases.
+            digest: identifier of the taxonomy contents, used in cache keys.
+        """
+        self.skills = skills
+        self.digest = digest or hashlib.sha256(
+            json.dumps(skills, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+        self._trie = {}
+        self._aliases = {}
+
+        for skill_id, aliases in skills.items():
+            for alias in [skill_id, *aliases]:
+                tokens = tuple(self.tokenize(alias))
+                if not tokens:
+                    continue
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                # First definition wins when two skills share an alias
+                node.setdefault(_END, skill_id)
+                self._aliases.setdefault(tokens, skill_id)
+
+    @classmethod
+    def load(cls, path=DEFAULT_TAXONOMY_PATH):
+        """Load and compile a taxonomy file, once per path and process."""
+        path = os.path.abspath(path)
+        if path not in _loaded:
+            with open(path, "rb") as f:
+                content = f.read()
+            data = json.loads(content.decode("utf-8"))
+            if data.get("format") != TAXONOMY_FORMAT:
+                raise ValueError(f"Unsupported skill taxonomy format: {data.get('format')}")
+            _loaded[path] = cls(data["skills"], hashlib.sha256(content).hexdigest()[:12])
+        return _loaded[path]
+
+    @staticmethod
+    def tokenize(text):
+        """Lowercase tokens as the matcher sees them."""
+        return _TOKEN_PATTERN.findall(text.lower())
+
+    def find(self, text):
+        """Canonical IDs of the skills mentioned in text, in order of first mention.
+
+        Matches are leftmost-longest and do not overlap, so "react native"
+        yields only "react native", not also "react".
+        """
+        tokens = self.tokenize(text)
+        found = {}
+        position = 0
+        while position < len(tokens):
+            node = self._trie
+            match = None
+            end = position
+            for index in range(position, len(tokens)):
+                node = node.get(tokens[index])
+                if node is None:
+                    break
+                if _END in node:
+                    match, end = node[_END], index + 1
+
+            if match is None:
+                position += 1
+            else:
+                found.setdefault(match)
+                position = end
+        return list(found)
+
+    def canonical(self, phrase):
+        """Canonical ID if phrase is exactly a skill or alias, else None."""
+        return self._aliases.get(tuple(self.tokenize(phrase)))
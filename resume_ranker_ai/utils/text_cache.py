@@ -0,0 +1,116 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+class TextCache:
+    """Content-addressed cache of extracted document text.
+
+    Entries are keyed on a hash of the file bytes, so the same upload maps to
+    the same entry no matter where it was saved. Text is held in an in-memory
+    LRU tier bounded by total size, backed by an optional SQLite file that
+    every worker process can share.
+    """
+
+    def __init__(self, max_chars=32 * 1024 * 1024, db_path=None):
+        self.max_chars = max_chars
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if db_path:
+            self._connect().execute(
+                "CREATE TABLE IF NOT EXISTS extracted_text "
+                "(key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(data, *parts):
+        """Hash file bytes together with anything else the text depends on."""
+        digest = hashlib.sha256(data)
+        for part in parts:
+            digest.update(b"\0" + str(part).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return cached text for key, or None."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+
+        text = self._db_get(key)
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, text)
+        return text
+
+    def set(self, key, text):
+        """Store text in memory and, when configured, on disk."""
+        self._remember(key, text)
+        self._db_set(key, text)
+
+    def clear(self):
+        """Drop the in-memory tier (the on-disk tier is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, key, text):
+        """Insert into the LRU tier, evicting least recently used entries."""
+        size = len(text)
+        if size > self.max_chars:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = text
+            self._size += size
+
+            while self._size > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _connect(self):
+        """One SQLite connection per thread and process."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _db_get(self, key):
+        if not self.db_path:
+            return None
+        try:
+            row = self._connect().execute(
+                "SELECT text FROM extracted_text WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading text cache: {e}")
+            return None
+        return row[0] if row else None
+
+    def _db_set(self, key, text):
+        if not self.db_path:
+            return
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO extracted_text (key, text) VALUES (?, ?)", (key, text)
+            )
+        except sqlite3.Error as e:
+            print(f"Error writing text cache: {e}")
@@ -0,0 +1,229 @@
+import gc
+import multiprocessing
+import os
+import threading
+from collections import deque
+
+# Analyzer used by tasks inside a worker process (set by the pool initializer)
+_worker_analyzer = None
+_worker_recommender = None
+
+
+class AnalysisPool:
+    """Run resume analyses in worker processes.
+
+    When the pool is created from a single-threaded process, workers are
+    forked from it and share the spaCy model loaded in the parent (the
+    NLPAnalyzer passed in) copy-on-write instead of each loading a copy.
+    Forking while other threads run copies whatever locks they hold at that
+    moment (the analyzer's caches, metrics), which can deadlock a worker, so
+    from a threaded server such as the Streamlit app the pool uses forkserver
+    (or spawn) and each worker builds its own analyzer with the parent's
+    settings and precomputed analyses. start_method overrides the choice.
+
+    At most max_pending tasks may be queued or running; submit() blocks
+    beyond that. A task that does not finish within task_timeout seconds (a
+    hung or killed worker, or a full queue) is run in this process instead.
+
+    With max_tasks_per_child, workers are replaced after that many tasks to
+    contain memory creep. With fork, replacements are forked from the pool's
+    handler thread, so leave it off in threaded processes.
+    """
+
+    def __init__(self, nlp_analyzer, processes=None, max_tasks_per_child=None, max_pending=None,
+                 start_method=None, task_timeout=60):
+        self.processes = processes or os.cpu_count() or 1
+        self.max_pending = max_pending or self.processes * 4
+        self.task_timeout = task_timeout
+        self.nlp_analyzer = nlp_analyzer
+        self._recommender = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+        if start_method is None:
+            start_method = _default_start_method()
+        self.start_method = start_method
+        forked = start_method == "fork"
+        context = multiprocessing.get_context(start_method)
+        if forked:
+            # Objects allocated so far are never collected, so the collector
+            # does not touch (and copy) the shared model pages in workers
+            gc.freeze()
+            initargs = (nlp_analyzer, None, None)
+        else:
+            initargs = (None, _analyzer_settings(nlp_analyzer), nlp_analyzer.precomputed)
+
+        try:
+            self._pool = context.Pool(
+                self.processes,
+                initializer=_init_worker,
+                initargs=initargs,
+                maxtasksperchild=max_tasks_per_child,
+            )
+        finally:
+            if forked:
+                # The workers keep their frozen copy; the parent collects as usual
+                gc.unfreeze()
+
+    def submit(self, task, *args, timeout=None):
+        """Queue task(*args) in a worker; returns a multiprocessing AsyncResult.
+
+        task is one of "analyze_match", "calculate_match_score" or
+        "generate_recommendations". Blocks while max_pending tasks are in
+        flight; raises TimeoutError if no slot frees up within timeout.
+        """
+        if task not in _TASKS:
+            raise KeyError(task)
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Analysis queue is full")
+
+        def release(_):
+            self._slots.release()
+
+        try:
+            return self._pool.apply_async(_run_task, (task,) + args,
+                                          callback=release, error_callback=release)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def run(self, task, *args, timeout=None):
+        """Result of task(*args) from a worker, or computed here if none answers in time.
+
+        timeout defaults to task_timeout and covers both waiting for a queue
+        slot and for the result.
+        """
+        timeout = self.task_timeout if timeout is None else timeout
+        try:
+            return self.submit(task, *args, timeout=timeout).get(timeout)
+        except (TimeoutError, multiprocessing.TimeoutError):
+            print(f"No analysis worker answered within {timeout}s; running {task} in process")
+            return self._run_in_process(task, *args)
+
+    def analyze_match(self, resume_text, job_text, timeout=None):
+        """Match score, recommendations and missing keywords in one task."""
+        return self.run("analyze_match", resume_text, job_text, timeout=timeout)
+
+    def calculate_match_score(self, resume_text, job_text, timeout=None):
+        """NLPAnalyzer.calculate_match_score in a worker."""
+        return self.run("calculate_match_score", resume_text, job_text, timeout=timeout)
+
+    def generate_recommendations(self, resume_text, job_text, timeout=None):
+        """ResumeRecommender.generate_recommendations in a worker."""
+        return self.run("generate_recommendations", resume_text, job_text, timeout=timeout)
+
+    def analyze_matches(self, pairs, timeout=None):
+        """Yield analyze_match results for (resume_text, job_text) pairs, in order.
+
+        Keeps at most max_pending pairs in flight, so arbitrarily long
+        iterables are processed with bounded memory. Pairs whose worker does
+        not answer within timeout (default task_timeout) are analyzed here.
+        """
+        timeout = self.task_timeout if timeout is None else timeout
+        in_flight = deque()
+        for pair in pairs:
+            if len(in_flight) >= self.max_pending:
+                yield self._result(*in_flight.popleft(), timeout)
+            try:
+                in_flight.append((pair, self.submit("analyze_match", *pair, timeout=timeout)))
+            except TimeoutError:
+                in_flight.append((pair, None))
+        while in_flight:
+            yield self._result(*in_flight.popleft(), timeout)
+
+    def _result(self, pair, async_result, timeout):
+        """analyze_match result for pair from async_result, or computed here."""
+        if async_result is not None:
+            try:
+                return async_result.get(timeout)
+            except multiprocessing.TimeoutError:
+                pass
+        print(f"No analysis worker answered within {timeout}s; running analyze_match in process")
+        return self._run_in_process("analyze_match", *pair)
+
+    def _run_in_process(self, task, *args):
+        if self._recommender is None:
+            from .recommender import ResumeRecommender
+
+            self._recommender = ResumeRecommender(self.nlp_analyzer)
+        return _TASKS[task](self.nlp_analyzer, self._recommender, *args)
+
+    def close(self):
+        """Finish queued tasks and stop the workers."""
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        """Stop the workers immediately, dropping queued tasks."""
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _analyzer_settings(nlp_analyzer):
+    """NLPAnalyzer arguments that rebuild nlp_analyzer in a worker that was not forked."""
+    return {
+        "model": nlp_analyzer.model,
+        "allow_download": nlp_analyzer.allow_download,
+        "idf_model": nlp_analyzer.idf_model,
+        "skill_taxonomy": nlp_analyzer.skill_taxonomy,
+        "semantic_weight": nlp_analyzer.semantic_weight,
+        "vector_dtype": nlp_analyzer.vector_dtype,
+        "lite": nlp_analyzer.lite,
+    }
+
+
+def _init_worker(nlp_analyzer, settings, precomputed):
+    """Worker initializer: reuse the forked analyzer or build one from settings."""
+    global _worker_analyzer, _worker_recommender
+    from .recommender import ResumeRecommender
+
+    if nlp_analyzer is None:
+        from .nlp_analyzer import NLPAnalyzer
+
+        nlp_analyzer = NLPAnalyzer(**settings)
+        nlp_analyzer.precomputed.update(precomputed)
+    _worker_analyzer = nlp_analyzer
+    _worker_recommender = ResumeRecommender(nlp_analyzer)
+
+
+def _default_start_method():
+    """fork while this is the only thread, else forkserver or spawn."""
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return "fork"
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def _run_task(task, *args):
+    """Worker entry point: run a task with the worker's analyzer."""
+    return _TASKS[task](_worker_analyzer, _worker_recommender, *args)
+
+
+def _analyze_match(analyzer, recommender, resume_text, job_text):
+    resume = analyzer.analyze(resume_text)
+    job = analyzer.analyze(job_text)
+    return {
+        "match_score": analyzer.calculate_match_score(resume, job),
+        "recommendations": recommender.generate_recommendations(resume, job),
+        "missing_keywords": analyzer.find_missing_keywords(resume, job),
+    }
+
+
+def _calculate_match_score(analyzer, recommender, resume_text, job_text):
+    return analyzer.calculate_match_score(resume_text, job_text)
+
+
+def _generate_recommendations(analyzer, recommender, resume_text, job_text):
+    return recommender.generate_recommendations(resume_text, job_text)
+
+
+_TASKS = {
+    "analyze_match": _analyze_match,
+    "calculate_match_score": _calculate_match_score,
+    "generate_recommendations": _generate_recommendations,
+}